@@ -0,0 +1,93 @@
+"""Throughput of ConcurrentAVLTree against an AVLTree behind one mutex.
+
+Every thread runs the same mix of lookups, short range scans and
+writes. Run from the repository root:
+
+    python -m benchmarks.bench_concurrent [n] [ops_per_thread] [write_percent]
+"""
+import random
+import sys
+import threading
+from timeit import default_timer as timer
+
+from pyavl3 import AVLTree, ConcurrentAVLTree
+from pyavl3.search import KEYS
+
+
+class MutexAVLTree:
+    """An AVLTree where every operation takes the same lock"""
+
+    def __init__(self, tree):
+        self.tree = tree
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            return self.tree.get(key)
+
+    def __setitem__(self, key, value):
+        with self.lock:
+            self.tree[key] = value
+
+    def scan(self, lower, upper):
+        with self.lock:
+            return list(self.tree.irange(lower, upper, mode=KEYS))
+
+
+class SharedAVLTree:
+    """The same operations on a ConcurrentAVLTree"""
+
+    def __init__(self, tree):
+        self.tree = tree
+
+    def get(self, key):
+        return self.tree.get(key)
+
+    def __setitem__(self, key, value):
+        self.tree[key] = value
+
+    def scan(self, lower, upper):
+        # Hold the read lock for the whole scan so writers cannot
+        # invalidate it half way.
+        with self.tree.lock.reading():
+            return list(self.tree.irange(lower, upper, mode=KEYS))
+
+
+def worker(tree, n, ops, write_percent, seed):
+    rng = random.Random(seed)
+    for _ in range(ops):
+        roll = rng.randrange(100)
+        key = rng.randrange(n)
+        if roll < write_percent:
+            tree[key] = roll
+        elif roll < write_percent + 5:
+            tree.scan(key, key + 50)
+        else:
+            tree.get(key)
+
+
+def run(tree, threads, n, ops, write_percent):
+    pool = [
+        threading.Thread(target=worker, args=(tree, n, ops, write_percent, seed))
+        for seed in range(threads)
+    ]
+    start = timer()
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+    return threads * ops / (timer() - start)
+
+
+def main(n=100000, ops=20000, write_percent=10):
+    items = [(i, i) for i in range(n)]
+    print(f"n={n} ops/thread={ops} writes={write_percent}%")
+    print(f"{'threads':>7} {'mutex ops/s':>12} {'rwlock ops/s':>13}")
+    for threads in (1, 2, 4, 8):
+        mutex = run(MutexAVLTree(AVLTree(items)), threads, n, ops, write_percent)
+        shared = run(SharedAVLTree(ConcurrentAVLTree(items)), threads, n, ops, write_percent)
+        print(f"{threads:>7} {mutex:>12.0f} {shared:>13.0f}")
+
+
+if __name__ == "__main__":
+    main(*(int(x) for x in sys.argv[1:]))
@@ -0,0 +1,119 @@
+"""Compare the iterative AVLTree hot paths against the old recursive ones.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_iterative [n]
+"""
+import random
+import sys
+from timeit import default_timer as timer
+
+from pyavl3 import AVLTree
+from pyavl3.avl_node import AVLNode
+
+
+class RecursiveAVLTree(AVLTree):
+    """The recursive implementation AVLTree used to ship with."""
+
+    def __setitem__(self, key, value):
+        self._root = self._insert_node(self._root, AVLNode(key, value))
+
+    def _get(self, root, key):
+        if root is None:
+            return None
+        elif key < root.key:
+            return self._get(root.left, key)
+        elif key > root.key:
+            return self._get(root.right, key)
+        return root
+
+    def _insert_node(self, root, node):
+        if root is None:
+            self._n += 1
+            return node
+        elif node.key < root.key:
+            root.left = self._insert_node(root.left, node)
+        elif node.key > root.key:
+            root.right = self._insert_node(root.right, node)
+        else:
+            root.value = node.value
+        self._update(root)
+        return self._rebalance(root)
+
+    def _delete(self, root, key):
+        if root is None:
+            raise KeyError(key)
+        elif key < root.key:
+            root.left = self._delete(root.left, key)
+        elif key > root.key:
+            root.right = self._delete(root.right, key)
+        elif root.left and root.right:
+            new_root = self._pop_right_min(root)
+            new_root.left = root.left
+            new_root.right = root.right
+            return new_root
+        elif root.left:
+            self._n -= 1
+            return root.left
+        elif root.right:
+            self._n -= 1
+            return root.right
+        else:
+            self._n -= 1
+            return None
+        self._update(root)
+        return self._rebalance(root)
+
+
+def measure(label, fn, ops):
+    start = timer()
+    fn()
+    elapsed = timer() - start
+    return label, elapsed / ops * 1e9
+
+
+def run(cls, keys, probes):
+    tree = cls()
+
+    def insert():
+        for k in keys:
+            tree[k] = k
+
+    def overwrite():
+        for k in keys:
+            tree[k] = None
+
+    def lookup():
+        get = tree.get
+        for k in probes:
+            get(k)
+
+    def delete():
+        for k in keys:
+            del tree[k]
+
+    return [
+        measure("insert", insert, len(keys)),
+        measure("overwrite", overwrite, len(keys)),
+        measure("lookup", lookup, len(probes)),
+        measure("delete", delete, len(keys)),
+    ]
+
+
+def main(n=100000):
+    rng = random.Random(42)
+    keys = list(range(n))
+    rng.shuffle(keys)
+    probes = [rng.randrange(n * 2) for _ in range(n)]
+
+    old = run(RecursiveAVLTree, keys, probes)
+    new = run(AVLTree, keys, probes)
+
+    print(f"n={n}")
+    print(f"{'op':<10} {'recursive ns/op':>16} {'iterative ns/op':>16} {'speedup':>8}")
+    for (label, before), (_, after) in zip(old, new):
+        print(f"{label:<10} {before:>16.0f} {after:>16.0f} {before / after:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main(*(int(x) for x in sys.argv[1:]))
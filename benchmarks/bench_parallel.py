@@ -0,0 +1,44 @@
+"""Scaling of pyavl3.parallel build and union over 1..N worker processes.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_parallel [n] [max_workers]
+"""
+import os
+import random
+import sys
+from timeit import default_timer as timer
+
+from pyavl3 import AVLTree, parallel
+
+
+def timed(fn):
+    start = timer()
+    result = fn()
+    return result, timer() - start
+
+
+def main(n=1000000, max_workers=None):
+    max_workers = max_workers or os.cpu_count() or 1
+    rng = random.Random(0)
+    items = [(rng.randrange(4 * n), i) for i in range(n)]
+    other = AVLTree((rng.randrange(4 * n), i) for i in range(n // 2))
+
+    _, sequential = timed(lambda: AVLTree.from_sorted(sorted(dict(items).items())))
+    left = AVLTree(dict(items))
+    _, sequential_union = timed(lambda: left.union(other))
+
+    print(f"n={n} cpus={os.cpu_count()}")
+    print(f"{'workers':>7} {'build s':>8} {'speedup':>8} {'union s':>8} {'speedup':>8}")
+    print(f"{'seq':>7} {sequential:>8.3f} {1:>8.2f} {sequential_union:>8.3f} {1:>8.2f}")
+    for workers in range(1, max_workers + 1):
+        _, build_time = timed(lambda: parallel.build(items, workers=workers))
+        _, union_time = timed(lambda: parallel.union(left, other, workers=workers))
+        print(
+            f"{workers:>7} {build_time:>8.3f} {sequential / build_time:>8.2f} "
+            f"{union_time:>8.3f} {sequential_union / union_time:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(x) for x in sys.argv[1:]))
@@ -0,0 +1,47 @@
+"""Compare PoolAVLTree against AVLTree for memory and collector pauses.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_pool [n]
+"""
+import gc
+import random
+import sys
+from timeit import default_timer as timer
+
+from pyavl3 import AVLTree, PoolAVLTree
+
+
+def timed(fn):
+    start = timer()
+    result = fn()
+    return result, timer() - start
+
+
+def gc_pause(repeat=5):
+    """Slowest full collection out of a few runs"""
+    pause = 0.0
+    for _ in range(repeat):
+        _, elapsed = timed(gc.collect)
+        pause = max(pause, elapsed)
+    return pause
+
+
+def main(n=1000000):
+    keys = list(range(n))
+    random.Random(0).shuffle(keys)
+
+    print(f"n={n}")
+    print(f"{'tree':<12} {'build s':>8} {'get s':>8} {'gc pause ms':>12} {'bytes/entry':>12}")
+    for cls in (AVLTree, PoolAVLTree):
+        gc.collect()
+        tree, build_time = timed(lambda: cls((k, k) for k in keys))
+        _, get_time = timed(lambda: [tree[k] for k in keys[:100000]])
+        pause = gc_pause()
+        per_entry = tree.memory_usage()["per_entry"]
+        print(f"{cls.__name__:<12} {build_time:>8.3f} {get_time:>8.3f} {pause * 1000:>12.2f} {per_entry:>12.1f}")
+        del tree
+
+
+if __name__ == "__main__":
+    main(*(int(x) for x in sys.argv[1:]))
@@ -0,0 +1,63 @@
+"""Compare AVLTree.dump/load and pickle against pickling the node graph.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_serialize [n]
+"""
+import io
+import pickle
+import sys
+from timeit import default_timer as timer
+
+from pyavl3 import AVLTree
+
+
+class NodeGraphAVLTree(AVLTree):
+    """Pickles every node object, the way AVLTree used to be pickled."""
+
+    __reduce__ = object.__reduce__
+
+    def __reduce_ex__(self, protocol):
+        return object.__reduce_ex__(self, protocol)
+
+
+def timed(fn):
+    start = timer()
+    result = fn()
+    return result, timer() - start
+
+
+def main(n=200000):
+    items = [(i, f"value-{i}") for i in range(n)]
+    graph = NodeGraphAVLTree(items)
+    tree = AVLTree(items)
+
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(max(limit, 10000))
+
+    rows = []
+
+    data, dump_time = timed(lambda: pickle.dumps(graph, pickle.HIGHEST_PROTOCOL))
+    _, load_time = timed(lambda: pickle.loads(data))
+    rows.append(("pickle node graph", len(data), dump_time, load_time))
+
+    data, dump_time = timed(lambda: pickle.dumps(tree, pickle.HIGHEST_PROTOCOL))
+    _, load_time = timed(lambda: pickle.loads(data))
+    rows.append(("pickle (__reduce__)", len(data), dump_time, load_time))
+
+    fp = io.BytesIO()
+    _, dump_time = timed(lambda: tree.dump(fp))
+    fp.seek(0)
+    _, load_time = timed(lambda: AVLTree.load(fp))
+    rows.append(("dump/load", len(fp.getvalue()), dump_time, load_time))
+
+    sys.setrecursionlimit(limit)
+
+    print(f"n={n}")
+    print(f"{'method':<22} {'bytes':>12} {'dump s':>8} {'load s':>8}")
+    for label, size, dump_time, load_time in rows:
+        print(f"{label:<22} {size:>12} {dump_time:>8.3f} {load_time:>8.3f}")
+
+
+if __name__ == "__main__":
+    main(*(int(x) for x in sys.argv[1:]))
@@ -0,0 +1,75 @@
+"""Compare the in-order walks against the original InOrderTraversal.
+
+Also times iter_batches, which hands the items out in lists of 1000.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_traversal [n]
+"""
+import sys
+from collections import deque
+from timeit import default_timer as timer
+
+from pyavl3 import AVLTree
+from pyavl3.interface import ADTInterface
+
+
+class DequeInOrderTraversal:
+    """The (visits, node) deque traversal keys() used to run on."""
+
+    def __init__(self, tree, transform=None):
+        if isinstance(tree, ADTInterface):
+            self._deque = deque([(0, tree.root)])
+        else:
+            self._deque = deque([(0, tree)])
+        self._xfrm = transform or (lambda x: x)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        while self._deque:
+            visits, node = self._deque.pop()
+            if node is None:
+                continue
+            elif visits == 0:
+                self._deque.append((1, node))
+                self._deque.append((0, node.left))
+            elif visits == 1:
+                self._deque.append((0, node.right))
+                return self._xfrm(node)
+        raise StopIteration()
+
+
+def timed(fn):
+    start = timer()
+    for _ in fn():
+        pass
+    return timer() - start
+
+
+def main(n=1000000):
+    tree = AVLTree.from_sorted((k, k) for k in range(n))
+
+    runs = [
+        ("keys", lambda: DequeInOrderTraversal(tree, lambda x: x.key), tree.keys),
+        ("values", lambda: DequeInOrderTraversal(tree, lambda x: x.value), tree.values),
+        ("items", lambda: DequeInOrderTraversal(tree, lambda x: (x.key, x.value)), tree.items),
+        ("reversed", None, lambda: reversed(tree)),
+        ("batches", None, lambda: tree.iter_batches(1000)),
+        ("columns", None, lambda: tree.iter_batches(1000, columns=True)),
+    ]
+
+    print(f"n={n}")
+    print(f"{'walk':<10} {'traversal s':>12} {'iterator s':>11} {'speedup':>8}")
+    for name, old, new in runs:
+        new_time = timed(new)
+        if old is None:
+            print(f"{name:<10} {'-':>12} {new_time:>11.3f} {'-':>8}")
+            continue
+        old_time = timed(old)
+        print(f"{name:<10} {old_time:>12.3f} {new_time:>11.3f} {old_time / new_time:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main(*(int(x) for x in sys.argv[1:]))
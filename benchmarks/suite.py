@@ -0,0 +1,325 @@
+"""Benchmark AVLTree against dict and a bisect-maintained sorted list.
+
+Every scenario runs on every implementation at every size and reports
+operations per second and, for scenarios made of single operations,
+the median and tail latency of one operation. Peak memory is the
+tracemalloc peak while building the structure by random inserts, in a
+separate run so tracing does not slow the timed scenarios.
+
+Run from the repository root:
+
+    python -m benchmarks.suite --sizes 1000,10000,100000 --json out.json
+    python -m benchmarks.suite --sizes 1000000 --baseline out.json
+
+Sizes up to 10000000 work but take a long time for AVLTree, and the
+sorted list skips its O(n) inserts and deletes above --bisect-limit.
+--baseline prints the ops/sec ratio against an earlier --json run, so
+regressions show up as ratios well below 1.
+"""
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from bisect import bisect_left
+from timeit import default_timer as timer
+
+from pyavl3 import AVLTree
+from pyavl3.search import BetweenSearch, KEYS
+
+
+class AVLTreeMap:
+    name = "AVLTree"
+
+    def __init__(self, items=()):
+        self.tree = AVLTree(items)
+
+    def insert(self, key, value):
+        self.tree[key] = value
+
+    def get(self, key):
+        return self.tree.get(key)
+
+    def delete(self, key):
+        del self.tree[key]
+
+    def iterate(self):
+        for _ in self.tree.items():
+            pass
+
+    def range(self, lower, upper):
+        return list(BetweenSearch(lower, upper, lower_inclusive=True, mode=KEYS)(self.tree))
+
+    def copy(self):
+        return self.tree.copy()
+
+    @classmethod
+    def from_dict(cls, data):
+        return AVLTree(data)
+
+
+class DictMap:
+    name = "dict"
+
+    def __init__(self, items=()):
+        self.data = dict(items)
+
+    def insert(self, key, value):
+        self.data[key] = value
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def delete(self, key):
+        del self.data[key]
+
+    def iterate(self):
+        for _ in self.data.items():
+            pass
+
+    # A dict has no ordered range search
+    range = None
+
+    def copy(self):
+        return self.data.copy()
+
+    @classmethod
+    def from_dict(cls, data):
+        return dict(data)
+
+
+class BisectMap:
+    name = "bisect"
+
+    def __init__(self, items=()):
+        data = dict(items)
+        self.keys = sorted(data)
+        self.values = [data[k] for k in self.keys]
+
+    def insert(self, key, value):
+        keys = self.keys
+        i = bisect_left(keys, key)
+        if i < len(keys) and keys[i] == key:
+            self.values[i] = value
+        else:
+            keys.insert(i, key)
+            self.values.insert(i, value)
+
+    def get(self, key):
+        keys = self.keys
+        i = bisect_left(keys, key)
+        if i < len(keys) and keys[i] == key:
+            return self.values[i]
+        return None
+
+    def delete(self, key):
+        i = bisect_left(self.keys, key)
+        del self.keys[i]
+        del self.values[i]
+
+    def iterate(self):
+        for _ in zip(self.keys, self.values):
+            pass
+
+    def range(self, lower, upper):
+        keys = self.keys
+        return keys[bisect_left(keys, lower):bisect_left(keys, upper)]
+
+    def copy(self):
+        return list(self.keys), list(self.values)
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data.items())
+
+
+IMPLEMENTATIONS = (AVLTreeMap, DictMap, BisectMap)
+
+# Scenarios the sorted list skips above --bisect-limit
+QUADRATIC = {"insert_random", "insert_reversed", "delete"}
+
+
+def per_op(calls):
+    """Time each call, return the total and the per-call latencies"""
+    clock = time.perf_counter_ns
+    latencies = []
+    record = latencies.append
+    for call, arg in calls:
+        start = clock()
+        call(*arg)
+        record(clock() - start)
+    return sum(latencies) / 1e9, latencies
+
+
+def percentile(ordered, fraction):
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))] / 1000
+
+
+def scenarios(impl, n, rng, skip=()):
+    """Yield (name, op count, seconds, latencies or None) for one size
+
+    Scenarios named in skip are neither built nor run.
+    """
+    keys = list(range(0, 2 * n, 2))
+    shuffled = keys[:]
+    rng.shuffle(shuffled)
+    items = [(k, k) for k in keys]
+
+    for name, order in (
+        ("insert_random", shuffled),
+        ("insert_sorted", keys),
+        ("insert_reversed", keys[::-1]),
+    ):
+        if name in skip:
+            continue
+        target = impl()
+        seconds, latencies = per_op((target.insert, (k, k)) for k in order)
+        yield name, n, seconds, latencies
+
+    full = impl(items)
+    probes = shuffled[:min(n, 100000)]
+    seconds, latencies = per_op((full.get, (k,)) for k in probes)
+    yield "lookup_hit", len(probes), seconds, latencies
+
+    seconds, latencies = per_op((full.get, (k + 1,)) for k in probes)
+    yield "lookup_miss", len(probes), seconds, latencies
+
+    if full.range is not None:
+        starts = [rng.randrange(2 * n) for _ in range(1000)]
+        seconds, latencies = per_op((full.range, (s, s + 200)) for s in starts)
+        yield "range_100", len(starts), seconds, latencies
+
+    start = timer()
+    full.iterate()
+    yield "iterate", n, timer() - start, None
+
+    start = timer()
+    full.copy()
+    yield "copy", n, timer() - start, None
+
+    data = dict(items)
+    start = timer()
+    impl.from_dict(data)
+    yield "from_dict", n, timer() - start, None
+
+    if "delete" not in skip:
+        seconds, latencies = per_op((full.delete, (k,)) for k in shuffled)
+        yield "delete", n, seconds, latencies
+
+
+def peak_memory(impl, n, rng):
+    keys = list(range(n))
+    rng.shuffle(keys)
+    tracemalloc.start()
+    target = impl()
+    for k in keys:
+        target.insert(k, k)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def run(sizes, names, bisect_limit, memory, seed):
+    results = []
+    for n in sizes:
+        for impl in IMPLEMENTATIONS:
+            if names and impl.name not in names:
+                continue
+            if impl is BisectMap and n > bisect_limit:
+                skip = QUADRATIC
+            else:
+                skip = ()
+
+            rng = random.Random(seed)
+            for name, ops, seconds, latencies in scenarios(impl, n, rng, skip):
+                row = {
+                    "impl": impl.name,
+                    "scenario": name,
+                    "n": n,
+                    "ops": ops,
+                    "seconds": seconds,
+                    "ops_per_sec": ops / seconds if seconds else None,
+                }
+                if latencies:
+                    latencies.sort()
+                    row["p50_us"] = percentile(latencies, 0.5)
+                    row["p99_us"] = percentile(latencies, 0.99)
+                    row["p999_us"] = percentile(latencies, 0.999)
+                    row["max_us"] = latencies[-1] / 1000
+                results.append(row)
+
+            if memory and not skip:
+                results.append({
+                    "impl": impl.name,
+                    "scenario": "peak_memory",
+                    "n": n,
+                    "peak_bytes": peak_memory(impl, n, random.Random(seed)),
+                })
+    return results
+
+
+def report(results, baseline):
+    previous = {}
+    for row in baseline or ():
+        previous[row["impl"], row["scenario"], row["n"]] = row
+
+    print(f"{'impl':<8} {'scenario':<16} {'n':>9} {'ops/s':>12} {'p50 us':>8} "
+          f"{'p99 us':>8} {'p999 us':>9} {'peak MB':>8}" + (f" {'vs base':>8}" if baseline else ""))
+    for row in results:
+        def cell(key, width, scale=1.0, digits=2):
+            value = row.get(key)
+            return f"{value * scale:>{width}.{digits}f}" if value is not None else " " * width
+
+        line = (
+            f"{row['impl']:<8} {row['scenario']:<16} {row['n']:>9} "
+            f"{cell('ops_per_sec', 12, digits=0)} {cell('p50_us', 8)} {cell('p99_us', 8)} "
+            f"{cell('p999_us', 9)} {cell('peak_bytes', 8, 1 / 2 ** 20)}"
+        )
+        if baseline:
+            old = previous.get((row["impl"], row["scenario"], row["n"]), {})
+            if old.get("ops_per_sec") and row.get("ops_per_sec"):
+                line += f" {row['ops_per_sec'] / old['ops_per_sec']:>8.2f}"
+        print(line)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", default="1000,10000,100000",
+                        help="comma separated sizes (default: %(default)s)")
+    parser.add_argument("--impl", action="append", choices=[i.name for i in IMPLEMENTATIONS],
+                        help="only run this implementation, may be repeated")
+    parser.add_argument("--bisect-limit", type=int, default=1000000,
+                        help="largest size for O(n) sorted list inserts and deletes")
+    parser.add_argument("--no-memory", dest="memory", action="store_false",
+                        help="skip the tracemalloc peak memory runs")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", metavar="PATH", help="also write the results as JSON")
+    parser.add_argument("--baseline", metavar="PATH", help="compare against an earlier --json file")
+    args = parser.parse_args(argv)
+
+    sizes = [int(float(s)) for s in args.sizes.split(",")]
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as fp:
+            baseline = json.load(fp)["results"]
+
+    results = run(sizes, args.impl, args.bisect_limit, args.memory, args.seed)
+    report(results, baseline)
+
+    if args.json:
+        with open(args.json, "w") as fp:
+            json.dump({
+                "python": sys.version,
+                "implementation": platform.python_implementation(),
+                "platform": platform.platform(),
+                "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+                "seed": args.seed,
+                "sizes": sizes,
+                "results": results,
+            }, fp, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,2 +1,11 @@
 from .avl_tree import AVLTree
+from .indexed_tree import IndexedAVLTree
 from .interface import ADTInterface
+from .persistent import PersistentAVLTree
+from .frozen import FrozenAVLTree
+from .pool_tree import PoolAVLTree
+from .typed_tree import TypedAVLTree
+from .concurrent import ConcurrentAVLTree
+from .keyed_tree import KeyedAVLTree
+from .lazy_tree import LazyAVLTree
+from .multi_tree import AVLMultiTree
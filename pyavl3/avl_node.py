@@ -2,6 +2,12 @@ from typing import Hashable
 
 
 class AVLNode:
+
+    # Nodes are the bulk of a tree's memory. Slots drop the per-node
+    # __dict__. The height stays a plain int since small ints are shared
+    # objects in CPython, a packed balance factor would save nothing.
+    __slots__ = ("key", "value", "left", "right", "height")
+
     def __init__(self, key: Hashable, value: any = None) -> None:
         self.key = key
         self.value = value
@@ -11,3 +17,16 @@ class AVLNode:
 
     def __repr__(self):
         return f"<Node key={self.key}, value={self.value}, height={self.height}>"
+
+
+class SizedAVLNode(AVLNode):
+
+    # Number of nodes in the subtree rooted here, including itself.
+    __slots__ = ("size",)
+
+    def __init__(self, key: Hashable, value: any = None) -> None:
+        super().__init__(key, value)
+        self.size = 1
+
+    def __repr__(self):
+        return f"<Node key={self.key}, value={self.value}, height={self.height}, size={self.size}>"
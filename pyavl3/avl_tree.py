@@ -1,8 +1,117 @@
-from typing import Hashable, Tuple, Iterator, Iterable, Union, Dict
+import sys
+from copy import deepcopy
+from functools import partial
+from itertools import islice
+from operator import attrgetter, itemgetter
+from typing import (
+    Hashable,
+    Tuple,
+    Iterator,
+    Iterable,
+    Union,
+    Dict,
+    List,
+    Optional,
+    Callable,
+    BinaryIO,
+)
 
 from .avl_node import AVLNode
+from .cursor import Cursor
 from .interface import ADTInterface
-from .traversal import InOrderTraversal, BreadthFirstTraversal
+from .search import iter_range, KEYS, VALUES, ITEMS
+from .serialize import write_items, read_items, CHUNK_SIZE
+from .traversal import (
+    InOrderTraversal,
+    InOrderIterator,
+    BreadthFirstTraversal,
+    iter_in_order,
+)
+
+
+# Strategies reported by AVLTree.update_many and AVLTree.delete_many
+INSERT = "insert"
+MERGE = "merge"
+
+# Node to member for each mode, when AVLTree.traversal is replaced
+_TRANSFORMS = {
+    KEYS: attrgetter("key"),
+    VALUES: attrgetter("value"),
+    ITEMS: attrgetter("key", "value"),
+}
+
+
+def _batches(items: Iterator[Tuple[Hashable, any]], size: int, columns: bool):
+    """Cut an item iterator into lists, see AVLTree.iter_batches"""
+    first = itemgetter(0)
+    second = itemgetter(1)
+    while True:
+        batch = list(islice(items, size))
+        if not batch:
+            return
+        if columns:
+            yield list(map(first, batch)), list(map(second, batch))
+        else:
+            yield batch
+
+
+def _restore(cls: type, keys: list, values: list) -> "AVLTree":
+    """Rebuild a pickled AVLTree, see AVLTree.__reduce__"""
+    return cls.from_sorted(zip(keys, values))
+
+
+class _SortedBuilder:
+    """Assemble nodes arriving in ascending key order into an AVL tree.
+
+    Nodes are linked as they arrive into perfect subtrees, much like a
+    binary counter: a node either waits for a right subtree as tall as
+    its left one or completes the subtree of a waiting node. finish()
+    joins whatever is still waiting into a single valid AVL tree.
+    """
+
+    def __init__(self, tree: "AVLTree") -> None:
+        self._update = tree._update
+        self._join = tree._join
+        # Nodes with a finished left subtree waiting for a right subtree
+        # of the same height, stored as (node, height of node.left).
+        self._waiting = []
+        self._done = None
+        self._done_height = -1
+        self.count = 0
+
+    def append(self, node: AVLNode) -> None:
+        """Add a node whose key is larger than every key seen so far."""
+        self.count += 1
+        if self._done is not None:
+            node.left = self._done
+            self._waiting.append((node, self._done_height))
+            self._done = None
+            return
+
+        node.left = None
+        node.right = None
+        self._update(node)
+        height = 0
+        waiting = self._waiting
+        while waiting and waiting[-1][1] == height:
+            parent = waiting.pop()[0]
+            parent.right = node
+            self._update(parent)
+            node = parent
+            height += 1
+        self._done = node
+        self._done_height = height
+
+    def finish(self) -> AVLNode:
+        """Return the root of the assembled tree."""
+        root = self._done
+        waiting = self._waiting
+        while waiting:
+            parent = waiting.pop()[0]
+            root = self._join(parent.left, parent, root)
+        self._done = None
+        self._done_height = -1
+        return root
 
 
 class AVLTree(ADTInterface):
@@ -10,6 +119,21 @@ class AVLTree(ADTInterface):
     # Used for iterator
     traversal = InOrderTraversal
 
+    # Node class allocated on insert
+    node_type = AVLNode
+
+    # What the nodes hold. Trees with the same layout clone each other's
+    # nodes, a tree with another layout is read through its items.
+    _node_layout = "items"
+
+    # Stop rebalancing once a subtree height stops changing. Trees that
+    # cache more than the height on each node must visit the whole path.
+    _early_exit = True
+
+    # Batches at least this large relative to the tree are merged with
+    # the tree and rebuilt instead of being applied one key at a time.
+    merge_ratio = 0.1
+
     @property
     def root(self) -> AVLNode:
         """Gets the current root"""
@@ -26,20 +150,21 @@ class AVLTree(ADTInterface):
     ) -> None:
         self._root: AVLNode
         self._n: int
+        self._counted: bool
 
         self.clear()
 
         if isinstance(iterable, dict):
-            for k, v in iterable.items():
-                self[k] = v
+            self._load(iterable.items())
 
         elif isinstance(iterable, AVLTree):
-            for n in BreadthFirstTraversal(iterable, lambda x: x):
-                self[n.key] = n.value
+            if iterable._node_layout == self._node_layout:
+                self._adopt(self._clone(iterable.root), len(iterable))
+            else:
+                self._load(iterable.items())
 
         elif iterable is not None:
-            for k, v in iterable:
-                self[k] = v
+            self._load(iterable)
 
         for k, v in kwargs.items():
             self[k] = v
@@ -60,10 +185,10 @@ class AVLTree(ADTInterface):
         """Add or Update the given key using the given value.
 
         O(logn) - The AVL tree is balanced, h is always near log(n).
-                  rebalance operation is done in-line on stack return.
+                  rebalance operation is done on the way back up the
+                  recorded path and stops once heights settle.
         """
-        node = AVLNode(key, value)
-        self._root = self._insert(self._root, node)
+        self._root = self._insert(self._root, key, value)
 
     def __delitem__(self, key: Hashable) -> None:
         """Remove the given key from the tree.
@@ -78,7 +203,12 @@ class AVLTree(ADTInterface):
         """Return the count of members in the tree.
 
         O(1) - length is maintained during operations that modify it.
+               Trees produced by split or the set operations count
+               their members in O(n) the first time instead.
         """
+        if not self._counted:
+            self._n = self._count(self._root)
+            self._counted = True
         return self._n
 
     def __contains__(self, key: Hashable) -> bool:
@@ -89,15 +219,18 @@ class AVLTree(ADTInterface):
         return self._get(self._root, key) is not None
 
     def __iter__(self) -> Iterator[Tuple[Hashable, any]]:
-        """Create and return an iterator
-
-        By default this creates an InOrderTraversal iterator. This
-        functionality can be overriden by setting AVLTree.traversal
-        to another implementation.
+        """Create and return a key iterator, see keys
 
         O(n) - and that is all i am going to say about that.
         """
-        return AVLTree.traversal(self, lambda x: x.key)
+        return iter(self._walk(KEYS))
+
+    def __reversed__(self) -> Iterator[Hashable]:
+        """Iterate the keys from largest to smallest
+
+        O(n) - Same walk as iter, mirrored.
+        """
+        return iter(reversed(self._walk(KEYS)))
 
     def __repr__(self) -> str:
         """Return a string reprsentation of the AVLTree
@@ -115,6 +248,118 @@ class AVLTree(ADTInterface):
         """
         return self._root is not None
 
+    def __reduce__(self) -> tuple:
+        """Pickle the tree as its sorted keys and values, not its nodes.
+
+        O(n) - Both to pickle and to unpickle.
+        """
+        keys = []
+        values = []
+        for k, v in self.items():
+            keys.append(k)
+            values.append(v)
+        return _restore, (self.__class__, keys, values)
+
+    def dump(self, fp: BinaryIO, chunk_size: int = CHUNK_SIZE) -> None:
+        """Write the members of the tree to a binary file.
+
+        Items are written in key order, chunk_size at a time, using the
+        format described in pyavl3.serialize. Read them back with load.
+
+        O(n) - Only one chunk is held in memory at a time.
+        """
+        write_items(fp, self.items(), chunk_size)
+
+    @classmethod
+    def load(cls, fp: BinaryIO) -> "AVLTree":
+        """Returns a new AVLTree read from a file written by dump.
+
+        O(n) - The items are in order so the tree is built bottom-up
+               while the file is streamed.
+        """
+        return cls.from_sorted(read_items(fp))
+
+    def __sizeof__(self) -> int:
+        """Return the size of the tree and its nodes in bytes.
+
+        Keys and values are not included, see memory_usage.
+
+        O(n) - Every node is visited.
+        """
+        return object.__sizeof__(self) + self.memory_usage()["nodes"]
+
+    def memory_usage(self, deep: bool = False) -> Dict[str, any]:
+        """Report the number of bytes used by the tree.
+
+        The report holds the bytes used by the tree object ("tree"), by
+        its nodes ("nodes") and, if deep is True, by the distinct key and
+        value objects ("keys" and "values"). "total" is the sum of those
+        and "per_entry" divides it by the number of entries.
+
+        O(n) - Every node is visited.
+        """
+        getsizeof = sys.getsizeof
+        seen = set()
+        nodes = 0
+        keys = 0
+        values = 0
+        stack = [self._root] if self._root is not None else []
+        while stack:
+            node = stack.pop()
+            nodes += getsizeof(node)
+            if deep:
+                if id(node.key) not in seen:
+                    seen.add(id(node.key))
+                    keys += getsizeof(node.key)
+                if id(node.value) not in seen:
+                    seen.add(id(node.value))
+                    values += getsizeof(node.value)
+            if node.left is not None:
+                stack.append(node.left)
+            if node.right is not None:
+                stack.append(node.right)
+
+        entries = len(self)
+        tree = object.__sizeof__(self)
+        total = tree + nodes + keys + values
+        return {
+            "entries": entries,
+            "tree": tree,
+            "nodes": nodes,
+            "keys": keys,
+            "values": values,
+            "total": total,
+            "per_entry": total / entries if entries else 0.0,
+        }
+
+    def enable_stats(self) -> None:
+        """Start counting comparisons, rotations, allocations and timings.
+
+        The tree switches to an instrumented subclass of its class, see
+        pyavl3.stats. Trees that never enable stats pay nothing for it.
+
+        O(1) - Counters start at zero.
+        """
+        from .stats import instrumented
+        self.__class__ = instrumented(self.__class__)
+        self.reset_stats()
+
+    def disable_stats(self) -> None:
+        """Stop counting and drop the counters.
+
+        O(1) - The tree switches back to its own class.
+        """
+
+    def stats(self) -> Optional[Dict[str, any]]:
+        """Return the counters collected since stats were enabled or reset.
+
+        None if stats are not enabled.
+        """
+        return None
+
+    def reset_stats(self) -> None:
+        """Set all counters back to zero"""
+
     def get(self, key: Hashable, default: any = None) -> any:
         """Get the value at the given key or default.
 
@@ -125,38 +370,116 @@ class AVLTree(ADTInterface):
             return default
         return node.value
 
+    def irange(
+        self,
+        lower: Hashable = None,
+        upper: Hashable = None,
+        lower_inclusive: bool = True,
+        upper_inclusive: bool = False,
+        reverse: bool = False,
+        mode: str = ITEMS,
+    ) -> Iterator[any]:
+        """Iterate the members with keys between lower and upper.
+
+        A bound of None leaves that end of the range open. mode selects
+        what is yielded: "keys", "values", "items" or "nodes".
+
+        O(logn + k) - Seeks to the first member then yields k members.
+        """
+        return iter_range(
+            self._root,
+            lower,
+            upper,
+            lower_inclusive,
+            upper_inclusive,
+            reverse,
+            mode,
+        )
+
+    def iter_batches(
+        self,
+        size: int,
+        start: Hashable = None,
+        stop: Hashable = None,
+        start_inclusive: bool = True,
+        columns: bool = False,
+    ) -> Iterator[any]:
+        """Iterate the items from start up to stop in lists of size items.
+
+        The last list may be shorter. With columns set each batch is a
+        (keys, values) tuple of two lists instead. To pick up where an
+        earlier scan stopped, pass its last key as start along with
+        start_inclusive=False.
+
+        O(logn + k) - Seeks to start, the lists are filled without a
+                      step through Python code per item.
+        """
+        if size < 1:
+            raise ValueError(f"batch size must be positive: {size!r}")
+        items = self.irange(start, stop, start_inclusive, False, False, ITEMS)
+        return _batches(items, size, columns)
+
+    def cursor(self, key: Hashable = None) -> Cursor:
+        """Return a Cursor on the first item, or on the first key >= key.
+
+        O(logn) - One descent, the cursor steps in amortized O(1).
+        """
+        cursor = Cursor(self)
+        if key is None:
+            cursor.first()
+        else:
+            cursor.seek(key)
+        return cursor
+
+    def get_many(self, keys: Iterable[Hashable], default: any = None) -> List[any]:
+        """Get the value of every key, default for the missing ones.
+
+        The keys are sorted once and resolved in a single walk where each
+        descent resumes from the previous one. Results come back in the
+        order the keys were given.
+
+        O(mlogm + mlogn) - Worst case for m keys, batches touch far
+                           fewer nodes than m separate lookups.
+        """
+        return [
+            default if node is None else node.value
+            for node in self._in_order_of(keys, self._finger)
+        ]
+
+    def contains_many(self, keys: Iterable[Hashable]) -> List[bool]:
+        """Check which of the given keys exist in the tree.
+
+        See get_many.
+        """
+        return [
+            node is not None
+            for node in self._in_order_of(keys, self._finger)
+        ]
+
     def keys(self) -> Iterator[Hashable]:
         """Create and return a key iterator
 
-        By default this creates an InOrderTraversal iterator. This
-        functionality can be overriden by setting AVLTree.traversal
-        to another implementation.
+        By default this walks the nodes with iter_in_order and the
+        iterator can be passed to reversed(). This functionality can be
+        overriden by setting AVLTree.traversal to another implementation.
 
         O(n) - and that is all i am going to say about that.
         """
-        return AVLTree.traversal(self, lambda x: x.key)
+        return self._walk(KEYS)
 
     def items(self) -> Iterator[Tuple[Hashable, any]]:
-        """Create and return a item iterator
-
-        By default this creates an InOrderTraversal iterator. This
-        functionality can be overriden by setting AVLTree.traversal
-        to another implementation.
+        """Create and return a item iterator, see keys
 
         O(n) - and that is all i am going to say about that.
         """
-        return AVLTree.traversal(self, lambda x: (x.key, x.value))
+        return self._walk(ITEMS)
 
     def values(self) -> Iterator[Hashable]:
-        """Create and return a value iterator
-
-        By default this creates an InOrderTraversal iterator. This
-        functionality can be overriden by setting AVLTree.traversal
-        to another implementation.
+        """Create and return a value iterator, see keys
 
         O(n) - and that is all i am going to say about that.
         """
-        return AVLTree.traversal(self, lambda x: x.value)
+        return self._walk(VALUES)
 
     def clear(self) -> None:
         """Clear all nodes from the tree.
@@ -165,17 +488,36 @@ class AVLTree(ADTInterface):
         """
         self._root = None
         self._n = 0
+        self._counted = True
 
-    def copy(self) -> "AVLTree":
+    def copy(self, deep: bool = False) -> "AVLTree":
         """A shallow copy of the AVLTree
 
-        O(n) - When copying the order is done in a way that
-               avoids rebalance operations. It's as quick as
-               it can be without magic.
+        If deep is True, keys and values are copied with copy.deepcopy.
+
+        O(n) - The node structure is cloned as-is. No comparisons
+               or rebalance operations are needed.
+        """
+        if deep:
+            return deepcopy(self)
+        tree = self._empty()
+        tree._adopt(tree._clone(self._root), len(self))
+        return tree
+
+    def __copy__(self) -> "AVLTree":
+        """Support for copy.copy, see AVLTree.copy"""
+        return self.copy()
+
+    def __deepcopy__(self, memo: dict) -> "AVLTree":
+        """Support for copy.deepcopy
+
+        O(n) - Same as copy, plus whatever deepcopy costs for
+               every key and value.
         """
-        # using a breadth first traversal will eliminate the need
-        # for rebalances needed when constructing the new root.
-        return AVLTree(self)
+        tree = self._empty()
+        memo[id(self)] = tree
+        tree._adopt(tree._clone(self._root, memo), len(self))
+        return tree
 
     def setdefault(self, key: Hashable, value: any) -> None:
         """Insert key with the given value into the tree if it does not exist.
@@ -197,19 +539,214 @@ class AVLTree(ADTInterface):
         """Update the AVLTree using keys from given iterable
 
         O(vlogn) - where v is the number of items being updated.
+                   An empty tree is built in O(v) while the items
+                   arrive in sorted order.
         """
         if isinstance(iterable, dict):
-            for k, v in iterable.items():
-                self[k] = v
+            iterable = iterable.items()
+        elif isinstance(iterable, AVLTree) and iterable._node_layout != self._node_layout:
+            iterable = iterable.items()
         elif isinstance(iterable, AVLTree):
-            for n in BreadthFirstTraversal(iterable, lambda x: x):
-                self[n.key] = n.value
-        elif iterable is not None:
+            if self._root is None:
+                self._adopt(self._clone(iterable.root), len(iterable))
+                iterable = None
+            else:
+                iterable = (
+                    (n.key, n.value)
+                    for n in BreadthFirstTraversal(iterable, lambda x: x)
+                )
+
+        if iterable is None:
+            pass
+        elif self._root is None:
+            self._load(iterable)
+        else:
             for k, v in iterable:
                 self[k] = v
         for k, v in kwargs.items():
             self[k] = v
 
+    def update_many(
+        self,
+        iterable: Union[
+            Dict[Hashable, any],
+            Iterable[Tuple[Hashable, any]],
+            "AVLTree"
+        ] = None,
+        **kwargs
+    ) -> str:
+        """Update the AVLTree with a batch of items.
+
+        Small batches are inserted one key at a time. Batches of at least
+        merge_ratio times the size of the tree are sorted, merged with
+        the existing members and rebuilt into a balanced tree, reusing
+        the existing nodes. Returns the strategy used, INSERT or MERGE.
+
+        O(vlogn) - For per-key inserts.
+        O(vlogv + n) - For a merge, O(v + n) if the batch is sorted.
+        """
+        if isinstance(iterable, (dict, AVLTree)):
+            batch = list(iterable.items())
+        elif iterable is None:
+            batch = []
+        else:
+            batch = list(iterable)
+        batch.extend(kwargs.items())
+
+        if not self._prefer_merge(len(batch)):
+            for k, v in batch:
+                self._root = self._insert(self._root, k, v)
+            return INSERT
+
+        # Stable sort, so repeated keys are merged in batch order below.
+        batch.sort(key=itemgetter(0))
+
+        builder = _SortedBuilder(self)
+        append = builder.append
+        new_node = self._new_node
+        merge_value = self._merge_value
+        nodes = self._unlink_in_order()
+        node = next(nodes, None)
+        last = None
+        for k, v in batch:
+            if last is not None and not last.key < k:
+                # Repeated key in the batch
+                merge_value(last, v)
+                continue
+            while node is not None and node.key < k:
+                append(node)
+                node = next(nodes, None)
+            if node is not None and not k < node.key:
+                last = node
+                merge_value(last, v)
+                node = next(nodes, None)
+            else:
+                last = new_node(k, v)
+            append(last)
+
+        while node is not None:
+            append(node)
+            node = next(nodes, None)
+
+        self._adopt(builder.finish(), builder.count)
+        return MERGE
+
+    def delete_many(self, keys: Iterable[Hashable]) -> str:
+        """Remove every given key that exists in the tree.
+
+        Missing keys are ignored. Like update_many, large batches are
+        merged against the tree and the survivors rebuilt into a balanced
+        tree. Returns the strategy used, INSERT or MERGE.
+
+        O(vlogn) - For per-key deletes.
+        O(vlogv + n) - For a merge, O(v + n) if the keys are sorted.
+        """
+        keys = list(keys)
+
+        if not self._prefer_merge(len(keys)):
+            for k in keys:
+                try:
+                    self._root = self._delete(self._root, k)
+                except KeyError:
+                    pass
+            return INSERT
+
+        keys.sort()
+        builder = _SortedBuilder(self)
+        append = builder.append
+        i = 0
+        m = len(keys)
+        for node in self._unlink_in_order():
+            while i < m and keys[i] < node.key:
+                i += 1
+            if i < m and not node.key < keys[i]:
+                continue
+            append(node)
+
+        self._adopt(builder.finish(), builder.count)
+        return MERGE
+
+    @classmethod
+    def join(
+        cls,
+        left: "AVLTree",
+        key: Hashable,
+        right: "AVLTree",
+        value: any = None
+    ) -> "AVLTree":
+        """Join two trees around a new key into a new tree.
+
+        Every key in left must be smaller than key and every key in right
+        must be larger, otherwise ValueError is raised. The nodes of left
+        and right are moved into the new tree and both are left empty.
+
+        O(logn) - Only the spine of the taller tree is walked.
+        """
+        if left._root is not None and not cls._get_max(left._root).key < key:
+            raise ValueError("join(): left keys must be smaller than key")
+        if right._root is not None and not key < cls._get_min(right._root).key:
+            raise ValueError("join(): right keys must be larger than key")
+
+        tree = cls()
+        count = None
+        if left._counted and right._counted:
+            count = left._n + right._n + 1
+        tree._adopt(tree._join(left._root, tree.node_type(key, value), right._root), count)
+        left.clear()
+        right.clear()
+        return tree
+
+    def split(
+        self,
+        key: Hashable
+    ) -> Tuple["AVLTree", Optional[Tuple[Hashable, any]], "AVLTree"]:
+        """Split the tree into the members below key and above key.
+
+        Returns (lt, eq, gt). lt and gt are new trees, eq is the item for
+        key or None if key is not in the tree. The nodes are moved into
+        the new trees and this tree is left empty.
+
+        O(logn) - One descent plus joins along the way back up.
+        """
+        left, node, right = self._split(self._root, key)
+        lt = self._empty()
+        gt = self._empty()
+        lt._adopt(left)
+        gt._adopt(right)
+        self.clear()
+        return lt, self._pair(node), gt
+
+    def union(self, other: "AVLTree") -> "AVLTree":
+        """Return a new tree with the members of both trees.
+
+        Values from other win for keys found in both.
+
+        O(n + m) - Both trees are cloned, the join based merge
+                   itself is O(mlog(n/m + 1)) for m <= n.
+        """
+        return self._set_operation(self._union, other)
+
+    def intersection(self, other: "AVLTree") -> "AVLTree":
+        """Return a new tree with the members whose key is in both trees.
+
+        Values come from this tree. See union for the cost.
+        """
+        return self._set_operation(self._intersection, other)
+
+    def difference(self, other: "AVLTree") -> "AVLTree":
+        """Return a new tree with the members whose key is not in other.
+
+        See union for the cost.
+        """
+        return self._set_operation(self._difference, other)
+
+    def symmetric_difference(self, other: "AVLTree") -> "AVLTree":
+        """Return a new tree with the members whose key is in one tree only.
+
+        See union for the cost.
+        """
+        return self._set_operation(self._symmetric_difference, other)
+
     def pop(self, key: Hashable) -> any:
         """Pop an item out of the Tree and return the value.
 
@@ -229,127 +766,759 @@ class AVLTree(ADTInterface):
         self._root = self._delete(self._root, n.key)
         return n.key, n.value
 
+    def floor(self, key: Hashable) -> Tuple[Hashable, any]:
+        """Return the item with the largest key less than or equal to key.
+
+        KeyError is raised if there is no such item.
+
+        O(logn) - The AVL tree is balanced, h is always near log(n).
+        """
+        return self._item(self._floor(key), key)
+
+    def ceiling(self, key: Hashable) -> Tuple[Hashable, any]:
+        """Return the item with the smallest key greater than or equal to key.
+
+        KeyError is raised if there is no such item.
+
+        O(logn) - The AVL tree is balanced, h is always near log(n).
+        """
+        return self._item(self._ceiling(key), key)
+
+    def lower(self, key: Hashable) -> Tuple[Hashable, any]:
+        """Return the item with the largest key strictly less than key.
+
+        KeyError is raised if there is no such item.
+
+        O(logn) - The AVL tree is balanced, h is always near log(n).
+        """
+        return self._item(self._lower(key), key)
+
+    def higher(self, key: Hashable) -> Tuple[Hashable, any]:
+        """Return the item with the smallest key strictly greater than key.
+
+        KeyError is raised if there is no such item.
+
+        O(logn) - The AVL tree is balanced, h is always near log(n).
+        """
+        return self._item(self._higher(key), key)
+
+    def floor_many(self, keys: Iterable[Hashable]) -> List[Optional[Tuple[Hashable, any]]]:
+        """Answer floor for every key, None where there is no such item.
+
+        The keys are sorted once (O(m) if they already are) and answered
+        in one merged walk instead of one walk from the root per key.
+        Results come back in the order the keys were given.
+
+        O(mlogm + mlogn) - Worst case for m keys. Much less when they
+                           are close together.
+        """
+        return [
+            self._pair(lo if node is None else node)
+            for node, lo, _ in self._in_order_of(keys, self._finger_bounds)
+        ]
+
+    def ceiling_many(self, keys: Iterable[Hashable]) -> List[Optional[Tuple[Hashable, any]]]:
+        """Answer ceiling for every key, None where there is no such item.
+
+        See floor_many.
+        """
+        return [
+            self._pair(hi if node is None else node)
+            for node, _, hi in self._in_order_of(keys, self._finger_bounds)
+        ]
+
+    def lower_many(self, keys: Iterable[Hashable]) -> List[Optional[Tuple[Hashable, any]]]:
+        """Answer lower for every key, None where there is no such item.
+
+        See floor_many.
+        """
+        return [
+            self._pair(lo if node is None or node.left is None else self._get_max(node.left))
+            for node, lo, _ in self._in_order_of(keys, self._finger_bounds)
+        ]
+
+    def higher_many(self, keys: Iterable[Hashable]) -> List[Optional[Tuple[Hashable, any]]]:
+        """Answer higher for every key, None where there is no such item.
+
+        See floor_many.
+        """
+        return [
+            self._pair(hi if node is None or node.right is None else self._get_min(node.right))
+            for node, _, hi in self._in_order_of(keys, self._finger_bounds)
+        ]
+
+    def min(self) -> Tuple[Hashable, any]:
+        """Return the item with the smallest key.
+
+        KeyError is raised if the tree is empty.
+
+        O(logn) - Walks the left spine.
+        """
+        if self._root is None:
+            raise KeyError("min(): tree is empty")
+        node = self._get_min(self._root)
+        return node.key, node.value
+
+    def max(self) -> Tuple[Hashable, any]:
+        """Return the item with the largest key.
+
+        KeyError is raised if the tree is empty.
+
+        O(logn) - Walks the right spine.
+        """
+        if self._root is None:
+            raise KeyError("max(): tree is empty")
+        node = self._get_max(self._root)
+        return node.key, node.value
+
+    def popmin(self) -> Tuple[Hashable, any]:
+        """Remove and return the item with the smallest key.
+
+        KeyError is raised if the tree is empty.
+
+        O(logn) - The AVL tree is balanced, h is always near log(n).
+        """
+        if self._root is None:
+            raise KeyError("popmin(): tree is empty")
+        node = self._get_min(self._root)
+        self._root = self._delete(self._root, node.key)
+        return node.key, node.value
+
+    def popmax(self) -> Tuple[Hashable, any]:
+        """Remove and return the item with the largest key.
+
+        KeyError is raised if the tree is empty.
+
+        O(logn) - The AVL tree is balanced, h is always near log(n).
+        """
+        if self._root is None:
+            raise KeyError("popmax(): tree is empty")
+        node = self._get_max(self._root)
+        self._root = self._delete(self._root, node.key)
+        return node.key, node.value
+
     @classmethod
     def fromkeys(cls, iterable: Iterable[Hashable], value: any = None) -> "AVLTree":
         """Returns a new AVLTree with keys from iterable and values equal to value.
 
-        O(n) - Rebalance operations are likely so it's a slow O(n)
+        O(n) - Sorted keys are streamed straight into a balanced
+               tree. Unsorted keys fall back to O(nlogn) inserts.
         """
-        return AVLTree([(k, value) for k in iterable])
+        return cls.from_sorted((k, value) for k in iterable)
 
-    def _get(self, root: AVLNode, key: Hashable) -> AVLNode:
-        """Find a key in the given subtree"""
+    @classmethod
+    def from_sorted(cls, iterable: Iterable[Tuple[Hashable, any]]) -> "AVLTree":
+        """Returns a new AVLTree built from (key, value) pairs in key order.
+
+        Repeated keys keep the last value. The pairs are consumed lazily
+        so a generator is never copied into an intermediate list. If the
+        input turns out not to be sorted the remaining pairs are inserted
+        one at a time.
+
+        O(n) - The tree is assembled bottom-up without rotations.
+        """
+        tree = cls()
+        tree._load(iterable)
+        return tree
 
+    def _load(self, iterable: Iterable[Tuple[Hashable, any]]) -> None:
+        """Fill an empty tree from the given pairs.
+
+        Pairs are assembled bottom-up for as long as the keys arrive in
+        ascending order. The first out of order pair, and everything
+        after it, goes through the regular insert path.
+        """
+        builder = _SortedBuilder(self)
+        append = builder.append
+        new_node = self._new_node
+        pairs = iter(iterable)
+
+        for k, v in pairs:
+            last = new_node(k, v)
+            append(last)
+            break
+        else:
+            return
+
+        for k, v in pairs:
+            if last.key < k:
+                last = new_node(k, v)
+                append(last)
+            elif k < last.key:
+                break
+            else:
+                self._merge_value(last, v)
+        else:
+            self._adopt(builder.finish(), builder.count)
+            return
+
+        self._adopt(builder.finish(), builder.count)
+        self._root = self._insert(self._root, k, v)
+        for k, v in pairs:
+            self._root = self._insert(self._root, k, v)
+
+    def _walk(self, mode: str) -> Iterator[any]:
+        """Iterate the tree in key order for keys, values and items"""
+        if AVLTree.traversal is not InOrderTraversal:
+            return AVLTree.traversal(self, _TRANSFORMS[mode])
+        return InOrderIterator(partial(iter_in_order, self._root, mode=mode))
+
+    def _new_node(self, key: Hashable, value: any) -> AVLNode:
+        """Allocate the node for a key added to the tree"""
+        return self.node_type(key, value)
+
+    def _merge_value(self, node: AVLNode, value: any) -> None:
+        """Store a value added for a key node already holds"""
+        node.value = value
+
+    def _set_value(self, node: AVLNode, value: any) -> None:
+        """Replace the value held by node, used by Cursor"""
+        node.value = value
+
+    def _cursor_delete(self, node: AVLNode) -> Tuple[Hashable, any]:
+        """Remove the item held by node and return it, used by Cursor"""
+        item = self._pair(node)
+        self._root = self._delete(self._root, node.key)
+        return item
+
+    def _replace(self, other: "AVLTree") -> None:
+        """Take over the members of other, which is left empty"""
+        self._adopt(other._root, len(other))
+        other.clear()
+
+    def _empty(self) -> "AVLTree":
+        """Return a new empty tree of the same kind as this one"""
+        return self.__class__()
+
+    def _adopt(self, root: AVLNode, count: int = None) -> None:
+        """Make root the root of this tree.
+
+        count is the number of nodes below root. If it is not known the
+        nodes are counted the first time len() is called.
+        """
+        self._root = root
+        self._n = count or 0
+        self._counted = count is not None
+
+    @classmethod
+    def _count(cls, root: AVLNode) -> int:
+        """Count the nodes in the given subtree"""
+        count = 0
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            if node is not None:
+                count += 1
+                stack.append(node.left)
+                stack.append(node.right)
+        return count
+
+    def _set_operation(
+        self,
+        operation: Callable[[AVLNode, AVLNode], AVLNode],
+        other: "AVLTree"
+    ) -> "AVLTree":
+        """Run a set operation on clones of both trees"""
+        other = self._same_layout(other)
+        tree = self._empty()
+        tree._adopt(operation(tree._clone(self._root), tree._clone(other.root)))
+        return tree
+
+    def _same_layout(self, other: "AVLTree") -> "AVLTree":
+        """Return other, or a tree like this one holding its items"""
+        if other._node_layout == self._node_layout:
+            return other
+        tree = self._empty()
+        tree._load(other.items())
+        return tree
+
+    def _split(
+        self,
+        root: AVLNode,
+        key: Hashable
+    ) -> Tuple[AVLNode, AVLNode, AVLNode]:
+        """Split a subtree around key.
+
+        Returns the subtree of smaller keys, the node holding key (or
+        None) and the subtree of larger keys.
+        """
         if root is None:
-            # Key is not in subtree
+            return None, None, None
+        elif key < root.key:
+            left, node, right = self._split(root.left, key)
+            return left, node, self._join(right, root, root.right)
+        elif root.key < key:
+            left, node, right = self._split(root.right, key)
+            return self._join(root.left, root, left), node, right
+        return root.left, root, root.right
+
+    def _split_min(self, root: AVLNode) -> Tuple[AVLNode, AVLNode]:
+        """Remove the min node from a subtree.
+
+        Returns the remaining subtree and the min node.
+        """
+        if root.left is None:
+            return root.right, root
+        rest, node = self._split_min(root.left)
+        return self._join(rest, root, root.right), node
+
+    def _concat(self, left: AVLNode, right: AVLNode) -> AVLNode:
+        """Join two subtrees without a middle node"""
+        if right is None:
+            return left
+        right, node = self._split_min(right)
+        return self._join(left, node, right)
+
+    def _union(self, t1: AVLNode, t2: AVLNode) -> AVLNode:
+        """Merge two subtrees, nodes from t2 replace those from t1"""
+        if t1 is None:
+            return t2
+        if t2 is None:
+            return t1
+        left, _, right = self._split(t1, t2.key)
+        left = self._union(left, t2.left)
+        right = self._union(right, t2.right)
+        return self._join(left, t2, right)
+
+    def _intersection(self, t1: AVLNode, t2: AVLNode) -> AVLNode:
+        """Keep the nodes of t1 whose key is also in t2"""
+        if t1 is None or t2 is None:
             return None
+        left, node, right = self._split(t2, t1.key)
+        left = self._intersection(t1.left, left)
+        right = self._intersection(t1.right, right)
+        if node is None:
+            return self._concat(left, right)
+        return self._join(left, t1, right)
+
+    def _difference(self, t1: AVLNode, t2: AVLNode) -> AVLNode:
+        """Keep the nodes of t1 whose key is not in t2"""
+        if t1 is None or t2 is None:
+            return t1
+        left, _, right = self._split(t1, t2.key)
+        left = self._difference(left, t2.left)
+        right = self._difference(right, t2.right)
+        return self._concat(left, right)
+
+    def _symmetric_difference(self, t1: AVLNode, t2: AVLNode) -> AVLNode:
+        """Keep the nodes whose key is in only one of the subtrees"""
+        if t1 is None:
+            return t2
+        if t2 is None:
+            return t1
+        left, node, right = self._split(t1, t2.key)
+        left = self._symmetric_difference(left, t2.left)
+        right = self._symmetric_difference(right, t2.right)
+        if node is None:
+            return self._join(left, t2, right)
+        return self._concat(left, right)
 
-        elif key < root.key:
-            # If key exists, it must be left
-            return self._get(root.left, key)
+    def _prefer_merge(self, batch: int) -> bool:
+        """Decide if a batch is large enough to be merged with the tree"""
+        return batch > 0 and batch >= len(self) * self.merge_ratio
 
-        elif key > root.key:
-            # If key exists, it must be right
-            return self._get(root.right, key)
+    def _unlink_in_order(self) -> Iterator[AVLNode]:
+        """Yield every node in key order so they can be relinked.
 
-        elif key == root.key:
-            # Found it.
-            return root
+        A node's children are read before it is yielded, so the caller
+        is free to overwrite the links of every node it has received.
+        """
+        stack = []
+        node = self._root
+        while node is not None:
+            stack.append(node)
+            node = node.left
+        while stack:
+            node = stack.pop()
+            child = node.right
+            while child is not None:
+                stack.append(child)
+                child = child.left
+            yield node
+
+    def _clone(self, root: AVLNode, memo: dict = None) -> AVLNode:
+        """Copy the structure of the given subtree into new nodes.
+
+        When memo is given, keys and values are deep copied using it.
+        """
+        if root is None:
+            return None
+
+        node_type = self.node_type
+        if memo is None:
+            def make(n):
+                return node_type(n.key, n.value)
+        else:
+            def make(n):
+                return node_type(deepcopy(n.key, memo), deepcopy(n.value, memo))
+
+        # Pre-order walk. Every node is added to order after its parent
+        # so walking order backwards updates children before parents.
+        new_root = make(root)
+        order = [new_root]
+        stack = [(root, new_root)]
+        while stack:
+            src, dst = stack.pop()
+            if src.left is not None:
+                dst.left = make(src.left)
+                order.append(dst.left)
+                stack.append((src.left, dst.left))
+            if src.right is not None:
+                dst.right = make(src.right)
+                order.append(dst.right)
+                stack.append((src.right, dst.right))
+
+        update = self._update
+        for node in reversed(order):
+            update(node)
+
+        return new_root
+
+    def _get(self, root: AVLNode, key: Hashable) -> AVLNode:
+        """Find a key in the given subtree"""
+        node = root
+        while node is not None:
+            if key < node.key:
+                # If key exists, it must be left
+                node = node.left
+            elif key > node.key:
+                # If key exists, it must be right
+                node = node.right
+            else:
+                # Found it.
+                return node
+        # Key is not in subtree
+        return None
+
+    def _floor(self, key: Hashable) -> AVLNode:
+        """Find the node with the largest key <= key"""
+        best = None
+        node = self._root
+        while node is not None:
+            if key < node.key:
+                node = node.left
+            elif node.key < key:
+                best = node
+                node = node.right
+            else:
+                return node
+        return best
+
+    def _ceiling(self, key: Hashable) -> AVLNode:
+        """Find the node with the smallest key >= key"""
+        best = None
+        node = self._root
+        while node is not None:
+            if node.key < key:
+                node = node.right
+            elif key < node.key:
+                best = node
+                node = node.left
+            else:
+                return node
+        return best
+
+    def _lower(self, key: Hashable) -> AVLNode:
+        """Find the node with the largest key < key"""
+        best = None
+        node = self._root
+        while node is not None:
+            if node.key < key:
+                best = node
+                node = node.right
+            else:
+                node = node.left
+        return best
+
+    def _higher(self, key: Hashable) -> AVLNode:
+        """Find the node with the smallest key > key"""
+        best = None
+        node = self._root
+        while node is not None:
+            if key < node.key:
+                best = node
+                node = node.left
+            else:
+                node = node.right
+        return best
+
+    def _finger(self, keys: Iterable[Hashable]) -> Iterator[AVLNode]:
+        """Find keys given in ascending order in one merged walk.
+
+        Yields the node holding each key, None if it is missing. Rather
+        than starting over from the root, each descent resumes below the
+        deepest node of the previous walk whose key is still larger than
+        the new key.
+        """
+        # Nodes where the last walk turned left, keys decrease upwards.
+        stack = []
+        push = stack.append
+        pop = stack.pop
+        for key in keys:
+            while stack and stack[-1].key < key:
+                pop()
+
+            if stack:
+                node = stack[-1]
+                if not key < node.key:
+                    # The key is the one we turned left at.
+                    yield node
+                    continue
+                node = node.left
+            else:
+                node = self._root
+
+            while node is not None:
+                if key < node.key:
+                    push(node)
+                    node = node.left
+                elif node.key < key:
+                    node = node.right
+                else:
+                    break
+
+            yield node
+
+    def _finger_bounds(
+        self,
+        keys: Iterable[Hashable]
+    ) -> Iterator[Tuple[AVLNode, AVLNode, AVLNode]]:
+        """Same walk as _finger but also track the neighbours of each key.
+
+        Yields (node, lower, upper) for each key. lower and upper are the
+        nearest nodes with smaller and larger keys on the search path.
+        """
+        # Same as in _finger, each node paired with the lower
+        # bound of its subtree.
+        stack = []
+        push = stack.append
+        pop = stack.pop
+        for key in keys:
+            while stack and stack[-1][0].key < key:
+                pop()
+
+            if stack:
+                top, lo = stack[-1]
+                if not key < top.key:
+                    yield top, lo, stack[-2][0] if len(stack) > 1 else None
+                    continue
+                hi = top
+                node = top.left
+            else:
+                lo = hi = None
+                node = self._root
+
+            while node is not None:
+                if key < node.key:
+                    push((node, lo))
+                    hi = node
+                    node = node.left
+                elif node.key < key:
+                    lo = node
+                    node = node.right
+                else:
+                    break
+
+            yield node, lo, hi
+
+    @staticmethod
+    def _in_order_of(
+        keys: Iterable[Hashable],
+        walk: Callable[[Iterable[Hashable]], Iterator[any]]
+    ) -> List[any]:
+        """Feed keys to walk in sorted order, return results in given order"""
+        keys = list(keys)
+        result = [None] * len(keys)
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        for i, found in zip(order, walk([keys[i] for i in order])):
+            result[i] = found
+        return result
+
+    @staticmethod
+    def _pair(node: AVLNode) -> Optional[Tuple[Hashable, any]]:
+        """Return the item held by node or None"""
+        if node is None:
+            return None
+        return node.key, node.value
+
+    @staticmethod
+    def _item(node: AVLNode, key: Hashable) -> Tuple[Hashable, any]:
+        """Return the item held by node, raise KeyError if it is None"""
+        if node is None:
+            raise KeyError(key)
+        return node.key, node.value
+
+    def _descend(
+        self,
+        root: AVLNode,
+        key: Hashable
+    ) -> Tuple[AVLNode, List[AVLNode], List[bool]]:
+        """Walk the given subtree towards key recording the path.
+
+        Returns the node holding key (None if it is missing), the nodes
+        visited above it and, for each of those, True if the walk went
+        left of it.
+        """
+        path = []
+        dirs = []
+        push = path.append
+        turn = dirs.append
+        node = root
+        while node is not None:
+            if key < node.key:
+                push(node)
+                turn(True)
+                node = node.left
+            elif key > node.key:
+                push(node)
+                turn(False)
+                node = node.right
+            else:
+                break
+        return node, path, dirs
+
+    def _retrace(
+        self,
+        root: AVLNode,
+        path: List[AVLNode],
+        dirs: List[bool],
+        child: AVLNode
+    ) -> AVLNode:
+        """Attach child below the end of path and rebalance upwards.
+
+        Returns the new root of the tree. The walk stops as soon as a
+        subtree keeps both its root and its height because nothing above
+        it can change after that point.
+        """
+        update = self._update
+        rebalance = self._rebalance
+        early_exit = self._early_exit
+        while path:
+            parent = path.pop()
+            if dirs.pop():
+                parent.left = child
+            else:
+                parent.right = child
+            height = parent.height
+            update(parent)
+            child = rebalance(parent)
+            if early_exit and child is parent and parent.height == height:
+                return root
+        return child
+
+    def _join(self, left: AVLNode, node: AVLNode, right: AVLNode) -> AVLNode:
+        """Join two subtrees around node and return the new root.
+
+        Every key in left must be smaller than node.key and every key in
+        right must be larger. O(|h(left) - h(right)|) - only the spine of
+        the taller subtree is walked.
+        """
+        lh = -1 if left is None else left.height
+        rh = -1 if right is None else right.height
+
+        if lh > rh + 1:
+            # Walk down the right spine of left to a subtree that is
+            # short enough to pair with right under node.
+            path = []
+            t = left
+            while t is not None and t.height > rh + 1:
+                path.append(t)
+                t = t.right
+            node.left = t
+            node.right = right
+            self._update(node)
+            return self._retrace(left, path, [False] * len(path), node)
+
+        if rh > lh + 1:
+            # Mirror image, walk down the left spine of right.
+            path = []
+            t = right
+            while t is not None and t.height > lh + 1:
+                path.append(t)
+                t = t.left
+            node.left = left
+            node.right = t
+            self._update(node)
+            return self._retrace(right, path, [True] * len(path), node)
+
+        node.left = left
+        node.right = right
+        self._update(node)
+        return node
 
     def _delete(self, root: AVLNode, key: Hashable) -> AVLNode:
         """Find and remove the given key from the given subtree."""
-        if root is None:
+        node, path, dirs = self._descend(root, key)
+        if node is None:
             # This key is not in the given sub-tree
             raise KeyError(key)
+        return self._remove(root, node, path, dirs)
 
-        elif key < root.key:
-            # If the key exists, it must be left
-            root.left = self._delete(root.left, key)
-
-        elif key > root.key:
-            # If the key exists, it must be right
-            root.right = self._delete(root.right, key)
-
-        elif root.left and root.right:
+    def _remove(
+        self,
+        root: AVLNode,
+        node: AVLNode,
+        path: List[AVLNode],
+        dirs: List[bool]
+    ) -> AVLNode:
+        """Unlink a node found by _descend and return the new root."""
+        self._n -= 1
+
+        if node.left is not None and node.right is not None:
             # Replace K with the Min(T2)
             #     r         r
             #    / \       / \ 
             #   K  T3 ->  T2 T3
             #  / \       /
             # T1 T2     T1
-            # assert(root.key == key)
-            new_root = self._pop_right_min(root)
-            new_root.left = root.left
-            new_root.right = root.right
-
-            # Since we poped a node off, _n is already
-            # updated since _delete was used to remove it.
-            # Do not update _n here. the number is correct.
-            return new_root
-
-        elif root.left:
-            # Replace K with T1
-            #     r         r
-            #    / \       / \ 
-            #   K  T3 ->  T1 T3
-            #  /
-            # T1
-            # assert(root.key == key)
-            self._n -= 1
-            return root.left
-
-        elif root.right:
+            index = len(path)
+            path.append(node)
+            dirs.append(False)
+            successor = node.right
+            while successor.left is not None:
+                path.append(successor)
+                dirs.append(True)
+                successor = successor.left
+
+            # The successor is unlinked from the bottom of the path
+            # and takes over the position (and height) of K.
+            child = successor.right
+            successor.left = node.left
+            successor.right = node.right
+            successor.height = node.height
+            path[index] = successor
+            if index == 0:
+                root = successor
+            elif dirs[index - 1]:
+                path[index - 1].left = successor
+            else:
+                path[index - 1].right = successor
+
+        elif node.left is not None:
             # Replace K with T1
-            #   r         r
-            #  / \       / \ 
-            # K  T3 ->  x  T3
-            #  \ 
-            #  T1
-            # assert(root.key == key)
-            self._n -= 1
-            return root.right
+            child = node.left
 
         else:
-            # Replace K with NULL
-            #   r       r
-            #  / \  ->   \ 
-            # K  T3      T3
-            # assert(root.key == key)
-            self._n -= 1
-            return None
-
-        # Recompute hight of root
-        root.height = self._compute_height(root)
-
-        # return the balanced subtree
-        return self._rebalance(root)
-
-    def _insert(self, root: AVLNode, node: AVLNode) -> AVLNode:
-        """Insert a node into a subtree"""
-
-        if root is None:
-            # Node fits here! Insert it.
-            self._n += 1
-            return node
+            # Replace K with T1 or NULL
+            child = node.right
 
-        elif node.key < root.key:
-            # Node fits left of this root
-            root.left = self._insert(root.left, node)
+        return self._retrace(root, path, dirs, child)
 
-        elif node.key > root.key:
-            # Node fits right of this root
-            root.right = self._insert(root.right, node)
+    def _insert(self, root: AVLNode, key: Hashable, value: any) -> AVLNode:
+        """Insert or update a key in a subtree and return the new root.
 
-        elif node.key == root.key:
+        A node is only allocated when the key is not already present.
+        """
+        node, path, dirs = self._descend(root, key)
+        if node is not None:
             # Node is already in the tree.
             # Update it.
-            root.value = node.value
-
-        # Recompute hight of root
-        root.height = self._compute_height(root)
+            self._merge_value(node, value)
+            return root
 
-        # return the balanced subtree
-        return self._rebalance(root)
+        # Node fits here! Insert it.
+        self._n += 1
+        return self._retrace(root, path, dirs, self._new_node(key, value))
 
     def _pop_right_min(self, root: AVLNode) -> AVLNode:
         """Remove the min from the right side of the given subtree"""
@@ -392,8 +1561,8 @@ class AVLTree(ADTInterface):
 
         # x hight is used to compute y hight
         # so compute x firt.
-        x.height = cls._compute_height(x)
-        y.height = cls._compute_height(y)
+        cls._update(x)
+        cls._update(y)
 
         return y
 
@@ -415,17 +1584,33 @@ class AVLTree(ADTInterface):
 
         # y hight is used to compute x hight
         # so compute y firt.
-        y.height = cls._compute_height(y)
-        x.height = cls._compute_height(x)
+        cls._update(y)
+        cls._update(x)
 
         return x
 
     @classmethod
     def _get_min(cls, root: AVLNode) -> AVLNode:
         """Find the min value in a given subtree"""
-        if root.left is None:
-            return root
-        return cls._get_min(root.left)
+        while root.left is not None:
+            root = root.left
+        return root
+
+    @classmethod
+    def _get_max(cls, root: AVLNode) -> AVLNode:
+        """Find the max value in a given subtree"""
+        while root.right is not None:
+            root = root.right
+        return root
+
+    @classmethod
+    def _update(cls, root: AVLNode) -> None:
+        """Recompute the data cached on the given node from its children."""
+        left = root.left
+        right = root.right
+        lh = -1 if left is None else left.height
+        rh = -1 if right is None else right.height
+        root.height = (lh if lh > rh else rh) + 1
 
     @classmethod
     def _height(cls, root: AVLNode) -> int:
@@ -437,11 +1622,6 @@ class AVLTree(ADTInterface):
             return -1
         return root.height
 
-    @classmethod
-    def _compute_height(cls, root: AVLNode) -> int:
-        """Compute the hight of the given subtree."""
-        return max(cls._height(root.left), cls._height(root.right)) + 1
-
     @classmethod
     def _compute_balance(cls, root: AVLNode) -> int:
         """Compute the balance of the given subtree."""
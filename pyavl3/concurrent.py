@@ -0,0 +1,285 @@
+import threading
+from functools import partial, wraps
+from typing import Callable, Dict, Hashable, Iterable, Iterator, Tuple, Union
+
+from .avl_tree import AVLTree
+from .traversal import InOrderIterator
+
+
+class RWLock:
+    """A readers-writer lock.
+
+    Any number of threads may read at once, a writer waits for them to
+    finish and then has the lock to itself. Waiting writers hold back
+    new readers so a steady stream of reads cannot starve them.
+
+    Both sides are reentrant: a thread may read again while it reads,
+    and read or write again while it writes. A reader cannot upgrade to
+    a writer, that raises RuntimeError instead of deadlocking.
+    """
+
+    def __init__(self) -> None:
+        self._mutex = threading.Lock()
+        self._cond = threading.Condition(self._mutex)
+        self._readers = 0
+        self._writer = None
+        self._writes = 0
+        self._waiting = 0
+        self._local = threading.local()
+
+    def acquire_read(self) -> None:
+        local = self._local
+        if self._writer == threading.get_ident() or getattr(local, "reads", 0):
+            local.nested = getattr(local, "nested", 0) + 1
+            return
+        with self._mutex:
+            while self._writer is not None or self._waiting:
+                self._cond.wait()
+            self._readers += 1
+        local.reads = 1
+        local.nested = 0
+
+    def release_read(self) -> None:
+        local = self._local
+        if local.nested:
+            local.nested -= 1
+            return
+        local.reads = 0
+        with self._mutex:
+            self._readers -= 1
+            if not self._readers and self._waiting:
+                self._cond.notify_all()
+
+    def acquire_write(self) -> None:
+        me = threading.get_ident()
+        if self._writer == me:
+            self._writes += 1
+            return
+        if getattr(self._local, "reads", 0):
+            raise RuntimeError("cannot upgrade a read lock to a write lock")
+        with self._cond:
+            self._waiting += 1
+            while self._writer is not None or self._readers:
+                self._cond.wait()
+            self._waiting -= 1
+            self._writer = me
+            self._writes = 1
+
+    def release_write(self) -> None:
+        self._writes -= 1
+        if not self._writes:
+            with self._cond:
+                self._writer = None
+                self._cond.notify_all()
+
+    def reading(self) -> "_Held":
+        """Context manager holding the read lock"""
+        return _Held(self.acquire_read, self.release_read)
+
+    def writing(self) -> "_Held":
+        """Context manager holding the write lock"""
+        return _Held(self.acquire_write, self.release_write)
+
+
+class _Held:
+    __slots__ = ("_acquire", "_release")
+
+    def __init__(self, acquire: Callable, release: Callable) -> None:
+        self._acquire = acquire
+        self._release = release
+
+    def __enter__(self) -> None:
+        self._acquire()
+
+    def __exit__(self, *exc) -> None:
+        self._release()
+
+
+def _reading(method: Callable) -> Callable:
+    """Run method under the tree's read lock"""
+    @wraps(method)
+    def locked(self, *args, **kwargs):
+        lock = self.lock
+        lock.acquire_read()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            lock.release_read()
+    return locked
+
+
+def _writing(method: Callable) -> Callable:
+    """Run method under the tree's write lock and count the write.
+
+    A write that raises, say del of a missing key, is only counted if
+    it got as far as linking or unlinking nodes.
+    """
+    @wraps(method)
+    def locked(self, *args, **kwargs):
+        lock = self.lock
+        lock.acquire_write()
+        try:
+            root = self._root
+            n = self._n
+            try:
+                result = method(self, *args, **kwargs)
+            except BaseException:
+                if self._root is not root or self._n != n:
+                    self._modcount += 1
+                raise
+            self._modcount += 1
+            return result
+        finally:
+            lock.release_write()
+    return locked
+
+
+def _iterating(method: Callable) -> Callable:
+    """Guard the iterator returned by method, see ConcurrentAVLTree.
+
+    Members that reversed() can turn around, like keys(), come back as
+    an InOrderIterator whose walks in either direction are guarded.
+    """
+    @wraps(method)
+    def guarded(self, *args, **kwargs):
+        lock = self.lock
+        lock.acquire_read()
+        try:
+            members = method(self, *args, **kwargs)
+            if self.snapshot_iteration:
+                members = list(members)
+            modcount = self._modcount
+            if not hasattr(members, "__reversed__"):
+                return self._fail_fast(partial(iter, members), modcount)
+            if isinstance(members, list):
+                return InOrderIterator(
+                    lambda reverse: reversed(members) if reverse else iter(members)
+                )
+            return InOrderIterator(lambda reverse: self._fail_fast(
+                partial(reversed if reverse else iter, members), modcount
+            ))
+        finally:
+            lock.release_read()
+    return guarded
+
+
+class ConcurrentAVLTree(AVLTree):
+    """An AVLTree that can be shared between threads.
+
+    Lookups, range scans and other reads hold the tree's read lock and
+    run side by side. Writes hold the write lock and run alone. The
+    lock is the public lock attribute, so a caller can hold it across
+    several operations:
+
+        with tree.lock.writing():
+            if key not in tree:
+                tree[key] = value
+
+    Iterators only take the read lock while they step. Any write made
+    after an iterator was created, by any thread, makes its next step
+    raise RuntimeError instead of walking a tree that was rotated under
+    it. Set snapshot_iteration to True to have iterators copy the
+    members they will yield up front instead. They never fail then, at
+    the cost of O(n) time and memory when they are created.
+
+    Nodes reached through root directly are not protected, and neither
+    are cursors once created. Hold tree.lock.writing() while using one.
+    """
+
+    # Iterators copy the members up front instead of failing on writes
+    snapshot_iteration = False
+
+    def __init__(
+        self,
+        iterable: Union[
+            Dict[Hashable, any],
+            Iterable[Tuple[Hashable, any]],
+            AVLTree
+        ] = None,
+        **kwargs,
+    ) -> None:
+        self.lock = RWLock()
+        self._modcount = 0
+        # Read by the first counted write, the clear() in __init__
+        self._root = None
+        self._n = 0
+        super().__init__(iterable, **kwargs)
+
+    def __reduce__(self) -> tuple:
+        with self.lock.reading():
+            return super().__reduce__()
+
+    def _fail_fast(self, start: Callable[[], Iterator], modcount: int) -> Iterator:
+        """Step the iterator made by start under the read lock while nothing is written"""
+        lock = self.lock
+        done = object()
+        iterator = None
+        while True:
+            lock.acquire_read()
+            try:
+                if self._modcount != modcount:
+                    raise RuntimeError("tree changed during iteration")
+                if iterator is None:
+                    iterator = start()
+                item = next(iterator, done)
+            finally:
+                lock.release_read()
+            if item is done:
+                return
+            yield item
+
+    __getitem__ = _reading(AVLTree.__getitem__)
+    __contains__ = _reading(AVLTree.__contains__)
+    __len__ = _reading(AVLTree.__len__)
+    __repr__ = _reading(AVLTree.__repr__)
+    __sizeof__ = _reading(AVLTree.__sizeof__)
+    __deepcopy__ = _reading(AVLTree.__deepcopy__)
+    get = _reading(AVLTree.get)
+    get_many = _reading(AVLTree.get_many)
+    contains_many = _reading(AVLTree.contains_many)
+    floor = _reading(AVLTree.floor)
+    ceiling = _reading(AVLTree.ceiling)
+    lower = _reading(AVLTree.lower)
+    higher = _reading(AVLTree.higher)
+    floor_many = _reading(AVLTree.floor_many)
+    ceiling_many = _reading(AVLTree.ceiling_many)
+    lower_many = _reading(AVLTree.lower_many)
+    higher_many = _reading(AVLTree.higher_many)
+    min = _reading(AVLTree.min)
+    max = _reading(AVLTree.max)
+    cursor = _reading(AVLTree.cursor)
+    copy = _reading(AVLTree.copy)
+    dump = _reading(AVLTree.dump)
+    memory_usage = _reading(AVLTree.memory_usage)
+    union = _reading(AVLTree.union)
+    intersection = _reading(AVLTree.intersection)
+    difference = _reading(AVLTree.difference)
+    symmetric_difference = _reading(AVLTree.symmetric_difference)
+
+    __setitem__ = _writing(AVLTree.__setitem__)
+    __delitem__ = _writing(AVLTree.__delitem__)
+    clear = _writing(AVLTree.clear)
+    setdefault = _writing(AVLTree.setdefault)
+    update = _writing(AVLTree.update)
+    update_many = _writing(AVLTree.update_many)
+    delete_many = _writing(AVLTree.delete_many)
+    pop = _writing(AVLTree.pop)
+    popitem = _writing(AVLTree.popitem)
+    popmin = _writing(AVLTree.popmin)
+    popmax = _writing(AVLTree.popmax)
+    split = _writing(AVLTree.split)
+
+    # Writes made through a Cursor
+    _set_value = _writing(AVLTree._set_value)
+    _cursor_delete = _writing(AVLTree._cursor_delete)
+
+    # Swaps made by pyavl3.parallel.update
+    _replace = _writing(AVLTree._replace)
+
+    __iter__ = _iterating(AVLTree.__iter__)
+    __reversed__ = _iterating(AVLTree.__reversed__)
+    keys = _iterating(AVLTree.keys)
+    values = _iterating(AVLTree.values)
+    items = _iterating(AVLTree.items)
+    irange = _iterating(AVLTree.irange)
+    iter_batches = _iterating(AVLTree.iter_batches)
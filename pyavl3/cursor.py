@@ -0,0 +1,191 @@
+from typing import Hashable, List, Tuple
+
+from .avl_node import AVLNode
+
+
+class Cursor:
+    """A position in a tree that can step forwards and backwards.
+
+    The cursor keeps the path from the root to its node, so next and
+    prev are amortized O(1) and reading or replacing the value needs no
+    descent. Create one with AVLTree.cursor.
+
+    Writes through the cursor (set_value, delete) keep it valid. Other
+    writes to the tree that restructure it while a cursor is in use
+    leave the cursor undefined, re-seek it afterwards.
+    """
+
+    __slots__ = ("_tree", "_path", "_end")
+
+    def __init__(self, tree) -> None:
+        self._tree = tree
+        self._path: List[AVLNode] = []
+        # Which end the cursor fell off: -1 before the first item,
+        # 1 after the last one, 0 while it is on an item.
+        self._end = 1
+
+    def __bool__(self) -> bool:
+        """True while the cursor is on an item"""
+        return bool(self._path)
+
+    def __repr__(self) -> str:
+        if self._path:
+            return f"<Cursor at {self.key!r}>"
+        return "<Cursor before first>" if self._end < 0 else "<Cursor after last>"
+
+    @property
+    def key(self) -> Hashable:
+        """Key of the current item"""
+        return self.item[0]
+
+    @property
+    def value(self) -> any:
+        """Value of the current item"""
+        return self.item[1]
+
+    @property
+    def item(self) -> Tuple[Hashable, any]:
+        """The current (key, value) item"""
+        return self._tree._pair(self._node())
+
+    def seek(self, key: Hashable) -> bool:
+        """Move to the first item with key greater than or equal to key.
+
+        Returns True if that item has the key itself. Like the other
+        ordered searches, a KeyedAVLTree takes a sort key here.
+
+        O(logn) - One descent from the root.
+        """
+        path = []
+        best = 0
+        node = self._tree._root
+        while node is not None:
+            path.append(node)
+            if key < node.key:
+                best = len(path)
+                node = node.left
+            elif node.key < key:
+                node = node.right
+            else:
+                self._set(path)
+                return True
+        # The ceiling is the last node where the walk turned left.
+        self._set(path[:best])
+        return False
+
+    def first(self) -> bool:
+        """Move to the item with the smallest key, False if there is none"""
+        path = []
+        node = self._tree._root
+        while node is not None:
+            path.append(node)
+            node = node.left
+        self._set(path, -1)
+        return bool(path)
+
+    def last(self) -> bool:
+        """Move to the item with the largest key, False if there is none"""
+        path = []
+        node = self._tree._root
+        while node is not None:
+            path.append(node)
+            node = node.right
+        self._set(path, 1)
+        return bool(path)
+
+    def next(self) -> bool:
+        """Step to the next item, False once past the last one.
+
+        Stepping forward from before the first item moves to the first.
+
+        O(1) - Amortized, O(logn) for a single step.
+        """
+        if not self._path:
+            return self.first() if self._end < 0 else False
+        if not self._check():
+            # The key is gone, the cursor is on the item after it.
+            return bool(self._path)
+        path = self._path
+        node = path[-1]
+        if node.right is not None:
+            node = node.right
+            while node is not None:
+                path.append(node)
+                node = node.left
+            return True
+        child = path.pop()
+        while path and path[-1].right is child:
+            child = path.pop()
+        if not path:
+            self._end = 1
+        return bool(path)
+
+    def prev(self) -> bool:
+        """Step to the previous item, False once before the first one.
+
+        Stepping back from after the last item moves to the last.
+
+        O(1) - Amortized, O(logn) for a single step.
+        """
+        if not self._path:
+            return self.last() if self._end > 0 else False
+        if not self._check() and not self._path:
+            return self.last()
+        path = self._path
+        node = path[-1]
+        if node.left is not None:
+            node = node.left
+            while node is not None:
+                path.append(node)
+                node = node.right
+            return True
+        child = path.pop()
+        while path and path[-1].left is child:
+            child = path.pop()
+        if not path:
+            self._end = -1
+        return bool(path)
+
+    def set_value(self, value: any) -> None:
+        """Replace the value of the current item in place.
+
+        O(1) - No descent, the node is at hand.
+        """
+        node = self._node()
+        tree = self._tree
+        tree._set_value(node, value)
+        if self._path[0] is not tree._root:
+            # The tree copied the path (PersistentAVLTree), find the
+            # new nodes.
+            self.seek(node.key)
+
+    def delete(self) -> Tuple[Hashable, any]:
+        """Remove the current item and move to the one after it.
+
+        Returns the removed item.
+
+        O(logn) - The delete rebalances up to the root.
+        """
+        node = self._node()
+        key = node.key
+        item = self._tree._cursor_delete(node)
+        self.seek(key)
+        return item
+
+    def _node(self) -> AVLNode:
+        if not self._path or not self._check():
+            raise KeyError("cursor is not on an item")
+        return self._path[-1]
+
+    def _set(self, path: List[AVLNode], end: int = 1) -> None:
+        self._path = path
+        self._end = 0 if path else end
+
+    def _check(self) -> bool:
+        """Re-seek if the tree got a new root since the path was taken.
+
+        Returns False if the key of the cursor is no longer in the tree.
+        """
+        if self._path[0] is self._tree._root:
+            return True
+        return self.seek(self._path[-1].key)
@@ -0,0 +1,363 @@
+"""Read-only trees stored in a file and read through mmap.
+
+freeze() writes the members of a tree to a file. FrozenAVLTree maps the
+file and answers lookups, range searches and in-order iteration without
+ever loading more than the keys and values it touches.
+
+File layout, all integers little-endian unsigned 64 bit:
+
+    header        MAGIC, n
+    eytzinger     n ranks, the implicit search tree in breadth-first
+                  order (children of slot i are 2i+1 and 2i+2)
+    key offsets   n+1 offsets of each pickled key in the key blob
+    value offsets n+1 offsets of each pickled value in the value blob
+    key blob      keys in sorted order
+    value blob    values in sorted order
+
+The search tree is an Eytzinger layout so the first few levels, the
+ones every lookup touches, share a handful of pages. Keys and values are
+stored in sorted order so in-order iteration and range scans read the
+blobs sequentially.
+"""
+import mmap
+import pickle
+from array import array
+from struct import Struct
+from typing import Hashable, Iterator, Tuple, Union
+
+from .avl_tree import AVLTree
+from .interface import ADTInterface
+from .search import _MODES, KEYS, ITEMS, NODES
+
+
+MAGIC = b"AVL3FRZ\x01"
+
+_HEADER = Struct("<8sQ")
+_WORD = 8
+
+# Keys of the first CACHED_SLOTS search tree slots are kept unpickled.
+CACHED_SLOTS = 1023
+
+
+def freeze(tree: ADTInterface, path: str) -> None:
+    """Write the members of a tree to path in the frozen format.
+
+    The tree is iterated twice, once for keys and once for values, and
+    only the offset tables are held in memory.
+
+    O(n) - Every member is pickled once.
+    """
+    n = len(tree)
+    key_offsets = array("Q", [0])
+    value_offsets = array("Q", [0])
+    tables = _HEADER.size + _WORD * (3 * n + 2)
+
+    with open(path, "wb") as fp:
+        fp.write(b"\0" * tables)
+
+        offset = 0
+        for key in tree.keys():
+            data = pickle.dumps(key, pickle.HIGHEST_PROTOCOL)
+            fp.write(data)
+            offset += len(data)
+            key_offsets.append(offset)
+
+        offset = 0
+        for value in tree.values():
+            data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+            fp.write(data)
+            offset += len(data)
+            value_offsets.append(offset)
+
+        if len(key_offsets) != n + 1 or len(value_offsets) != n + 1:
+            raise RuntimeError("tree changed size while it was frozen")
+
+        fp.seek(0)
+        fp.write(_HEADER.pack(MAGIC, n))
+        _eytzinger(n).tofile(fp)
+        key_offsets.tofile(fp)
+        value_offsets.tofile(fp)
+
+
+def _eytzinger(n: int) -> array:
+    """Map every slot of a complete binary tree of n slots to its rank"""
+    ranks = array("Q", bytes(_WORD * n))
+    rank = 0
+    stack = []
+    slot = 0
+    while stack or slot < n:
+        while slot < n:
+            stack.append(slot)
+            slot = 2 * slot + 1
+        slot = stack.pop()
+        ranks[slot] = rank
+        rank += 1
+        slot = 2 * slot + 2
+    return ranks
+
+
+class FrozenNode:
+    """A slot of a FrozenAVLTree shaped like an AVLNode"""
+
+    __slots__ = ("_tree", "_slot")
+
+    def __init__(self, tree: "FrozenAVLTree", slot: int) -> None:
+        self._tree = tree
+        self._slot = slot
+
+    @property
+    def key(self) -> Hashable:
+        return self._tree._slot_key(self._slot)
+
+    @property
+    def value(self) -> any:
+        return self._tree._value(self._tree._ranks[self._slot])
+
+    @property
+    def left(self) -> "FrozenNode":
+        return self._tree._node(2 * self._slot + 1)
+
+    @property
+    def right(self) -> "FrozenNode":
+        return self._tree._node(2 * self._slot + 2)
+
+    def __repr__(self):
+        return f"<FrozenNode key={self.key}, value={self.value}>"
+
+
+class FrozenAVLTree(ADTInterface):
+    """A read-only tree backed by a file written with freeze."""
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        self._fp = open(path, "rb")
+        try:
+            self._mm = mmap.mmap(self._fp.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files can not be mapped
+            self._fp.close()
+            raise ValueError(f"{path!r} is not a frozen pyavl3 tree")
+
+        magic, n = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            self._mm.close()
+            self._fp.close()
+            raise ValueError(f"{path!r} is not a frozen pyavl3 tree")
+
+        self._n = n
+        tables = memoryview(self._mm)[_HEADER.size:_HEADER.size + _WORD * (3 * n + 2)]
+        self._words = tables.cast("Q")
+        self._ranks = self._words[:n]
+        self._key_offsets = self._words[n:2 * n + 1]
+        self._value_offsets = self._words[2 * n + 1:]
+        tables.release()
+        self._keys_start = _HEADER.size + _WORD * (3 * n + 2)
+        self._values_start = self._keys_start + self._key_offsets[n]
+        self._cache = {}
+
+    @property
+    def root(self) -> FrozenNode:
+        """Gets the root slot of the search tree"""
+        return self._node(0)
+
+    def close(self) -> None:
+        """Release the mapping and the file"""
+        for view in (self._ranks, self._key_offsets, self._value_offsets, self._words):
+            view.release()
+        self._mm.close()
+        self._fp.close()
+
+    def __enter__(self) -> "FrozenAVLTree":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __getitem__(self, key: Hashable) -> any:
+        """Get the value at the given key.
+
+        O(logn) - Binary search over the Eytzinger layout.
+        """
+        rank = self._find(key)
+        if rank is None:
+            raise KeyError(key)
+        return self._value(rank)
+
+    def __setitem__(self, key: Hashable, value: any) -> None:
+        raise TypeError("FrozenAVLTree is read-only")
+
+    def __delitem__(self, key: Hashable) -> None:
+        raise TypeError("FrozenAVLTree is read-only")
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self._find(key) is not None
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return self.keys()
+
+    def __repr__(self) -> str:
+        return f"<FrozenAVL {self._path!r} ({self._n} members)>"
+
+    def __bool__(self) -> bool:
+        return self._n > 0
+
+    def get(self, key: Hashable, default: any = None) -> any:
+        """Get the value at the given key or default."""
+        rank = self._find(key)
+        if rank is None:
+            return default
+        return self._value(rank)
+
+    def keys(self) -> Iterator[Hashable]:
+        """Iterate the keys in order, reading the key blob sequentially"""
+        return (self._key(r) for r in range(self._n))
+
+    def values(self) -> Iterator[any]:
+        """Iterate the values in key order"""
+        return (self._value(r) for r in range(self._n))
+
+    def items(self) -> Iterator[Tuple[Hashable, any]]:
+        """Iterate the (key, value) items in key order"""
+        return ((self._key(r), self._value(r)) for r in range(self._n))
+
+    def irange(
+        self,
+        lower: Hashable = None,
+        upper: Hashable = None,
+        lower_inclusive: bool = True,
+        upper_inclusive: bool = False,
+        reverse: bool = False,
+        mode: str = ITEMS,
+    ) -> Iterator[any]:
+        """Iterate the members with keys between lower and upper.
+
+        Same arguments as AVLTree.irange, so every search in
+        pyavl3.search works on frozen trees.
+
+        O(logn + k) - Two binary searches then k sequential reads.
+        """
+        if mode not in _MODES:
+            raise ValueError(f"unknown mode: {mode!r}")
+        start = 0 if lower is None else self._bound(lower, not lower_inclusive)
+        stop = self._n if upper is None else self._bound(upper, upper_inclusive)
+        ranks = range(start, stop)
+        if reverse:
+            ranks = reversed(ranks)
+
+        if mode == ITEMS:
+            return ((self._key(r), self._value(r)) for r in ranks)
+        elif mode == NODES:
+            slots = self._slots(start, stop, reverse)
+            return (FrozenNode(self, slot) for slot in slots)
+        elif mode == KEYS:
+            return (self._key(r) for r in ranks)
+        return (self._value(r) for r in ranks)
+
+    def clear(self) -> None:
+        raise TypeError("FrozenAVLTree is read-only")
+
+    def copy(self) -> AVLTree:
+        """Load the whole file into a regular, mutable AVLTree
+
+        O(n) - Built bottom-up from the sorted items.
+        """
+        return AVLTree.from_sorted(self.items())
+
+    def setdefault(self, key: Hashable, value: any) -> None:
+        raise TypeError("FrozenAVLTree is read-only")
+
+    def update(self, iterable=None, **kwargs) -> None:
+        raise TypeError("FrozenAVLTree is read-only")
+
+    def pop(self, key: Hashable) -> any:
+        raise TypeError("FrozenAVLTree is read-only")
+
+    def popitem(self, key: Hashable) -> Tuple[Hashable, any]:
+        raise TypeError("FrozenAVLTree is read-only")
+
+    @classmethod
+    def fromkeys(cls, *args, **kwargs) -> "FrozenAVLTree":
+        raise TypeError("FrozenAVLTree is read-only, use pyavl3.frozen.freeze")
+
+    def _find(self, key: Hashable) -> Union[int, None]:
+        """Return the rank of key, None if it is missing"""
+        n = self._n
+        slot = 0
+        while slot < n:
+            k = self._slot_key(slot)
+            if key < k:
+                slot = 2 * slot + 1
+            elif k < key:
+                slot = 2 * slot + 2
+            else:
+                return self._ranks[slot]
+        return None
+
+    def _bound(self, key: Hashable, after: bool) -> int:
+        """Rank of the first key >= key, or > key if after is True"""
+        n = self._n
+        best = n
+        slot = 0
+        while slot < n:
+            k = self._slot_key(slot)
+            if key < k or (not after and not k < key):
+                best = self._ranks[slot]
+                slot = 2 * slot + 1
+            else:
+                slot = 2 * slot + 2
+        return best
+
+    def _slots(self, start: int, stop: int, reverse: bool) -> Iterator[int]:
+        """Slots of the ranks from start to stop, in rank order.
+
+        O(logn + k) - The search tree is walked by rank, no key is read.
+        """
+        n = self._n
+        ranks = self._ranks
+        # Children towards the first rank walked, and away from it.
+        near, far = (2, 1) if reverse else (1, 2)
+        stack = []
+        slot = 0
+        while slot < n:
+            rank = ranks[slot]
+            if (rank < stop) if reverse else (start <= rank):
+                stack.append(slot)
+                slot = 2 * slot + near
+            else:
+                slot = 2 * slot + far
+
+        while stack:
+            slot = stack.pop()
+            rank = ranks[slot]
+            if (rank < start) if reverse else (stop <= rank):
+                return
+            yield slot
+            slot = 2 * slot + far
+            while slot < n:
+                stack.append(slot)
+                slot = 2 * slot + near
+
+    def _node(self, slot: int) -> FrozenNode:
+        if slot < self._n:
+            return FrozenNode(self, slot)
+        return None
+
+    def _slot_key(self, slot: int) -> Hashable:
+        if slot < CACHED_SLOTS:
+            try:
+                return self._cache[slot]
+            except KeyError:
+                key = self._cache[slot] = self._key(self._ranks[slot])
+                return key
+        return self._key(self._ranks[slot])
+
+    def _key(self, rank: int) -> Hashable:
+        start = self._keys_start
+        return pickle.loads(self._mm[start + self._key_offsets[rank]:start + self._key_offsets[rank + 1]])
+
+    def _value(self, rank: int) -> any:
+        start = self._values_start
+        return pickle.loads(self._mm[start + self._value_offsets[rank]:start + self._value_offsets[rank + 1]])
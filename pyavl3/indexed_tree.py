@@ -0,0 +1,170 @@
+from typing import Hashable, Tuple, Iterator, List, Union
+
+from .avl_node import SizedAVLNode
+from .avl_tree import AVLTree
+
+
+class IndexedAVLTree(AVLTree):
+    """An AVLTree that also tracks the size of every subtree.
+
+    The extra field on each node lets keys be found by position, and
+    positions by key, in O(logn).
+    """
+
+    node_type = SizedAVLNode
+
+    # Sizes change all the way up to the root on every insert or delete.
+    _early_exit = False
+
+    @property
+    def byindex(self) -> "IndexView":
+        """Positional access to the (key, value) items of the tree.
+
+        tree.byindex[i] returns the i-th item and tree.byindex[i:j]
+        returns a list of items, both in key order.
+        """
+        return IndexView(self)
+
+    def rank(self, key: Hashable) -> int:
+        """Return the number of keys in the tree smaller than key.
+
+        The key does not have to be in the tree.
+
+        O(logn) - The AVL tree is balanced, h is always near log(n).
+        """
+        rank = 0
+        node = self._root
+        while node is not None:
+            if key < node.key:
+                node = node.left
+            elif key > node.key:
+                rank += self._size(node.left) + 1
+                node = node.right
+            else:
+                return rank + self._size(node.left)
+        return rank
+
+    def select(self, index: int) -> Hashable:
+        """Return the key at the given position in key order.
+
+        Negative positions count from the end. IndexError is raised if
+        the position is out of range.
+
+        O(logn) - The AVL tree is balanced, h is always near log(n).
+        """
+        return self._select(index).key
+
+    def count_range(self, lower: Hashable, upper: Hashable) -> int:
+        """Return the number of keys k with lower <= k < upper.
+
+        O(logn) - Two rank lookups.
+        """
+        return max(0, self.rank(upper) - self.rank(lower))
+
+    def _adopt(self, root: SizedAVLNode, count: int = None) -> None:
+        """Make root the root of this tree, the count is always known"""
+        super()._adopt(root, self._size(root))
+
+    def _select(self, index: int) -> SizedAVLNode:
+        """Find the node at the given position."""
+        size = self._size(self._root)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("tree index out of range")
+
+        node = self._root
+        while True:
+            left = self._size(node.left)
+            if index < left:
+                node = node.left
+            elif index > left:
+                index -= left + 1
+                node = node.right
+            else:
+                return node
+
+    def _iter_from(self, index: int) -> Iterator[SizedAVLNode]:
+        """Iterate nodes in key order starting at the given position."""
+        stack = []
+        node = self._root
+        while node is not None:
+            left = self._size(node.left)
+            if index < left:
+                stack.append(node)
+                node = node.left
+            elif index > left:
+                index -= left + 1
+                node = node.right
+            else:
+                stack.append(node)
+                break
+
+        while stack:
+            node = stack.pop()
+            yield node
+            node = node.right
+            while node is not None:
+                stack.append(node)
+                node = node.left
+
+    @classmethod
+    def _size(cls, root: SizedAVLNode) -> int:
+        """Get the size of the given subtree, 0 if it is null."""
+        if root is None:
+            return 0
+        return root.size
+
+    @classmethod
+    def _update(cls, root: SizedAVLNode) -> None:
+        """Recompute the height and size of the given node."""
+        left = root.left
+        right = root.right
+        if left is None:
+            lh = -1
+            size = 1
+        else:
+            lh = left.height
+            size = left.size + 1
+        if right is None:
+            rh = -1
+        else:
+            rh = right.height
+            size += right.size
+        root.height = (lh if lh > rh else rh) + 1
+        root.size = size
+
+
+class IndexView:
+    """Positional view over the items of an IndexedAVLTree."""
+
+    def __init__(self, tree: IndexedAVLTree) -> None:
+        self._tree = tree
+
+    def __len__(self) -> int:
+        return len(self._tree)
+
+    def __getitem__(
+        self,
+        index: Union[int, slice]
+    ) -> Union[Tuple[Hashable, any], List[Tuple[Hashable, any]]]:
+        """Get the item at a position or a list of items for a slice.
+
+        O(logn) - For a single position.
+        O(logn + k) - For a contiguous slice of k items.
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self._tree))
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            items = []
+            count = stop - start
+            if count > 0:
+                for node in self._tree._iter_from(start):
+                    items.append((node.key, node.value))
+                    if len(items) == count:
+                        break
+            return items
+
+        node = self._tree._select(index)
+        return node.key, node.value
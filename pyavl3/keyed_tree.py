@@ -0,0 +1,383 @@
+from functools import partial
+from operator import itemgetter
+from typing import (
+    BinaryIO,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .avl_node import AVLNode
+from .avl_tree import AVLTree
+from .interface import ADTInterface
+from .search import iter_range, ITEMS, KEYS, VALUES, NODES, _MODES
+from .serialize import read_items
+from .traversal import BreadthFirstTraversal, InOrderIterator, iter_in_order
+
+
+def _restore_keyed(cls: type, key: Callable, keys: list, values: list) -> "KeyedAVLTree":
+    """Rebuild a pickled KeyedAVLTree, see KeyedAVLTree.__reduce__"""
+    return cls.from_sorted(key, zip(keys, values))
+
+
+class KeyedAVLTree(AVLTree):
+    """An AVLTree ordered by key(k) instead of by k itself.
+
+    key works like the key argument of sorted. It is called once for
+    every key that is looked up or stored, and the result is cached on
+    the node, so descents, rebalancing and range searches only ever
+    compare cached sort keys. Two keys with equal sort keys are the same
+    entry.
+
+    Nodes hold the sort key in key and the (key, value) item in value.
+
+    Mapping operations (tree[k], get, pop, in, update, get_many, ...)
+    take keys, like a dict. Ordered searches (irange and every class in
+    pyavl3.search, floor, ceiling, lower, higher and split) take sort
+    keys, like bisect with a key function. The classmethod constructors
+    take the key function first.
+    """
+
+    _node_layout = "keyed"
+
+    def __init__(
+        self,
+        key: Callable[[Hashable], any],
+        iterable: Union[
+            Dict[Hashable, any],
+            Iterable[Tuple[Hashable, any]],
+            ADTInterface
+        ] = None,
+        **kwargs,
+    ) -> None:
+        self.key = key
+        if isinstance(iterable, KeyedAVLTree) and iterable.key is key:
+            # Same order, the nodes can be cloned as they are.
+            super().__init__(iterable, **kwargs)
+            return
+        if isinstance(iterable, (dict, ADTInterface)):
+            iterable = iterable.items()
+        super().__init__(None if iterable is None else self._pairs(iterable), **kwargs)
+
+    def __getitem__(self, key: Hashable) -> any:
+        """Get the value at the given key.
+
+        If the key is not found, a KeyError will be raised.
+
+        O(logn) - The AVL tree is balanced, h is always near log(n).
+        """
+        node = self._get(self._root, self.key(key))
+        if node is None:
+            raise KeyError(key)
+        return node.value[1]
+
+    def __setitem__(self, key: Hashable, value: any) -> None:
+        """Add or Update the given key using the given value.
+
+        O(logn) - The AVL tree is balanced, h is always near log(n).
+        """
+        self._root = self._insert(self._root, self.key(key), (key, value))
+
+    def __delitem__(self, key: Hashable) -> None:
+        """Remove the given key from the tree.
+
+        O(logn) - The AVL tree is balanced, h is always near log(n).
+        """
+        try:
+            self._root = self._delete(self._root, self.key(key))
+        except KeyError:
+            raise KeyError(key) from None
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Check if a given key exists in the tree
+
+        O(logn) - The AVL tree is balanced, h is always near log(n).
+        """
+        return self._get(self._root, self.key(key)) is not None
+
+    def __repr__(self) -> str:
+        """Return a string reprsentation of the tree
+
+        O(n) - This repr prints every member much like dict.
+        """
+        m = BreadthFirstTraversal(self, lambda x: f"{x.value[0]}: {x.value[1]}")
+        s = ", ".join(m)
+        return f"<AVL {{{s}}}>"
+
+    def __reduce__(self) -> tuple:
+        """Pickle the tree as its key function, keys and values.
+
+        The key function has to be picklable itself, e.g. a module level
+        function or an operator.attrgetter.
+
+        O(n) - Both to pickle and to unpickle.
+        """
+        keys = []
+        values = []
+        for k, v in self.items():
+            keys.append(k)
+            values.append(v)
+        return _restore_keyed, (self.__class__, self.key, keys, values)
+
+    def get(self, key: Hashable, default: any = None) -> any:
+        """Get the value at the given key or default.
+
+        O(logn) - The AVL tree is balanced, h is always near log(n).
+        """
+        node = self._get(self._root, self.key(key))
+        if node is None:
+            return default
+        return node.value[1]
+
+    def get_many(self, keys: Iterable[Hashable], default: any = None) -> List[any]:
+        """Get the value of every key, default for the missing ones.
+
+        See AVLTree.get_many.
+        """
+        return [
+            default if node is None else node.value[1]
+            for node in self._in_order_of(map(self.key, keys), self._finger)
+        ]
+
+    def contains_many(self, keys: Iterable[Hashable]) -> List[bool]:
+        """Check which of the given keys exist in the tree.
+
+        See AVLTree.get_many.
+        """
+        return super().contains_many(map(self.key, keys))
+
+    def irange(
+        self,
+        lower: any = None,
+        upper: any = None,
+        lower_inclusive: bool = True,
+        upper_inclusive: bool = False,
+        reverse: bool = False,
+        mode: str = ITEMS,
+    ) -> Iterator[any]:
+        """Iterate the members whose sort keys fall between lower and upper.
+
+        lower and upper are sort keys, see AVLTree.irange for the rest.
+
+        O(logn + k) - Seeks to the first member then yields k members.
+        """
+        if mode not in _MODES:
+            raise ValueError(f"unknown mode: {mode!r}")
+        nodes = iter_range(
+            self._root, lower, upper, lower_inclusive, upper_inclusive, reverse, NODES
+        )
+        if mode == ITEMS:
+            return (n.value for n in nodes)
+        elif mode == KEYS:
+            return (n.value[0] for n in nodes)
+        elif mode == VALUES:
+            return (n.value[1] for n in nodes)
+        return nodes
+
+    def update(
+        self,
+        iterable: Union[
+            Dict[Hashable, any],
+            Iterable[Tuple[Hashable, any]],
+            ADTInterface
+        ] = None,
+        **kwargs
+    ) -> None:
+        """Update the tree using keys from given iterable
+
+        O(vlogn) - where v is the number of items being updated.
+                   An empty tree is built in O(v) while the items
+                   arrive in sort key order.
+        """
+        if isinstance(iterable, (dict, ADTInterface)):
+            iterable = iterable.items()
+        if iterable is None:
+            pass
+        elif self._root is None:
+            self._load(self._pairs(iterable))
+        else:
+            for k, v in iterable:
+                self[k] = v
+        for k, v in kwargs.items():
+            self[k] = v
+
+    def update_many(
+        self,
+        iterable: Union[
+            Dict[Hashable, any],
+            Iterable[Tuple[Hashable, any]],
+            ADTInterface
+        ] = None,
+        **kwargs
+    ) -> str:
+        """Update the tree with a batch of items.
+
+        See AVLTree.update_many.
+        """
+        if isinstance(iterable, (dict, ADTInterface)):
+            iterable = iterable.items()
+        batch = list(self._pairs(iterable or ()))
+        batch.extend(self._pairs(kwargs.items()))
+        return super().update_many(batch)
+
+    def delete_many(self, keys: Iterable[Hashable]) -> str:
+        """Remove every given key that exists in the tree.
+
+        See AVLTree.delete_many.
+        """
+        return super().delete_many(map(self.key, keys))
+
+    @classmethod
+    def join(
+        cls,
+        left: "KeyedAVLTree",
+        key: Hashable,
+        right: "KeyedAVLTree",
+        value: any = None
+    ) -> "KeyedAVLTree":
+        """Join two trees around a new key into a new tree.
+
+        Both trees must use the same key function. See AVLTree.join.
+
+        O(logn) - Only the spine of the taller tree is walked.
+        """
+        cls._check_key(left, right)
+        sort_key = left.key(key)
+        if left._root is not None and not cls._get_max(left._root).key < sort_key:
+            raise ValueError("join(): left keys must be smaller than key")
+        if right._root is not None and not sort_key < cls._get_min(right._root).key:
+            raise ValueError("join(): right keys must be larger than key")
+
+        tree = left._empty()
+        count = None
+        if left._counted and right._counted:
+            count = left._n + right._n + 1
+        node = tree.node_type(sort_key, (key, value))
+        tree._adopt(tree._join(left._root, node, right._root), count)
+        left.clear()
+        right.clear()
+        return tree
+
+    def popitem(self, key: Hashable) -> Tuple[Hashable, any]:
+        """Pop an item out of the Tree and return the key and value.
+
+        O(logn) - The AVL tree is balanced, h is always near log(n).
+        """
+        try:
+            return super().popitem(self.key(key))[1]
+        except KeyError:
+            raise KeyError(key) from None
+
+    def min(self) -> Tuple[Hashable, any]:
+        """Return the item with the smallest sort key.
+
+        KeyError is raised if the tree is empty.
+        """
+        return super().min()[1]
+
+    def max(self) -> Tuple[Hashable, any]:
+        """Return the item with the largest sort key.
+
+        KeyError is raised if the tree is empty.
+        """
+        return super().max()[1]
+
+    def popmin(self) -> Tuple[Hashable, any]:
+        """Remove and return the item with the smallest sort key.
+
+        KeyError is raised if the tree is empty.
+        """
+        return super().popmin()[1]
+
+    def popmax(self) -> Tuple[Hashable, any]:
+        """Remove and return the item with the largest sort key.
+
+        KeyError is raised if the tree is empty.
+        """
+        return super().popmax()[1]
+
+    @classmethod
+    def load(cls, key: Callable[[Hashable], any], fp: BinaryIO) -> "KeyedAVLTree":
+        """Returns a new tree read from a file written by dump.
+
+        O(n) - The items are in sort key order.
+        """
+        return cls.from_sorted(key, read_items(fp))
+
+    @classmethod
+    def fromkeys(
+        cls,
+        key: Callable[[Hashable], any],
+        iterable: Iterable[Hashable],
+        value: any = None
+    ) -> "KeyedAVLTree":
+        """Returns a new tree with keys from iterable and values equal to value.
+
+        O(n) - When the keys arrive in sort key order.
+        """
+        return cls.from_sorted(key, ((k, value) for k in iterable))
+
+    @classmethod
+    def from_sorted(
+        cls,
+        key: Callable[[Hashable], any],
+        iterable: Iterable[Tuple[Hashable, any]]
+    ) -> "KeyedAVLTree":
+        """Returns a new tree built from (key, value) pairs in sort key order.
+
+        See AVLTree.from_sorted.
+
+        O(n) - The tree is assembled bottom-up without rotations.
+        """
+        tree = cls(key)
+        tree._load(tree._pairs(iterable))
+        return tree
+
+    def _walk(self, mode: str) -> Iterator[any]:
+        """Iterate the members in sort key order, see AVLTree.keys"""
+        walk = partial(iter_in_order, self._root, mode=VALUES)
+        if mode == ITEMS:
+            return InOrderIterator(walk)
+        member = itemgetter(0 if mode == KEYS else 1)
+        return InOrderIterator(lambda reverse: map(member, walk(reverse=reverse)))
+
+    def _set_value(self, node: AVLNode, value: any) -> None:
+        """Replace the value of the item held by node"""
+        node.value = (node.value[0], value)
+
+    def _empty(self) -> "KeyedAVLTree":
+        return self.__class__(self.key)
+
+    def _pairs(self, iterable: Iterable[Tuple[Hashable, any]]) -> Iterator[Tuple[any, Tuple[Hashable, any]]]:
+        """Turn (key, value) items into (sort key, item) node contents"""
+        key = self.key
+        return ((key(k), (k, v)) for k, v in iterable)
+
+    def _set_operation(self, operation, other: "KeyedAVLTree") -> "KeyedAVLTree":
+        self._check_key(self, other)
+        return super()._set_operation(operation, other)
+
+    @staticmethod
+    def _check_key(tree: "KeyedAVLTree", other: "KeyedAVLTree") -> None:
+        if not isinstance(other, KeyedAVLTree) or other.key is not tree.key:
+            raise ValueError("trees must share the same key function")
+
+    @staticmethod
+    def _pair(node: AVLNode) -> Optional[Tuple[Hashable, any]]:
+        """Return the item held by node or None"""
+        if node is None:
+            return None
+        return node.value
+
+    @staticmethod
+    def _item(node: AVLNode, key: any) -> Tuple[Hashable, any]:
+        """Return the item held by node, raise KeyError if it is None"""
+        if node is None:
+            raise KeyError(key)
+        return node.value
@@ -0,0 +1,270 @@
+from functools import partial
+from typing import Hashable, Iterable, Iterator, List, Optional, Tuple
+
+from .avl_node import AVLNode
+from .avl_tree import AVLTree, _SortedBuilder
+from .cursor import Cursor
+from .search import iter_range, ITEMS, KEYS, VALUES, NODES, _MODES
+from .traversal import BreadthFirstTraversal, InOrderIterator
+
+
+# Value of a node whose key was deleted
+_DEAD = object()
+
+
+class LazyAVLTree(AVLTree):
+    """An AVLTree that deletes by leaving tombstones behind.
+
+    Deleting a key only marks its node dead, the tree is not
+    restructured. Lookups, iterators and searches skip dead nodes and
+    inserting the key again revives its node in place. Once more than
+    compact_ratio of the nodes are dead the tree is rebuilt from the
+    live nodes in O(n), see compact.
+
+    Anything handing out the node structure (root, cursors, copies,
+    split, join and the set operations) compacts first, so other trees
+    never see a tombstone.
+    """
+
+    # Fraction of dead nodes that triggers a compaction
+    compact_ratio = 0.25
+
+    @property
+    def root(self) -> AVLNode:
+        """Gets the current root, compacting first"""
+        self.compact()
+        return self._root
+
+    def __delitem__(self, key: Hashable) -> None:
+        """Mark the given key deleted.
+
+        O(logn) - One descent, no rebalancing until compaction.
+        """
+        self.popitem(key)
+
+    def __len__(self) -> int:
+        """Return the count of live members in the tree."""
+        return super().__len__() - self._dead
+
+    def __bool__(self) -> bool:
+        """Return True if the Tree has live members. Else, false."""
+        return len(self) > 0
+
+    def __repr__(self) -> str:
+        """Return a string reprsentation of the tree, without tombstones"""
+        m = BreadthFirstTraversal(self._root, lambda x: x)
+        s = ", ".join(f"{n.key}: {n.value}" for n in m if n.value is not _DEAD)
+        return f"<AVL {{{s}}}>"
+
+    def irange(
+        self,
+        lower: Hashable = None,
+        upper: Hashable = None,
+        lower_inclusive: bool = True,
+        upper_inclusive: bool = False,
+        reverse: bool = False,
+        mode: str = ITEMS,
+    ) -> Iterator[any]:
+        """Iterate the live members with keys between lower and upper.
+
+        See AVLTree.irange.
+
+        O(logn + k) - Where k counts the tombstones passed on the way.
+        """
+        if mode not in _MODES:
+            raise ValueError(f"unknown mode: {mode!r}")
+        nodes = (
+            n for n in iter_range(
+                self._root, lower, upper, lower_inclusive, upper_inclusive, reverse, NODES
+            )
+            if n.value is not _DEAD
+        )
+        if mode == ITEMS:
+            return ((n.key, n.value) for n in nodes)
+        elif mode == KEYS:
+            return (n.key for n in nodes)
+        elif mode == VALUES:
+            return (n.value for n in nodes)
+        return nodes
+
+    def clear(self) -> None:
+        """Clear all nodes from the tree."""
+        super().clear()
+        self._dead = 0
+
+    def compact(self) -> None:
+        """Rebuild the tree from its live nodes, dropping every tombstone.
+
+        O(n) - The live nodes are reused and relinked bottom-up.
+        """
+        if not self._dead:
+            return
+        builder = _SortedBuilder(self)
+        append = builder.append
+        for node in self._unlink_in_order():
+            if node.value is not _DEAD:
+                append(node)
+        self._adopt(builder.finish(), builder.count)
+
+    def cursor(self, key: Hashable = None) -> Cursor:
+        """A Cursor over the live members, see AVLTree.cursor
+
+        Deletes through the cursor remove the node for real.
+        """
+        self.compact()
+        return super().cursor(key)
+
+    def copy(self, deep: bool = False) -> "LazyAVLTree":
+        """A copy of the live members, see AVLTree.copy"""
+        self.compact()
+        return super().copy(deep)
+
+    def __deepcopy__(self, memo: dict) -> "LazyAVLTree":
+        self.compact()
+        return super().__deepcopy__(memo)
+
+    def update_many(self, iterable=None, **kwargs) -> str:
+        """Update the tree with a batch of items, see AVLTree.update_many"""
+        self.compact()
+        return super().update_many(iterable, **kwargs)
+
+    def delete_many(self, keys: Iterable[Hashable]) -> str:
+        """Remove every given key, see AVLTree.delete_many.
+
+        Batches are removed for real, after a compaction.
+        """
+        self.compact()
+        return super().delete_many(keys)
+
+    @classmethod
+    def join(cls, left: AVLTree, key: Hashable, right: AVLTree, value: any = None) -> "LazyAVLTree":
+        """Join two trees around a new key into a new tree, see AVLTree.join"""
+        for tree in (left, right):
+            if isinstance(tree, LazyAVLTree):
+                tree.compact()
+        return super().join(left, key, right, value)
+
+    def split(self, key: Hashable) -> Tuple["LazyAVLTree", Optional[Tuple[Hashable, any]], "LazyAVLTree"]:
+        """Split the tree around key, see AVLTree.split"""
+        self.compact()
+        return super().split(key)
+
+    def popitem(self, key: Hashable) -> Tuple[Hashable, any]:
+        """Mark key deleted and return its key and value.
+
+        O(logn) - One descent, no rebalancing until compaction.
+        """
+        node = self._get(self._root, key)
+        if node is None:
+            raise KeyError(key)
+        return self._bury(node)
+
+    def min(self) -> Tuple[Hashable, any]:
+        """Return the live item with the smallest key."""
+        return self._item(self._first(False), "min(): tree is empty")
+
+    def max(self) -> Tuple[Hashable, any]:
+        """Return the live item with the largest key."""
+        return self._item(self._first(True), "max(): tree is empty")
+
+    def popmin(self) -> Tuple[Hashable, any]:
+        """Mark the smallest live key deleted and return its item."""
+        node = self._first(False)
+        if node is None:
+            raise KeyError("popmin(): tree is empty")
+        return self._bury(node)
+
+    def popmax(self) -> Tuple[Hashable, any]:
+        """Mark the largest live key deleted and return its item."""
+        node = self._first(True)
+        if node is None:
+            raise KeyError("popmax(): tree is empty")
+        return self._bury(node)
+
+    def floor_many(self, keys: Iterable[Hashable]) -> List[Optional[Tuple[Hashable, any]]]:
+        """Answer floor for every key, None where there is no such item."""
+        return [self._pair(self._floor(k)) for k in keys]
+
+    def ceiling_many(self, keys: Iterable[Hashable]) -> List[Optional[Tuple[Hashable, any]]]:
+        """Answer ceiling for every key, None where there is no such item."""
+        return [self._pair(self._ceiling(k)) for k in keys]
+
+    def lower_many(self, keys: Iterable[Hashable]) -> List[Optional[Tuple[Hashable, any]]]:
+        """Answer lower for every key, None where there is no such item."""
+        return [self._pair(self._lower(k)) for k in keys]
+
+    def higher_many(self, keys: Iterable[Hashable]) -> List[Optional[Tuple[Hashable, any]]]:
+        """Answer higher for every key, None where there is no such item."""
+        return [self._pair(self._higher(k)) for k in keys]
+
+    def _bury(self, node: AVLNode) -> Tuple[Hashable, any]:
+        """Mark node dead, compact if too many are, return its old item"""
+        item = node.key, node.value
+        node.value = _DEAD
+        self._dead += 1
+        if self._dead > self.compact_ratio * super().__len__():
+            self.compact()
+        return item
+
+    def _walk(self, mode: str) -> Iterator[any]:
+        """Iterate the live members in key order, see AVLTree.keys"""
+        return InOrderIterator(partial(self.irange, mode=mode))
+
+    def _first(self, reverse: bool) -> AVLNode:
+        return next(self.irange(reverse=reverse, mode=NODES), None)
+
+    def _adopt(self, root: AVLNode, count: int = None) -> None:
+        super()._adopt(root, count)
+        self._dead = 0
+
+    def _set_operation(self, operation, other: AVLTree) -> "LazyAVLTree":
+        self.compact()
+        # other.root compacts other if it is lazy as well
+        other.root
+        return super()._set_operation(operation, other)
+
+    def _get(self, root: AVLNode, key: Hashable) -> AVLNode:
+        node = super()._get(root, key)
+        if node is not None and node.value is _DEAD:
+            return None
+        return node
+
+    def _finger(self, keys: Iterable[Hashable]) -> Iterator[AVLNode]:
+        for node in super()._finger(keys):
+            yield None if node is not None and node.value is _DEAD else node
+
+    def _insert(self, root: AVLNode, key: Hashable, value: any) -> AVLNode:
+        node, path, dirs = self._descend(root, key)
+        if node is not None:
+            if node.value is _DEAD:
+                # Revive the tombstone in place
+                self._dead -= 1
+            node.value = value
+            return root
+
+        self._n += 1
+        return self._retrace(root, path, dirs, self._new_node(key, value))
+
+    def _floor(self, key: Hashable) -> AVLNode:
+        node = super()._floor(key)
+        while node is not None and node.value is _DEAD:
+            node = super()._lower(node.key)
+        return node
+
+    def _ceiling(self, key: Hashable) -> AVLNode:
+        node = super()._ceiling(key)
+        while node is not None and node.value is _DEAD:
+            node = super()._higher(node.key)
+        return node
+
+    def _lower(self, key: Hashable) -> AVLNode:
+        node = super()._lower(key)
+        while node is not None and node.value is _DEAD:
+            node = super()._lower(node.key)
+        return node
+
+    def _higher(self, key: Hashable) -> AVLNode:
+        node = super()._higher(key)
+        while node is not None and node.value is _DEAD:
+            node = super()._higher(node.key)
+        return node
@@ -0,0 +1,228 @@
+from itertools import chain
+from typing import (
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .avl_node import AVLNode
+from .avl_tree import AVLTree
+from .search import iter_range, ITEMS, KEYS, VALUES, NODES, _MODES
+from .traversal import InOrderIterator, iter_in_order
+
+
+class AVLMultiTree(AVLTree):
+    """An AVLTree that keeps every value added under a key.
+
+    Each node holds the list of values of its key in the order they were
+    added. Adding a value to a key that is already present appends to
+    that list in place, there is no read-modify-write of a list value.
+
+    The members of the tree are (key, value) pairs: items, values, irange
+    and iter_batches yield one pair or value per value added, and the
+    constructor, update, update_many and tree[key] = value add pairs.
+    Lookups such as tree[key], get, min or floor return a key's values
+    as a new list. len() and keys() count every key once, count(key)
+    gives the number of values of a key. The set operations compare keys
+    and take a key's values from one tree, as AVLTree does. Other kinds
+    of trees are read through their items both ways, so an AVLTree built
+    from a multi tree keeps the last value of each key.
+    """
+
+    _node_layout = "multi"
+
+    def __getitem__(self, key: Hashable) -> List[any]:
+        """Get the values of the given key.
+
+        If the key is not found, a KeyError will be raised.
+
+        O(logn + k) - For a key with k values.
+        """
+        return list(super().__getitem__(key))
+
+    def add(self, key: Hashable, value: any) -> None:
+        """Add value under key, after the values the key already has.
+
+        O(logn) - The value is appended to the key's values in place.
+        """
+        self._root = self._insert(self._root, key, value)
+
+    def remove(self, key: Hashable, value: any) -> None:
+        """Remove the first value of key that is equal to value.
+
+        The key is removed once its last value is. KeyError is raised if
+        the key is missing, ValueError if it has no such value.
+
+        O(logn + k) - One descent, the key's k values are searched and
+                      the path is reused if the key has to go.
+        """
+        node, path, dirs = self._descend(self._root, key)
+        if node is None:
+            raise KeyError(key)
+        values = node.value
+        try:
+            values.remove(value)
+        except ValueError:
+            raise ValueError(f"remove(): {value!r} is not a value of {key!r}") from None
+        if not values:
+            self._root = self._remove(self._root, node, path, dirs)
+
+    def count(self, key: Hashable) -> int:
+        """Return the number of values of key, 0 if it is missing.
+
+        O(logn) - The AVL tree is balanced, h is always near log(n).
+        """
+        node = self._get(self._root, key)
+        if node is None:
+            return 0
+        return len(node.value)
+
+    def get(self, key: Hashable, default: any = None) -> any:
+        """Get the values of the given key or default.
+
+        O(logn + k) - For a key with k values.
+        """
+        node = self._get(self._root, key)
+        if node is None:
+            return default
+        return list(node.value)
+
+    def get_many(self, keys: Iterable[Hashable], default: any = None) -> List[any]:
+        """Get the values of every key, see AVLTree.get_many"""
+        return [
+            default if node is None else list(node.value)
+            for node in self._in_order_of(keys, self._finger)
+        ]
+
+    def irange(
+        self,
+        lower: Hashable = None,
+        upper: Hashable = None,
+        lower_inclusive: bool = True,
+        upper_inclusive: bool = False,
+        reverse: bool = False,
+        mode: str = ITEMS,
+    ) -> Iterator[any]:
+        """Iterate the members with keys between lower and upper.
+
+        Items and values are yielded once per value, keys once per key.
+        Reversed scans also yield the values of each key last added
+        first. See AVLTree.irange for the rest.
+
+        O(logn + k) - Seeks to the first key then yields k members.
+        """
+        if mode not in _MODES:
+            raise ValueError(f"unknown mode: {mode!r}")
+        if mode == KEYS or mode == NODES:
+            return iter_range(
+                self._root, lower, upper, lower_inclusive, upper_inclusive, reverse, mode
+            )
+        nodes = iter_range(
+            self._root, lower, upper, lower_inclusive, upper_inclusive, reverse, NODES
+        )
+        return _flatten(nodes, reverse, mode)
+
+    def min(self) -> Tuple[Hashable, List[any]]:
+        """Return the smallest key and its values, see AVLTree.min"""
+        key, values = super().min()
+        return key, list(values)
+
+    def max(self) -> Tuple[Hashable, List[any]]:
+        """Return the largest key and its values, see AVLTree.max"""
+        key, values = super().max()
+        return key, list(values)
+
+    def update(
+        self,
+        iterable: Union[
+            Dict[Hashable, any],
+            Iterable[Tuple[Hashable, any]],
+            AVLTree
+        ] = None,
+        **kwargs
+    ) -> None:
+        """Add every (key, value) pair of iterable, see AVLTree.update"""
+        if isinstance(iterable, AVLMultiTree):
+            iterable = iterable.items()
+        super().update(iterable, **kwargs)
+
+    @classmethod
+    def join(
+        cls,
+        left: "AVLMultiTree",
+        key: Hashable,
+        right: "AVLMultiTree",
+        values: Iterable[any] = None
+    ) -> "AVLMultiTree":
+        """Join two trees around key with the given values into a new tree.
+
+        values must hold at least one value, like the values returned for
+        key by split. See AVLTree.join for the rest.
+
+        O(logn) - Only the spine of the taller tree is walked.
+        """
+        values = list(values or ())
+        if not values:
+            raise ValueError("join(): key needs at least one value")
+        return super().join(left, key, right, values)
+
+    def _walk(self, mode: str) -> Iterator[any]:
+        """Iterate the members in key order, see AVLTree.keys"""
+        if mode == KEYS:
+            return super()._walk(mode)
+        return InOrderIterator(
+            lambda reverse: _flatten(iter_in_order(self._root, reverse, NODES), reverse, mode)
+        )
+
+    def _new_node(self, key: Hashable, value: any) -> AVLNode:
+        """Allocate the node for a new key holding its first value"""
+        return super()._new_node(key, [value])
+
+    def _merge_value(self, node: AVLNode, value: any) -> None:
+        """Add value after the values node already holds"""
+        node.value.append(value)
+
+    def _set_value(self, node: AVLNode, value: Iterable[any]) -> None:
+        """Replace the values held by node, used by Cursor"""
+        values = list(value)
+        if not values:
+            raise ValueError("set_value(): key needs at least one value")
+        node.value = values
+
+    def _clone(self, root: AVLNode, memo: dict = None) -> AVLNode:
+        """Copy a subtree, the value lists are copied as well"""
+        root = super()._clone(root, memo)
+        if memo is None:
+            for node in iter_in_order(root, mode=NODES):
+                node.value = list(node.value)
+        return root
+
+    @staticmethod
+    def _pair(node: AVLNode) -> Optional[Tuple[Hashable, List[any]]]:
+        """Return the key and a copy of the values held by node or None"""
+        if node is None:
+            return None
+        return node.key, list(node.value)
+
+    @staticmethod
+    def _item(node: AVLNode, key: Hashable) -> Tuple[Hashable, List[any]]:
+        """Return the key and a copy of the values held by node"""
+        if node is None:
+            raise KeyError(key)
+        return node.key, list(node.value)
+
+
+def _flatten(nodes: Iterator[AVLNode], reverse: bool, mode: str) -> Iterator[any]:
+    """Yield one item or value per value held by nodes"""
+    if mode == VALUES:
+        if reverse:
+            return chain.from_iterable(reversed(n.value) for n in nodes)
+        return chain.from_iterable(n.value for n in nodes)
+    if reverse:
+        return ((n.key, v) for n in nodes for v in reversed(n.value))
+    return ((n.key, v) for n in nodes for v in n.value)
@@ -0,0 +1,206 @@
+"""Build and merge large trees with a pool of worker processes.
+
+Trees cannot be shared between processes, so the workers never see a
+node. The input is cut into disjoint key ranges and every worker sorts
+or merges one range and sends it back in the stream format of
+pyavl3.serialize. The parent turns each stream into a balanced subtree
+bottom-up in O(n) and joins the subtrees, whose key ranges follow each
+other, in O(logn) per join.
+
+Sorting and merging run in parallel. Turning streams into nodes does
+not, so the speedup is bounded by that share of the work.
+"""
+import io
+import os
+import random
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
+from typing import Callable, Dict, Hashable, Iterable, List, Tuple, Union
+
+from .avl_tree import AVLTree
+from .concurrent import ConcurrentAVLTree
+from .keyed_tree import KeyedAVLTree
+from .serialize import read_items, write_items
+
+
+# Ranges smaller than this are not worth a trip to another process
+MIN_PARTITION = 10000
+
+# Keys sampled per partition when choosing the range boundaries
+OVERSAMPLE = 32
+
+
+def build(
+    iterable: Union[Dict[Hashable, any], Iterable[Tuple[Hashable, any]]],
+    workers: int = None,
+    tree_type: type = AVLTree,
+) -> AVLTree:
+    """Build a tree of tree_type from (key, value) pairs in any order.
+
+    The pairs are sorted by key ranges in up to workers processes
+    (os.cpu_count() by default). Repeated keys keep the last value.
+
+    O(nlogn) - Sorting, split across the workers. The tree itself is
+               built in O(n).
+    """
+    _check_keyed(tree_type)
+    items = list(iterable.items() if isinstance(iterable, dict) else iterable)
+    workers = _workers(workers, len(items))
+    if workers == 1:
+        return tree_type.from_sorted(_sorted(items))
+
+    sample = random.Random(0).sample(items, min(len(items), workers * OVERSAMPLE))
+    sample.sort(key=itemgetter(0))
+    step = len(sample) / workers
+    splitters = [sample[int(i * step)][0] for i in range(1, workers)]
+
+    # Every copy of a key lands in the same bucket, in input order, so
+    # the stable sort in the worker keeps the last value.
+    buckets = [[] for _ in range(workers)]
+    for item in items:
+        buckets[bisect_right(splitters, item[0])].append(item)
+    del items
+
+    with ProcessPoolExecutor(workers) as pool:
+        streams = list(pool.map(_sort_stream, buckets))
+    return _stitch(tree_type, streams)
+
+
+def union(left: AVLTree, right: AVLTree, workers: int = None) -> AVLTree:
+    """Return a new tree with the members of both trees.
+
+    Values from right win for keys found in both, like AVLTree.union.
+    Both trees are left untouched.
+
+    O(n + m) - The key ranges are merged in parallel.
+    """
+    _check_keyed(type(left))
+    _check_keyed(type(right))
+    size = len(left) + len(right)
+    workers = _workers(workers, size)
+    if workers == 1:
+        return left.union(right)
+
+    bounds = [None] + _splitters(left if len(left) >= len(right) else right, workers) + [None]
+    ranges = list(zip(bounds, bounds[1:]))
+    with ProcessPoolExecutor(workers) as pool:
+        streams = list(pool.map(
+            _merge_streams,
+            (_dumps(left.irange(lo, hi)) for lo, hi in ranges),
+            (_dumps(right.irange(lo, hi)) for lo, hi in ranges),
+        ))
+    return _stitch(left._empty, streams)
+
+
+def update(tree: AVLTree, other: AVLTree, workers: int = None) -> None:
+    """Update tree with the members of other, in parallel.
+
+    Same result as tree.update(other), see union. A ConcurrentAVLTree
+    holds its write lock for the whole update.
+    """
+    if isinstance(tree, ConcurrentAVLTree):
+        with tree.lock.writing():
+            tree._replace(union(tree, other, workers))
+    else:
+        tree._replace(union(tree, other, workers))
+
+
+def _check_keyed(tree_type: type) -> None:
+    """Reject keyed trees, their ranges and joins go by original keys"""
+    if issubclass(tree_type, KeyedAVLTree):
+        raise TypeError("KeyedAVLTree is not supported by pyavl3.parallel")
+
+
+def _workers(workers: int, size: int) -> int:
+    """Number of processes worth starting for size items"""
+    workers = workers or os.cpu_count() or 1
+    return max(1, min(workers, size // MIN_PARTITION))
+
+
+def _splitters(tree: AVLTree, count: int) -> List[Hashable]:
+    """About count - 1 keys cutting tree into ranges of similar size.
+
+    The top levels of a balanced tree already split it evenly, so the
+    keys of the first count - 1 nodes in breadth-first order do.
+    """
+    keys = []
+    level = [tree.root] if tree.root is not None else []
+    while level and len(keys) < count - 1:
+        following = []
+        for node in level:
+            keys.append(node.key)
+            following.extend(n for n in (node.left, node.right) if n is not None)
+        level = following
+    return sorted(keys[:count - 1])
+
+
+def _sorted(items: List[Tuple[Hashable, any]]) -> List[Tuple[Hashable, any]]:
+    items.sort(key=itemgetter(0))
+    return items
+
+
+def _dumps(items: Iterable[Tuple[Hashable, any]]) -> bytes:
+    fp = io.BytesIO()
+    write_items(fp, items)
+    return fp.getvalue()
+
+
+def _loads(data: bytes) -> Iterable[Tuple[Hashable, any]]:
+    return read_items(io.BytesIO(data))
+
+
+def _sort_stream(items: List[Tuple[Hashable, any]]) -> bytes:
+    """Worker: sort one bucket and return it as a stream"""
+    items = _sorted(items)
+    # Drop all but the last of repeated keys
+    kept = [
+        item for item, following in zip(items, items[1:])
+        if item[0] < following[0]
+    ]
+    if items:
+        kept.append(items[-1])
+    return _dumps(kept)
+
+
+def _merge_streams(left: bytes, right: bytes) -> bytes:
+    """Worker: merge two sorted streams, right wins on equal keys"""
+    def merged():
+        a = iter(_loads(left))
+        b = iter(_loads(right))
+        x = next(a, None)
+        y = next(b, None)
+        while x is not None and y is not None:
+            if x[0] < y[0]:
+                yield x
+                x = next(a, None)
+            elif y[0] < x[0]:
+                yield y
+                y = next(b, None)
+            else:
+                yield y
+                x = next(a, None)
+                y = next(b, None)
+        if x is not None:
+            yield x
+            yield from a
+        if y is not None:
+            yield y
+            yield from b
+    return _dumps(merged())
+
+
+def _stitch(empty: Callable[[], AVLTree], streams: List[bytes]) -> AVLTree:
+    """Build a subtree per stream and join them in key order"""
+    tree = empty()
+    for data in streams:
+        part = empty()
+        part._load(_loads(data))
+        if not part:
+            continue
+        if not tree:
+            tree = part
+            continue
+        key, value = part.popmin()
+        tree = type(tree).join(tree, key, part, value)
+    return tree
@@ -0,0 +1,230 @@
+from typing import Hashable, Iterator, List, Optional, Tuple
+
+from .avl_node import AVLNode
+from .avl_tree import AVLTree
+
+
+class PersistentAVLTree(AVLTree):
+    """An AVLTree that never modifies a node once it is part of a tree.
+
+    Writes copy the O(logn) nodes on the path they touch and leave the
+    old nodes alone, so every earlier root still describes the tree as
+    it was. snapshot() hands out such a root in O(1) and old and new
+    versions share every node that was not rewritten.
+    """
+
+    def snapshot(self) -> "PersistentAVLTree":
+        """Return a read-only safe version of the tree as it is now.
+
+        The snapshot is a full PersistentAVLTree. Writing to either tree
+        never affects the other.
+
+        O(1) - The nodes are shared, not copied.
+        """
+        tree = self._empty()
+        tree._root = self._root
+        tree._n = self._n
+        tree._counted = self._counted
+        return tree
+
+    def copy(self, deep: bool = False) -> "PersistentAVLTree":
+        """A shallow copy of the tree, same as snapshot unless deep is True
+
+        O(1) - For shallow copies.
+        """
+        if deep:
+            return super().copy(deep)
+        return self.snapshot()
+
+    @classmethod
+    def join(
+        cls,
+        left: "PersistentAVLTree",
+        key: Hashable,
+        right: "PersistentAVLTree",
+        value: any = None
+    ) -> "PersistentAVLTree":
+        """Join two trees around a new key into a new tree.
+
+        Unlike AVLTree.join, left and right are left untouched.
+
+        O(logn) - Only the spine of the taller tree is copied.
+        """
+        return super().join(left.snapshot(), key, right.snapshot(), value)
+
+    def split(
+        self,
+        key: Hashable
+    ) -> Tuple["PersistentAVLTree", Optional[Tuple[Hashable, any]], "PersistentAVLTree"]:
+        """Split the tree into the members below key and above key.
+
+        Unlike AVLTree.split, this tree is left untouched.
+
+        O(logn) - Only the nodes on the search path are copied.
+        """
+        return AVLTree.split(self.snapshot(), key)
+
+    def _set_value(self, node: AVLNode, value: any) -> None:
+        """Copy the path to node instead of changing it in place"""
+        self._root = self._insert(self._root, node.key, value)
+
+    def _set_operation(self, operation, other):
+        """Run a set operation on the shared nodes, no clone needed"""
+        other = self._same_layout(other)
+        tree = self._empty()
+        tree._adopt(operation(self._root, other.root))
+        return tree
+
+    @classmethod
+    def _copy_node(cls, node: AVLNode) -> AVLNode:
+        """Return a new node with the same contents and children"""
+        copy = cls.node_type(node.key, node.value)
+        copy.left = node.left
+        copy.right = node.right
+        copy.height = node.height
+        return copy
+
+    @classmethod
+    def _relink(cls, path: List[AVLNode], dirs: List[bool], start: int) -> None:
+        """Point every node in path from start on at the next one"""
+        for i in range(max(start, 1), len(path)):
+            if dirs[i - 1]:
+                path[i - 1].left = path[i]
+            else:
+                path[i - 1].right = path[i]
+
+    def _copy_path(self, path: List[AVLNode], dirs: List[bool]) -> List[AVLNode]:
+        """Copy the nodes of a path and link the copies together"""
+        copy = self._copy_node
+        path = [copy(node) for node in path]
+        self._relink(path, dirs, 0)
+        return path
+
+    def _insert(self, root: AVLNode, key: Hashable, value: any) -> AVLNode:
+        """Insert or update a key, copying the path, return the new root."""
+        node, path, dirs = self._descend(root, key)
+        path = self._copy_path(path, dirs)
+
+        if node is not None:
+            node = self._copy_node(node)
+            node.value = value
+            if not path:
+                return node
+            if dirs[-1]:
+                path[-1].left = node
+            else:
+                path[-1].right = node
+            return path[0]
+
+        self._n += 1
+        root = path[0] if path else None
+        return self._retrace(root, path, dirs, self._new_node(key, value))
+
+    def _delete(self, root: AVLNode, key: Hashable) -> AVLNode:
+        """Remove a key, copying the path, return the new root."""
+        node, path, dirs = self._descend(root, key)
+        if node is None:
+            raise KeyError(key)
+
+        self._n -= 1
+        path = self._copy_path(path, dirs)
+        root = path[0] if path else None
+
+        if node.left is not None and node.right is not None:
+            # A copy of the successor takes the place of K and every
+            # node between the two is copied on the way down.
+            index = len(path)
+            chain = []
+            successor = node.right
+            while successor.left is not None:
+                chain.append(successor)
+                successor = successor.left
+
+            replacement = self._copy_node(successor)
+            replacement.left = node.left
+            replacement.right = node.right
+            replacement.height = node.height
+            path.append(replacement)
+            dirs.append(False)
+            for n in chain:
+                path.append(self._copy_node(n))
+                dirs.append(True)
+            self._relink(path, dirs, index)
+            child = successor.right
+
+        elif node.left is not None:
+            child = node.left
+
+        else:
+            child = node.right
+
+        if path:
+            root = path[0]
+        return self._retrace(root, path, dirs, child)
+
+    def _join(self, left: AVLNode, node: AVLNode, right: AVLNode) -> AVLNode:
+        """Join two subtrees around a copy of node, copying the spine."""
+        node = self._copy_node(node)
+        lh = -1 if left is None else left.height
+        rh = -1 if right is None else right.height
+
+        if lh > rh + 1:
+            spine = []
+            t = left
+            while t is not None and t.height > rh + 1:
+                spine.append(t)
+                t = t.right
+            dirs = [False] * len(spine)
+            spine = self._copy_path(spine, dirs)
+            node.left = t
+            node.right = right
+            self._update(node)
+            return self._retrace(spine[0], spine, dirs, node)
+
+        if rh > lh + 1:
+            spine = []
+            t = right
+            while t is not None and t.height > lh + 1:
+                spine.append(t)
+                t = t.left
+            dirs = [True] * len(spine)
+            spine = self._copy_path(spine, dirs)
+            node.left = left
+            node.right = t
+            self._update(node)
+            return self._retrace(spine[0], spine, dirs, node)
+
+        node.left = left
+        node.right = right
+        self._update(node)
+        return node
+
+    def _unlink_in_order(self) -> Iterator[AVLNode]:
+        """Yield copies of every node in key order, see AVLTree"""
+        copy = self._copy_node
+        for node in super()._unlink_in_order():
+            yield copy(node)
+
+    @classmethod
+    def _rebalance(cls, root: AVLNode) -> AVLNode:
+        """Rebalance the immediate subtree.
+
+        root must already be a private copy. The children that are
+        rotated are copied first since they may be shared.
+        """
+        balance = cls._compute_balance(root)
+
+        if balance > 1: # left heavy
+            root.left = cls._copy_node(root.left)
+            if cls._compute_balance(root.left) < 0:
+                root.left.right = cls._copy_node(root.left.right)
+                root.left = cls._rotate_left(root.left)
+            return cls._rotate_right(root)
+        elif balance < -1: # Right heavy
+            root.right = cls._copy_node(root.right)
+            if cls._compute_balance(root.right) > 0:
+                root.right.left = cls._copy_node(root.right.left)
+                root.right = cls._rotate_right(root.right)
+            return cls._rotate_left(root)
+
+        return root
@@ -0,0 +1,653 @@
+import sys
+from array import array
+from copy import deepcopy
+from typing import Dict, Hashable, Iterable, Iterator, List, Tuple, Union
+
+from .interface import ADTInterface
+from .search import _MODES, ITEMS, KEYS, VALUES
+
+
+# Index used for a missing child
+NIL = -1
+
+
+class PoolNode:
+    """A slot of a PoolAVLTree shaped like an AVLNode.
+
+    Created on demand for code that walks trees through their root.
+    """
+
+    __slots__ = ("_tree", "_index")
+
+    def __init__(self, tree: "PoolAVLTree", index: int) -> None:
+        self._tree = tree
+        self._index = index
+
+    @property
+    def key(self) -> Hashable:
+        return self._tree._keys[self._index]
+
+    @property
+    def value(self) -> any:
+        return self._tree._values[self._index]
+
+    @property
+    def left(self) -> "PoolNode":
+        return self._tree._node(self._tree._left[self._index])
+
+    @property
+    def right(self) -> "PoolNode":
+        return self._tree._node(self._tree._right[self._index])
+
+    @property
+    def height(self) -> int:
+        return self._tree._height[self._index]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PoolNode):
+            return NotImplemented
+        return self._tree is other._tree and self._index == other._index
+
+    def __hash__(self) -> int:
+        return hash((id(self._tree), self._index))
+
+    def __repr__(self):
+        return f"<PoolNode key={self.key}, value={self.value}, height={self.height}>"
+
+
+class PoolAVLTree(ADTInterface):
+    """An AVL tree stored as parallel arrays instead of node objects.
+
+    Every node is an index. Child links and heights live in typed
+    arrays and keys and values in two lists, so a tree of any size is a
+    handful of objects as far as the garbage collector is concerned.
+    Freed slots are chained through the right link array and reused.
+    """
+
+    @property
+    def root(self) -> PoolNode:
+        """Gets the current root"""
+        return self._node(self._root)
+
+    def __init__(
+        self,
+        iterable: Union[
+            Dict[Hashable, any],
+            Iterable[Tuple[Hashable, any]],
+            ADTInterface
+        ] = None,
+        **kwargs,
+    ) -> None:
+        self.clear()
+
+        if isinstance(iterable, dict):
+            self._load(iterable.items())
+        elif isinstance(iterable, ADTInterface):
+            self._load(iterable.items())
+        elif iterable is not None:
+            self._load(iterable)
+
+        for k, v in kwargs.items():
+            self[k] = v
+
+    def __getitem__(self, key: Hashable) -> any:
+        """Get the value at the given key.
+
+        If the key is not found, a KeyError will be raised.
+
+        O(logn) - The AVL tree is balanced, h is always near log(n).
+        """
+        i = self._get(key)
+        if i == NIL:
+            raise KeyError(key)
+        return self._values[i]
+
+    def __setitem__(self, key: Hashable, value: any) -> None:
+        """Add or Update the given key using the given value.
+
+        O(logn) - The AVL tree is balanced, h is always near log(n).
+        """
+        keys = self._keys
+        left = self._left
+        right = self._right
+        path = []
+        dirs = []
+        i = self._root
+        while i != NIL:
+            k = keys[i]
+            if key < k:
+                path.append(i)
+                dirs.append(True)
+                i = left[i]
+            elif k < key:
+                path.append(i)
+                dirs.append(False)
+                i = right[i]
+            else:
+                self._values[i] = value
+                return
+        i = self._alloc(key, value)
+        self._n += 1
+        self._root = self._retrace(path, dirs, i)
+
+    def __delitem__(self, key: Hashable) -> None:
+        """Remove the given key from the tree.
+
+        O(logn) - The AVL tree is balanced, h is always near log(n).
+        """
+        self._delete(key)
+
+    def __len__(self) -> int:
+        """Return the count of members in the tree.
+
+        O(1) - length is maintained during operations that modify it.
+        """
+        return self._n
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Check if a given key exists in the tree
+
+        O(logn) - The AVL tree is balanced, h is always near log(n).
+        """
+        return self._get(key) != NIL
+
+    def __iter__(self) -> Iterator[Hashable]:
+        """Iterate the keys in order
+
+        O(n) - and that is all i am going to say about that.
+        """
+        return self.keys()
+
+    def __repr__(self) -> str:
+        """Return a string reprsentation of the tree in breadth-first order
+
+        O(n) - This repr prints every member much like dict.
+        """
+        keys = self._keys
+        values = self._values
+        parts = []
+        level = [self._root] if self._root != NIL else []
+        while level:
+            following = []
+            for i in level:
+                parts.append(f"{keys[i]}: {values[i]}")
+                if self._left[i] != NIL:
+                    following.append(self._left[i])
+                if self._right[i] != NIL:
+                    following.append(self._right[i])
+            level = following
+        s = ", ".join(parts)
+        return f"<AVL {{{s}}}>"
+
+    def __bool__(self) -> bool:
+        """Return True if the Tree has members. Else, false.
+
+        O(1) - because root is not null.
+        """
+        return self._root != NIL
+
+    def get(self, key: Hashable, default: any = None) -> any:
+        """Get the value at the given key or default.
+
+        O(logn) - The AVL tree is balanced, h is always near log(n).
+        """
+        i = self._get(key)
+        if i == NIL:
+            return default
+        return self._values[i]
+
+    def keys(self) -> Iterator[Hashable]:
+        """Iterate the keys in order"""
+        keys = self._keys
+        return (keys[i] for i in self._in_order())
+
+    def values(self) -> Iterator[any]:
+        """Iterate the values in key order"""
+        values = self._values
+        return (values[i] for i in self._in_order())
+
+    def items(self) -> Iterator[Tuple[Hashable, any]]:
+        """Iterate the (key, value) items in key order"""
+        keys = self._keys
+        values = self._values
+        return ((keys[i], values[i]) for i in self._in_order())
+
+    def irange(
+        self,
+        lower: Hashable = None,
+        upper: Hashable = None,
+        lower_inclusive: bool = True,
+        upper_inclusive: bool = False,
+        reverse: bool = False,
+        mode: str = ITEMS,
+    ) -> Iterator[any]:
+        """Iterate the members with keys between lower and upper.
+
+        Same arguments as AVLTree.irange, so every search in
+        pyavl3.search works on pool trees.
+
+        O(logn + k) - Seeks to the first member then yields k members.
+        """
+        if mode not in _MODES:
+            raise ValueError(f"unknown mode: {mode!r}")
+        if reverse:
+            indexes = self._backward(lower, upper, lower_inclusive, upper_inclusive)
+        else:
+            indexes = self._forward(lower, upper, lower_inclusive, upper_inclusive)
+
+        keys = self._keys
+        values = self._values
+        if mode == ITEMS:
+            return ((keys[i], values[i]) for i in indexes)
+        elif mode == KEYS:
+            return (keys[i] for i in indexes)
+        elif mode == VALUES:
+            return (values[i] for i in indexes)
+        return (PoolNode(self, i) for i in indexes)
+
+    def clear(self) -> None:
+        """Clear all nodes from the tree.
+
+        O(1) - The pools are replaced, not emptied.
+        """
+        self._left = array("i")
+        self._right = array("i")
+        self._height = array("b")
+        self._keys: List[Hashable] = []
+        self._values: List[any] = []
+        self._root = NIL
+        self._free = NIL
+        self._n = 0
+
+    def copy(self, deep: bool = False) -> "PoolAVLTree":
+        """A shallow copy of the tree
+
+        If deep is True, keys and values are copied with copy.deepcopy.
+
+        O(n) - Every pool is copied as a block.
+        """
+        if deep:
+            return deepcopy(self)
+        tree = object.__new__(self.__class__)
+        tree.__dict__.update(self.__dict__)
+        tree._left = self._left[:]
+        tree._right = self._right[:]
+        tree._height = self._height[:]
+        tree._keys = self._keys[:]
+        tree._values = self._values[:]
+        return tree
+
+    def setdefault(self, key: Hashable, value: any) -> None:
+        """Insert key with the given value into the tree if it does not exist.
+
+        O(logn) - The AVL tree is balanced, h is always near log(n).
+        """
+        if key not in self:
+            self[key] = value
+
+    def update(
+        self,
+        iterable: Union[
+            Dict[Hashable, any],
+            Iterable[Tuple[Hashable, any]],
+            ADTInterface
+        ] = None,
+        **kwargs
+    ) -> None:
+        """Update the tree using keys from given iterable
+
+        O(vlogn) - where v is the number of items being updated.
+        """
+        if isinstance(iterable, (dict, ADTInterface)):
+            iterable = iterable.items()
+        if iterable is None:
+            pass
+        elif self._root == NIL:
+            # Deletes leave freed slots behind, start from fresh pools.
+            self.clear()
+            self._load(iterable)
+        else:
+            for k, v in iterable:
+                self[k] = v
+        for k, v in kwargs.items():
+            self[k] = v
+
+    def pop(self, key: Hashable) -> any:
+        """Pop an item out of the Tree and return the value.
+
+        O(logn) - The AVL tree is balanced, h is always near log(n).
+        """
+        _, value = self.popitem(key)
+        return value
+
+    def popitem(self, key: Hashable) -> Tuple[Hashable, any]:
+        """Pop an item out of the Tree and return the key and value.
+
+        O(logn) - The AVL tree is balanced, h is always near log(n).
+        """
+        return self._delete(key)
+
+    @classmethod
+    def fromkeys(cls, iterable: Iterable[Hashable], value: any = None) -> "PoolAVLTree":
+        """Returns a new tree with keys from iterable and values equal to value.
+
+        O(n) - When the keys are sorted, O(nlogn) otherwise.
+        """
+        return cls((k, value) for k in iterable)
+
+    def memory_usage(self) -> Dict[str, any]:
+        """Report the number of bytes used by the tree.
+
+        "tree" covers the tree object, "pools" the link and height arrays
+        and the key and value lists. Keys and values themselves are not
+        included. "total" is the sum and "per_entry" divides it by the
+        number of entries.
+
+        O(1) - Only the pools are measured.
+        """
+        getsizeof = sys.getsizeof
+        pools = sum(getsizeof(pool) for pool in (
+            self._left,
+            self._right,
+            self._height,
+            self._keys,
+            self._values,
+        ))
+        tree = object.__sizeof__(self)
+        total = tree + pools
+        return {
+            "entries": self._n,
+            "tree": tree,
+            "pools": pools,
+            "total": total,
+            "per_entry": total / self._n if self._n else 0.0,
+        }
+
+    def _node(self, i: int) -> PoolNode:
+        if i == NIL:
+            return None
+        return PoolNode(self, i)
+
+    def _alloc(self, key: Hashable, value: any) -> int:
+        """Take a free slot, or grow the pools, for a new leaf"""
+        i = self._free
+        if i == NIL:
+            # Keys and values first, typed pools may refuse them
+            self._keys.append(key)
+            try:
+                self._values.append(value)
+            except Exception:
+                self._keys.pop()
+                raise
+            self._left.append(NIL)
+            self._right.append(NIL)
+            self._height.append(0)
+            return len(self._keys) - 1
+
+        self._keys[i] = key
+        self._values[i] = value
+        self._free = self._right[i]
+        self._left[i] = NIL
+        self._right[i] = NIL
+        self._height[i] = 0
+        return i
+
+    def _release(self, i: int) -> None:
+        """Return a slot to the free list"""
+        self._keys[i] = None
+        self._values[i] = None
+        self._right[i] = self._free
+        self._free = i
+
+    def _get(self, key: Hashable) -> int:
+        """Find the slot holding key, NIL if it is missing"""
+        keys = self._keys
+        left = self._left
+        right = self._right
+        i = self._root
+        while i != NIL:
+            k = keys[i]
+            if key < k:
+                i = left[i]
+            elif k < key:
+                i = right[i]
+            else:
+                return i
+        return NIL
+
+    def _delete(self, key: Hashable) -> Tuple[Hashable, any]:
+        """Remove key from the tree and return its item"""
+        keys = self._keys
+        left = self._left
+        right = self._right
+        path = []
+        dirs = []
+        i = self._root
+        while i != NIL:
+            k = keys[i]
+            if key < k:
+                path.append(i)
+                dirs.append(True)
+                i = left[i]
+            elif k < key:
+                path.append(i)
+                dirs.append(False)
+                i = right[i]
+            else:
+                break
+        else:
+            raise KeyError(key)
+
+        item = keys[i], self._values[i]
+        self._n -= 1
+
+        if left[i] != NIL and right[i] != NIL:
+            # Unlink the successor and put it in this slot's place, so
+            # every other slot keeps its item.
+            at = len(path)
+            path.append(i)
+            dirs.append(False)
+            j = right[i]
+            while left[j] != NIL:
+                path.append(j)
+                dirs.append(True)
+                j = left[j]
+            child = right[j]
+            path[at] = j
+            left[j] = left[i]
+            if j != right[i]:
+                right[j] = right[i]
+            self._height[j] = self._height[i]
+            if at:
+                if dirs[at - 1]:
+                    left[path[at - 1]] = j
+                else:
+                    right[path[at - 1]] = j
+        else:
+            child = left[i] if left[i] != NIL else right[i]
+        self._release(i)
+        self._root = self._retrace(path, dirs, child)
+        return item
+
+    def _retrace(self, path: List[int], dirs: List[bool], child: int) -> int:
+        """Attach child below the end of path, rebalance, return the root"""
+        left = self._left
+        right = self._right
+        height = self._height
+        while path:
+            parent = path.pop()
+            if dirs.pop():
+                left[parent] = child
+            else:
+                right[parent] = child
+            before = height[parent]
+            self._fix(parent)
+            child = self._rebalance(parent)
+            if child == parent and height[parent] == before:
+                return path[0] if path else parent
+        return child
+
+    def _fix(self, i: int) -> None:
+        """Recompute the height of slot i from its children"""
+        left = self._left[i]
+        right = self._right[i]
+        lh = -1 if left == NIL else self._height[left]
+        rh = -1 if right == NIL else self._height[right]
+        self._height[i] = (lh if lh > rh else rh) + 1
+
+    def _balance(self, i: int) -> int:
+        left = self._left[i]
+        right = self._right[i]
+        lh = -1 if left == NIL else self._height[left]
+        rh = -1 if right == NIL else self._height[right]
+        return lh - rh
+
+    def _rebalance(self, i: int) -> int:
+        """Rebalance the subtree at slot i, return its new root"""
+        balance = self._balance(i)
+        if balance > 1:
+            if self._balance(self._left[i]) < 0:
+                self._left[i] = self._rotate_left(self._left[i])
+            return self._rotate_right(i)
+        elif balance < -1:
+            if self._balance(self._right[i]) > 0:
+                self._right[i] = self._rotate_right(self._right[i])
+            return self._rotate_left(i)
+        return i
+
+    def _rotate_right(self, x: int) -> int:
+        left = self._left
+        y = left[x]
+        left[x] = self._right[y]
+        self._right[y] = x
+        self._fix(x)
+        self._fix(y)
+        return y
+
+    def _rotate_left(self, y: int) -> int:
+        right = self._right
+        x = right[y]
+        right[y] = self._left[x]
+        self._left[x] = y
+        self._fix(y)
+        self._fix(x)
+        return x
+
+    def _in_order(self) -> Iterator[int]:
+        """Yield every slot in key order"""
+        left = self._left
+        right = self._right
+        stack = []
+        i = self._root
+        while stack or i != NIL:
+            while i != NIL:
+                stack.append(i)
+                i = left[i]
+            i = stack.pop()
+            yield i
+            i = right[i]
+
+    def _forward(self, lower, upper, lower_inclusive, upper_inclusive) -> Iterator[int]:
+        """Slots in key order from lower to upper, see pyavl3.search"""
+        keys = self._keys
+        left = self._left
+        right = self._right
+        stack = []
+        i = self._root
+        while i != NIL:
+            k = keys[i]
+            if lower is None or (not k < lower if lower_inclusive else lower < k):
+                stack.append(i)
+                i = left[i]
+            else:
+                i = right[i]
+
+        while stack:
+            i = stack.pop()
+            if upper is not None:
+                k = keys[i]
+                if (upper < k) if upper_inclusive else (not k < upper):
+                    return
+            yield i
+            i = right[i]
+            while i != NIL:
+                stack.append(i)
+                i = left[i]
+
+    def _backward(self, lower, upper, lower_inclusive, upper_inclusive) -> Iterator[int]:
+        """Slots in reverse key order from upper to lower"""
+        keys = self._keys
+        left = self._left
+        right = self._right
+        stack = []
+        i = self._root
+        while i != NIL:
+            k = keys[i]
+            if upper is None or (not upper < k if upper_inclusive else k < upper):
+                stack.append(i)
+                i = right[i]
+            else:
+                i = left[i]
+
+        while stack:
+            i = stack.pop()
+            if lower is not None:
+                k = keys[i]
+                if (k < lower) if lower_inclusive else (not lower < k):
+                    return
+            yield i
+            i = left[i]
+            while i != NIL:
+                stack.append(i)
+                i = right[i]
+
+    def _load(self, iterable: Iterable[Tuple[Hashable, any]]) -> None:
+        """Fill an empty tree, bottom-up while the pairs arrive sorted"""
+        keys = self._keys
+        values = self._values
+        pairs = iter(iterable)
+        for k, v in pairs:
+            if keys and not keys[-1] < k:
+                if k < keys[-1]:
+                    break
+                values[-1] = v
+                continue
+            keys.append(k)
+            values.append(v)
+        else:
+            self._link_sorted()
+            return
+
+        self._link_sorted()
+        self[k] = v
+        for k, v in pairs:
+            self[k] = v
+
+    def _link_sorted(self) -> None:
+        """Link the slots of sorted keys into a balanced tree"""
+        n = len(self._keys)
+        self._left = array("i", [NIL]) * n
+        self._right = array("i", [NIL]) * n
+        self._height = array("b", [0]) * n
+        self._n = n
+        if n == 0:
+            self._root = NIL
+            return
+
+        # A subtree over slots [lo, hi) is rooted at its middle slot and
+        # its height only depends on its size.
+        left = self._left
+        right = self._right
+        height = self._height
+        self._root = (n - 1) // 2
+        stack = [(0, n)]
+        while stack:
+            lo, hi = stack.pop()
+            mid = (lo + hi - 1) // 2
+            height[mid] = (hi - lo).bit_length() - 1
+            if lo < mid:
+                left[mid] = (lo + mid - 1) // 2
+                stack.append((lo, mid))
+            if mid + 1 < hi:
+                right[mid] = (mid + hi) // 2
+                stack.append((mid + 1, hi))
@@ -1,108 +1,219 @@
-from typing import Hashable, Tuple, Generator
-from collections import deque
+from typing import Hashable, Tuple, Generator, Iterator
 
+from .avl_node import AVLNode
 from .interface import ADTInterface, SearchAlgorithm
 
 
-class GreatherThanSearch(SearchAlgorithm):
-
-    def __init__(self, limit: Hashable):
-        self._limit = limit
+# What a range iterator yields for each node.
+KEYS = "keys"
+VALUES = "values"
+ITEMS = "items"
+NODES = "nodes"
+
+_MODES = {KEYS: 0, VALUES: 1, ITEMS: 2, NODES: 3}
+
+
+def iter_range(
+    root: AVLNode,
+    lower: Hashable = None,
+    upper: Hashable = None,
+    lower_inclusive: bool = True,
+    upper_inclusive: bool = False,
+    reverse: bool = False,
+    mode: str = ITEMS,
+) -> Iterator[any]:
+    """Iterate the nodes of a subtree whose keys fall between two bounds.
+
+    A bound of None leaves that end of the range open. The iterator
+    seeks to the first node in O(logn) and then steps from node to node
+    using a stack of ancestors, so it stops as soon as the far bound is
+    passed. Works on anything shaped like an AVLNode (key, value, left
+    and right attributes).
+    """
+    if mode not in _MODES:
+        raise ValueError(f"unknown mode: {mode!r}")
+    if reverse:
+        return _backward(root, lower, upper, lower_inclusive, upper_inclusive, _MODES[mode])
+    return _forward(root, lower, upper, lower_inclusive, upper_inclusive, _MODES[mode])
+
+
+def _forward(root, lower, upper, lower_inclusive, upper_inclusive, mode):
+    # Seek: keep every node at or after the lower bound on the stack,
+    # they are the in-order successors still to visit.
+    stack = []
+    node = root
+    if lower is None:
+        while node is not None:
+            stack.append(node)
+            node = node.left
+    elif lower_inclusive:
+        while node is not None:
+            if node.key < lower:
+                node = node.right
+            else:
+                stack.append(node)
+                node = node.left
+    else:
+        while node is not None:
+            if lower < node.key:
+                stack.append(node)
+                node = node.left
+            else:
+                node = node.right
+
+    bounded = upper is not None
+    while stack:
+        node = stack.pop()
+        if bounded:
+            key = node.key
+            if upper_inclusive:
+                if upper < key:
+                    return
+            elif not key < upper:
+                return
+
+        if mode == 2:
+            yield node.key, node.value
+        elif mode == 0:
+            yield node.key
+        elif mode == 1:
+            yield node.value
+        else:
+            yield node
+
+        node = node.right
+        while node is not None:
+            stack.append(node)
+            node = node.left
+
+
+def _backward(root, lower, upper, lower_inclusive, upper_inclusive, mode):
+    # Mirror image of _forward, seeking to the upper bound and
+    # walking predecessors down to the lower bound.
+    stack = []
+    node = root
+    if upper is None:
+        while node is not None:
+            stack.append(node)
+            node = node.right
+    elif upper_inclusive:
+        while node is not None:
+            if upper < node.key:
+                node = node.left
+            else:
+                stack.append(node)
+                node = node.right
+    else:
+        while node is not None:
+            if node.key < upper:
+                stack.append(node)
+                node = node.right
+            else:
+                node = node.left
+
+    bounded = lower is not None
+    while stack:
+        node = stack.pop()
+        if bounded:
+            key = node.key
+            if lower_inclusive:
+                if key < lower:
+                    return
+            elif not lower < key:
+                return
+
+        if mode == 2:
+            yield node.key, node.value
+        elif mode == 0:
+            yield node.key
+        elif mode == 1:
+            yield node.value
+        else:
+            yield node
+
+        node = node.left
+        while node is not None:
+            stack.append(node)
+            node = node.right
+
+
+class RangeSearch(SearchAlgorithm):
+
+    def __init__(
+        self,
+        lower: Hashable = None,
+        upper: Hashable = None,
+        lower_inclusive: bool = True,
+        upper_inclusive: bool = False,
+        reverse: bool = False,
+        mode: str = ITEMS,
+    ):
+        if mode not in _MODES:
+            raise ValueError(f"unknown mode: {mode!r}")
+        self._lower = lower
+        self._upper = upper
+        self._lower_inclusive = lower_inclusive
+        self._upper_inclusive = upper_inclusive
+        self._reverse = reverse
+        self._mode = mode
 
     def __call__(self, tree: ADTInterface) -> Generator[Tuple[Hashable, any], None, None]:
-        q = deque([(0, tree.root)])
-        while q:
-            v, n = q.pop()
-            if n is None:
-                continue
-            elif v == 0:
-                if n.key <= self._limit:
-                    q.append((0, n.right))
-                elif n.key > self._limit:
-                    q.append((0, n.right))
-                    q.append((1, n))
-                    q.append((0, n.left))
-            elif v == 1:
-                yield n.key, n.value
-
-
-class GreatherThanOrEqualSearch(SearchAlgorithm):
-
-    def __init__(self, limit: Hashable):
-        self._limit = limit
+        # Trees can provide their own range iterator, anything else is
+        # walked through its root node.
+        irange = getattr(tree, "irange", None)
+        if irange is None:
+            return iter_range(
+                tree.root,
+                self._lower,
+                self._upper,
+                self._lower_inclusive,
+                self._upper_inclusive,
+                self._reverse,
+                self._mode,
+            )
+        return irange(
+            self._lower,
+            self._upper,
+            self._lower_inclusive,
+            self._upper_inclusive,
+            self._reverse,
+            self._mode,
+        )
 
-    def __call__(self, tree: ADTInterface) -> Generator[Tuple[Hashable, any], None, None]:
-        q = deque([(0, tree.root)])
-        while q:
-            v, n = q.pop()
-            if n is None:
-                continue
-            elif v == 0:
-                if n.key < self._limit:
-                    q.append((0, n.right))
-                elif n.key >= self._limit:
-                    q.append((0, n.right))
-                    q.append((1, n))
-                    q.append((0, n.left))
-            elif v == 1:
-                yield n.key, n.value
-
-
-class LessThanSearch(SearchAlgorithm):
-
-    def __init__(self, limit: Hashable):
-        self._limit = limit
 
-    def __call__(self, tree: ADTInterface) -> Generator[Tuple[Hashable, any], None, None]:
-        q = deque([(0, tree.root)])
-        while q:
-            v, n = q.pop()
-            if n is None:
-                continue
-            elif v == 0:
-                if n.key >= self._limit:
-                    q.append((0, n.left))
-                elif n.key < self._limit:
-                    q.append((0, n.right))
-                    q.append((1, n))
-                    q.append((0, n.left))
-            elif v == 1:
-                yield n.key, n.value
-
-
-class LessThanOrEqualSearch(SearchAlgorithm):
-
-    def __init__(self, limit: Hashable):
-        self._limit = limit
+class GreatherThanSearch(RangeSearch):
 
-    def __call__(self, tree: ADTInterface) -> Generator[Tuple[Hashable, any], None, None]:
-        q = deque([(0, tree.root)])
-        while q:
-            v, n = q.pop()
-            if n is None:
-                continue
-            elif v == 0:
-                if n.key > self._limit:
-                    q.append((0, n.left))
-                elif n.key <= self._limit:
-                    q.append((0, n.right))
-                    q.append((1, n))
-                    q.append((0, n.left))
-            elif v == 1:
-                yield n.key, n.value
-
-
-class BetweenSearch(SearchAlgorithm):
-
-    def __init__(self, lower: Hashable, upper: Hashable):
-        self._lower = lower
-        self._upper = upper
+    def __init__(self, limit: Hashable, reverse: bool = False, mode: str = ITEMS):
+        super().__init__(lower=limit, lower_inclusive=False, reverse=reverse, mode=mode)
 
-    def __call__(self, tree: ADTInterface) -> Generator[Tuple[Hashable, any], None, None]:
-        greater_search = GreatherThanSearch(self._lower)
-        for k, v in greater_search(tree):
-            # Take advantage of the fact that these searches
-            # return using in-order traversal
-            if k >= self._upper:
-                break;
-            yield k, v
+
+class GreatherThanOrEqualSearch(RangeSearch):
+
+    def __init__(self, limit: Hashable, reverse: bool = False, mode: str = ITEMS):
+        super().__init__(lower=limit, lower_inclusive=True, reverse=reverse, mode=mode)
+
+
+class LessThanSearch(RangeSearch):
+
+    def __init__(self, limit: Hashable, reverse: bool = False, mode: str = ITEMS):
+        super().__init__(upper=limit, upper_inclusive=False, reverse=reverse, mode=mode)
+
+
+class LessThanOrEqualSearch(RangeSearch):
+
+    def __init__(self, limit: Hashable, reverse: bool = False, mode: str = ITEMS):
+        super().__init__(upper=limit, upper_inclusive=True, reverse=reverse, mode=mode)
+
+
+class BetweenSearch(RangeSearch):
+
+    def __init__(
+        self,
+        lower: Hashable,
+        upper: Hashable,
+        lower_inclusive: bool = False,
+        upper_inclusive: bool = False,
+        reverse: bool = False,
+        mode: str = ITEMS,
+    ):
+        super().__init__(lower, upper, lower_inclusive, upper_inclusive, reverse, mode)
@@ -0,0 +1,74 @@
+"""Compact streaming format for the items of a tree.
+
+A stream starts with MAGIC followed by chunks. Each chunk is a 4 byte
+little-endian length and that many bytes holding a pickled pair of
+lists, the keys and the values of up to chunk_size items. A chunk of
+length 0 ends the stream.
+
+Items are written in key order, so a stream can be turned back into a
+tree bottom-up in O(n) while holding only one chunk in memory at a time.
+"""
+import pickle
+from struct import Struct
+from typing import BinaryIO, Hashable, Iterable, Iterator, Tuple
+
+
+MAGIC = b"AVL3\x01"
+CHUNK_SIZE = 4096
+
+_LENGTH = Struct("<I")
+
+
+def write_items(
+    fp: BinaryIO,
+    items: Iterable[Tuple[Hashable, any]],
+    chunk_size: int = CHUNK_SIZE,
+) -> int:
+    """Write (key, value) pairs to a binary file, return the count written"""
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+
+    fp.write(MAGIC)
+    count = 0
+    keys = []
+    values = []
+    for k, v in items:
+        keys.append(k)
+        values.append(v)
+        if len(keys) == chunk_size:
+            _write_chunk(fp, keys, values)
+            count += len(keys)
+            keys = []
+            values = []
+
+    if keys:
+        _write_chunk(fp, keys, values)
+        count += len(keys)
+
+    fp.write(_LENGTH.pack(0))
+    return count
+
+
+def read_items(fp: BinaryIO) -> Iterator[Tuple[Hashable, any]]:
+    """Read back the (key, value) pairs written by write_items"""
+    if fp.read(len(MAGIC)) != MAGIC:
+        raise ValueError("not a pyavl3 stream")
+
+    while True:
+        header = fp.read(_LENGTH.size)
+        if len(header) != _LENGTH.size:
+            raise EOFError("pyavl3 stream is truncated")
+        size, = _LENGTH.unpack(header)
+        if size == 0:
+            return
+        payload = fp.read(size)
+        if len(payload) != size:
+            raise EOFError("pyavl3 stream is truncated")
+        keys, values = pickle.loads(payload)
+        yield from zip(keys, values)
+
+
+def _write_chunk(fp: BinaryIO, keys: list, values: list) -> None:
+    payload = pickle.dumps((keys, values), pickle.HIGHEST_PROTOCOL)
+    fp.write(_LENGTH.pack(len(payload)))
+    fp.write(payload)
@@ -0,0 +1,274 @@
+"""Opt-in counters for the AVLTree hot paths.
+
+AVLTree.enable_stats() switches a tree to an instrumented subclass of
+its own class which counts, on top of the regular work:
+
+    comparisons  - key comparisons made while descending to a key,
+                   including neighbour lookups and batch lookups
+    rotations    - "single" and "double" rotations done by rebalancing
+    allocations  - nodes allocated by inserts, bulk loads and merges
+    depth        - a histogram of how many nodes each descent visited
+    latency      - count, total, mean and max time of each operation
+
+disable_stats() switches back, so trees that never enable stats run
+exactly the code they always did.
+"""
+from functools import partial
+from time import perf_counter_ns
+from typing import Callable, Dict, Hashable, Iterable, Iterator, List, Tuple
+
+from .avl_node import AVLNode
+from .avl_tree import AVLTree
+
+
+# Operations timed by instrumented trees
+TIMED = (
+    "__getitem__",
+    "__setitem__",
+    "__delitem__",
+    "__contains__",
+    "get",
+    "setdefault",
+    "pop",
+    "popitem",
+    "floor",
+    "ceiling",
+    "lower",
+    "higher",
+    "min",
+    "max",
+    "popmin",
+    "popmax",
+)
+
+# Writes made through a Cursor, timed under these names
+CURSOR_TIMED = {
+    "_set_value": "cursor.set_value",
+    "_cursor_delete": "cursor.delete",
+}
+
+_classes = {}
+
+
+def instrumented(cls: type) -> type:
+    """Return the instrumented subclass of cls, created once per class.
+
+    The counting overrides of Instrumented sit between cls and AVLTree,
+    so overrides in cls (say the tombstone check of LazyAVLTree) still
+    wrap the primitives being counted. The timed public methods sit in
+    front of cls, and so does the rotation count, since some classes
+    (PersistentAVLTree) rebalance without calling up to AVLTree.
+    """
+    if issubclass(cls, Instrumented):
+        return cls
+    try:
+        return _classes[cls]
+    except KeyError:
+        bases = (Instrumented,) if cls is AVLTree else (cls, Instrumented)
+        sub = type(
+            f"Instrumented{cls.__name__}",
+            bases,
+            {"__slots__": (), "__module__": __name__},
+        )
+        sub._base = cls
+        for name in TIMED:
+            setattr(sub, name, _timed(sub, name))
+        for name, label in CURSOR_TIMED.items():
+            setattr(sub, name, _timed(sub, name, label))
+        sub._rebalance = _rebalance(sub)
+        sub.__reduce__ = _reduce(sub)
+        _classes[cls] = sub
+        return sub
+
+
+def _timed(sub: type, name: str, label: str = None):
+    label = label or name
+
+    def timed(self, *args, **kwargs):
+        start = perf_counter_ns()
+        try:
+            return getattr(super(sub, self), name)(*args, **kwargs)
+        finally:
+            self._record(label, perf_counter_ns() - start)
+    timed.__name__ = name
+    return timed
+
+
+def _rebalance(sub: type):
+    def _rebalance(self, root: AVLNode) -> AVLNode:
+        balance = self._compute_balance(root)
+        if balance > 1:
+            kind = "double" if self._compute_balance(root.left) < 0 else "single"
+            self._stats["rotations"][kind] += 1
+        elif balance < -1:
+            kind = "double" if self._compute_balance(root.right) > 0 else "single"
+            self._stats["rotations"][kind] += 1
+        return super(sub, self)._rebalance(root)
+    return _rebalance
+
+
+def _reduce(sub: type):
+    def __reduce__(self) -> tuple:
+        # Pickle as the plain class, the counters are not kept.
+        restore, (_, *state) = super(sub, self).__reduce__()
+        return restore, (self._base, *state)
+    return __reduce__
+
+
+class _Probe:
+    """Stands in for a key during a walk, counting what it is compared to
+
+    Walks that only read the tree are handed a probe instead of the key.
+    Comparisons written as node.key < key reach the probe through the
+    reflected operator, as they do for any key type that returns
+    NotImplemented for types it does not know.
+    """
+
+    __slots__ = ("key", "depth", "comparisons", "_last")
+
+    def __init__(self, key: Hashable) -> None:
+        self.key = key
+        self.depth = 0
+        self.comparisons = 0
+        self._last = self
+
+    def _seen(self, other: Hashable) -> None:
+        self.comparisons += 1
+        if other is not self._last:
+            # A new node, walks compare against one node at a time.
+            self.depth += 1
+            self._last = other
+
+    def __lt__(self, other: Hashable) -> bool:
+        self._seen(other)
+        return self.key < other
+
+    def __gt__(self, other: Hashable) -> bool:
+        self._seen(other)
+        return self.key > other
+
+
+class Instrumented(AVLTree):
+    """Counting overrides placed between a tree class and AVLTree"""
+
+    # Same base and no new slots, so a tree can switch its __class__
+    # to and from the instrumented subclass.
+    __slots__ = ()
+
+    _base: type
+
+    def __init__(self, *args, **kwargs) -> None:
+        # Trees made from an instrumented tree (copies, splits, set
+        # operations) start with their own empty counters.
+        self.reset_stats()
+        super().__init__(*args, **kwargs)
+
+    def enable_stats(self) -> None:
+        pass
+
+    def disable_stats(self) -> None:
+        self.__class__ = self._base
+        del self._stats
+
+    def stats(self) -> Dict[str, any]:
+        stats = self._stats
+        latency = {}
+        for name, (count, total, worst) in sorted(stats["latency"].items()):
+            latency[name] = {
+                "count": count,
+                "total_s": total / 1e9,
+                "mean_us": total / count / 1e3,
+                "max_us": worst / 1e3,
+            }
+        return {
+            "comparisons": stats["comparisons"],
+            "rotations": dict(stats["rotations"]),
+            "allocations": stats["allocations"],
+            "depth": dict(sorted(stats["depth"].items())),
+            "latency": latency,
+        }
+
+    def reset_stats(self) -> None:
+        self._stats = {
+            "comparisons": 0,
+            "rotations": {"single": 0, "double": 0},
+            "allocations": 0,
+            "depth": {},
+            "latency": {},
+        }
+
+    def _record(self, name: str, elapsed: int) -> None:
+        latency = self._stats["latency"]
+        count, total, worst = latency.get(name, (0, 0, 0))
+        latency[name] = count + 1, total + elapsed, max(worst, elapsed)
+
+    def _visited(self, depth: int, comparisons: int) -> None:
+        stats = self._stats
+        stats["comparisons"] += comparisons
+        histogram = stats["depth"]
+        histogram[depth] = histogram.get(depth, 0) + 1
+
+    def _probed(self, walk: Callable[[Hashable], AVLNode], key: Hashable) -> AVLNode:
+        probe = _Probe(key)
+        node = walk(probe)
+        self._visited(probe.depth, probe.comparisons)
+        return node
+
+    def _get(self, root: AVLNode, key: Hashable) -> AVLNode:
+        return self._probed(partial(super()._get, root), key)
+
+    def _floor(self, key: Hashable) -> AVLNode:
+        return self._probed(super()._floor, key)
+
+    def _ceiling(self, key: Hashable) -> AVLNode:
+        return self._probed(super()._ceiling, key)
+
+    def _lower(self, key: Hashable) -> AVLNode:
+        return self._probed(super()._lower, key)
+
+    def _higher(self, key: Hashable) -> AVLNode:
+        return self._probed(super()._higher, key)
+
+    def _finger(self, keys: Iterable[Hashable]) -> Iterator[AVLNode]:
+        probes = []
+        for node in super()._finger(self._probes(keys, probes)):
+            probe = probes.pop()
+            self._visited(probe.depth, probe.comparisons)
+            yield node
+
+    def _finger_bounds(
+        self,
+        keys: Iterable[Hashable]
+    ) -> Iterator[Tuple[AVLNode, AVLNode, AVLNode]]:
+        probes = []
+        for found in super()._finger_bounds(self._probes(keys, probes)):
+            probe = probes.pop()
+            self._visited(probe.depth, probe.comparisons)
+            yield found
+
+    @staticmethod
+    def _probes(keys: Iterable[Hashable], probes: List[_Probe]) -> Iterator[_Probe]:
+        # A finger walk takes the next key once it is done with the last,
+        # so only the probe of the current key is ever in probes.
+        for key in keys:
+            probe = _Probe(key)
+            probes.append(probe)
+            yield probe
+
+    def _descend(
+        self,
+        root: AVLNode,
+        key: Hashable
+    ) -> Tuple[AVLNode, List[AVLNode], List[bool]]:
+        node, path, dirs = super()._descend(root, key)
+        # Each left turn took one comparison, each right turn and the
+        # node holding key two.
+        comparisons = 2 * len(dirs) - sum(dirs)
+        if node is not None:
+            comparisons += 2
+        self._visited(len(path) + (node is not None), comparisons)
+        return node, path, dirs
+
+    def _new_node(self, key: Hashable, value: any) -> AVLNode:
+        self._stats["allocations"] += 1
+        return super()._new_node(key, value)
@@ -10,11 +10,190 @@ from typing import (
 )
 
 from .interface import AVLNode, ADTInterface
+from .search import KEYS, VALUES, ITEMS, NODES, _MODES
 
 
 IterType = TypeVar('IterType')
 
 
+def iter_in_order(
+    root: AVLNode,
+    reverse: bool = False,
+    mode: str = ITEMS,
+) -> Iterator[any]:
+    """Iterate every node of a subtree in key order.
+
+    A plain stack of ancestors is kept and each step only descends the
+    left spine (right spine when reversed) of the next subtree. Each
+    mode has its own loop, nothing is called per node. See iter_range
+    for bounded walks.
+    """
+    if mode not in _MODES:
+        raise ValueError(f"unknown mode: {mode!r}")
+    return _WALKS[mode][reverse](root)
+
+
+def _keys(node):
+    stack = []
+    push = stack.append
+    pop = stack.pop
+    while True:
+        while node is not None:
+            push(node)
+            node = node.left
+        if not stack:
+            return
+        node = pop()
+        yield node.key
+        node = node.right
+
+
+def _values(node):
+    stack = []
+    push = stack.append
+    pop = stack.pop
+    while True:
+        while node is not None:
+            push(node)
+            node = node.left
+        if not stack:
+            return
+        node = pop()
+        yield node.value
+        node = node.right
+
+
+def _items(node):
+    stack = []
+    push = stack.append
+    pop = stack.pop
+    while True:
+        while node is not None:
+            push(node)
+            node = node.left
+        if not stack:
+            return
+        node = pop()
+        yield node.key, node.value
+        node = node.right
+
+
+def _nodes(node):
+    stack = []
+    push = stack.append
+    pop = stack.pop
+    while True:
+        while node is not None:
+            push(node)
+            node = node.left
+        if not stack:
+            return
+        node = pop()
+        yield node
+        node = node.right
+
+
+# Mirror images of the walks above, largest key first.
+
+def _rkeys(node):
+    stack = []
+    push = stack.append
+    pop = stack.pop
+    while True:
+        while node is not None:
+            push(node)
+            node = node.right
+        if not stack:
+            return
+        node = pop()
+        yield node.key
+        node = node.left
+
+
+def _rvalues(node):
+    stack = []
+    push = stack.append
+    pop = stack.pop
+    while True:
+        while node is not None:
+            push(node)
+            node = node.right
+        if not stack:
+            return
+        node = pop()
+        yield node.value
+        node = node.left
+
+
+def _ritems(node):
+    stack = []
+    push = stack.append
+    pop = stack.pop
+    while True:
+        while node is not None:
+            push(node)
+            node = node.right
+        if not stack:
+            return
+        node = pop()
+        yield node.key, node.value
+        node = node.left
+
+
+def _rnodes(node):
+    stack = []
+    push = stack.append
+    pop = stack.pop
+    while True:
+        while node is not None:
+            push(node)
+            node = node.right
+        if not stack:
+            return
+        node = pop()
+        yield node
+        node = node.left
+
+
+# (forward, reverse) walk for each mode
+_WALKS = {
+    KEYS: (_keys, _rkeys),
+    VALUES: (_values, _rvalues),
+    ITEMS: (_items, _ritems),
+    NODES: (_nodes, _rnodes),
+}
+
+
+class InOrderIterator(Iterator[IterType]):
+    """An iterator that reversed() can turn around.
+
+    walk(reverse=...) is called to start a walk in either direction.
+    reversed() starts a new walk from the other end, no matter how far
+    this one got. Looping over the iterator runs the walk directly, so
+    only calls to next() pay for the extra layer.
+    """
+
+    __slots__ = ("_walk", "_reverse", "_iter")
+
+    def __init__(
+        self,
+        walk: Callable[..., Iterator[IterType]],
+        reverse: bool = False
+    ) -> None:
+        self._walk = walk
+        self._reverse = reverse
+        self._iter = walk(reverse=reverse)
+
+    def __iter__(self) -> Iterator[IterType]:
+        return self._iter
+
+    def __next__(self) -> IterType:
+        return next(self._iter)
+
+    def __reversed__(self) -> "InOrderIterator[IterType]":
+        return InOrderIterator(self._walk, not self._reverse)
+
+
 class InOrderTraversal(Iterator[IterType]):
     def __init__(
         self,
@@ -22,24 +201,13 @@ class InOrderTraversal(Iterator[IterType]):
         transform: Callable[[AVLNode], IterType] = None
     ) -> None:
         if isinstance(tree, ADTInterface):
-            self._deque = deque([(0, tree.root)])
-        else:
-            self._deque = deque([(0, tree)])
+            tree = tree.root
+        self._nodes = _nodes(tree)
         self._xfrm = transform or (lambda x: x)
 
     def __next__(self) -> IterType:
-        while self._deque:
-            visits, node = self._deque.pop()
-            if node is None:
-                continue
-            elif visits == 0:
-                self._deque.append((1, node))
-                self._deque.append((0, node.left))
-            elif visits == 1:
-                self._deque.append((0, node.right))
-                return self._xfrm(node)
-        raise StopIteration()
-        
+        return self._xfrm(next(self._nodes))
+
 
 class BreadthFirstTraversal(Iterator[IterType]):
     def __init__(
@@ -65,4 +233,3 @@ class BreadthFirstTraversal(Iterator[IterType]):
             return self._xfrm(node)
 
         raise StopIteration()
-        
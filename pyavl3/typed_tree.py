@@ -0,0 +1,318 @@
+from array import array
+from typing import Dict, Hashable, Iterable, Tuple, Union
+
+from .interface import ADTInterface
+from .pool_tree import PoolAVLTree
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# array typecodes by numpy (kind, itemsize)
+_TYPECODES = {
+    ("i", 1): "b",
+    ("i", 2): "h",
+    ("i", 4): "i",
+    ("i", 8): "q",
+    ("u", 1): "B",
+    ("u", 2): "H",
+    ("u", 4): "I",
+    ("u", 8): "Q",
+    ("f", 4): "f",
+    ("f", 8): "d",
+}
+
+
+def _typecode(dtype) -> Tuple["np.dtype", str]:
+    """Resolve a numpy dtype and the array typecode storing it.
+
+    The pools are in native byte order, so the dtype is as well. Arrays
+    in another byte order are converted on the way in.
+    """
+    dtype = np.dtype(dtype).newbyteorder("=")
+    try:
+        return dtype, _TYPECODES[dtype.kind, dtype.itemsize]
+    except KeyError:
+        raise TypeError(f"unsupported dtype: {dtype}") from None
+
+
+class TypedAVLTree(PoolAVLTree):
+    """A PoolAVLTree with numeric keys in one contiguous typed array.
+
+    Keys are stored as dtype (int64 by default) and values either as
+    Python objects or, when value_dtype is given, in a typed array as
+    well. Single operations work like any other tree and compare plain
+    ints or floats. Batch operations take a whole NumPy array of probes
+    and answer it with vectorized searches over a sorted snapshot of
+    the tree, which is built once and reused until the next write.
+
+    Requires NumPy (pip install pyavl3[numpy]).
+    """
+
+    def __init__(
+        self,
+        iterable: Union[
+            Dict[Hashable, any],
+            Iterable[Tuple[Hashable, any]],
+            ADTInterface
+        ] = None,
+        dtype: any = "int64",
+        value_dtype: any = None,
+    ) -> None:
+        if np is None:
+            raise ImportError("TypedAVLTree requires numpy: pip install pyavl3[numpy]")
+        self.dtype, self._key_code = _typecode(dtype)
+        if value_dtype is None:
+            self.value_dtype, self._value_code = np.dtype(object), None
+        else:
+            self.value_dtype, self._value_code = _typecode(value_dtype)
+        super().__init__(iterable)
+
+    def __setitem__(self, key: Hashable, value: any) -> None:
+        """Add or Update the given key using the given value.
+
+        O(logn) - The AVL tree is balanced, h is always near log(n).
+        """
+        n = self._n
+        super().__setitem__(key, value)
+        self._snapshot = None
+        if self._n != n:
+            self._slot_order = False
+
+    @classmethod
+    def from_arrays(
+        cls,
+        keys: Iterable[any],
+        values: Iterable[any] = None,
+        dtype: any = None,
+        value_dtype: any = None,
+    ) -> "TypedAVLTree":
+        """Build a tree from an array of keys and a parallel array of values.
+
+        dtype and value_dtype default to the dtypes of the arrays given.
+        Repeated keys keep the last value, like a dict.
+
+        O(nlogn) - One vectorized sort, then an O(n) build.
+        """
+        keys = np.asarray(keys, dtype=dtype).reshape(-1)
+        if value_dtype is None and isinstance(values, np.ndarray) and values.dtype != object:
+            value_dtype = values.dtype
+        tree = cls(dtype=keys.dtype, value_dtype=value_dtype)
+        if values is not None and len(values) != len(keys):
+            raise ValueError("keys and values differ in length")
+
+        order = np.argsort(keys, kind="stable")
+        keys = keys[order]
+        if len(keys):
+            # The stable sort leaves repeated keys in input order, keep
+            # the last of each run.
+            last = np.append(keys[1:] != keys[:-1], True)
+            keys = keys[last]
+            order = order[last]
+        tree._keys.frombytes(keys.astype(tree.dtype, copy=False).tobytes())
+
+        if tree._value_code is None:
+            if values is None:
+                tree._values = [None] * len(keys)
+            else:
+                values = list(values)
+                tree._values = [values[i] for i in order.tolist()]
+        else:
+            if values is None:
+                values = np.zeros(len(order), dtype=tree.value_dtype)
+            else:
+                values = np.asarray(values, dtype=tree.value_dtype).reshape(-1)[order]
+            tree._values.frombytes(values.tobytes())
+        tree._link_sorted()
+        return tree
+
+    def clear(self) -> None:
+        """Clear all nodes from the tree.
+
+        O(1) - The pools are replaced, not emptied.
+        """
+        super().clear()
+        self._keys = array(self._key_code)
+        if self._value_code is not None:
+            self._values = array(self._value_code)
+        self._snapshot = None
+        self._slot_order = True
+
+    def keys_array(self) -> "np.ndarray":
+        """All keys in order as a read-only array.
+
+        Not a view of the key pool: the pool is in slot order, and
+        exporting its buffer would stop it from growing on the next
+        insert. The array is copied once per write instead and stays
+        valid, showing the tree as it was, after later writes.
+
+        O(n) - Once per write, later calls return the same array.
+        """
+        return self._sorted()[0]
+
+    def values_array(self) -> "np.ndarray":
+        """All values in key order as a read-only array.
+
+        Copied once per write like keys_array.
+
+        O(n) - Once per write, later calls return the same array.
+        """
+        return self._sorted()[1]
+
+    def get_many(self, keys: Iterable[any], default: any = None) -> "np.ndarray":
+        """Look up every probe in keys at once.
+
+        Missing probes get default, which has to fit value_dtype.
+
+        O(mlogn) - One vectorized binary search for m probes.
+        """
+        sorted_keys, sorted_values = self._sorted()
+        probes = self._probes(keys)
+        position, found = self._find(sorted_keys, probes)
+        result = np.full(probes.shape, default, dtype=self.value_dtype)
+        result[found] = sorted_values[position[found]]
+        return result
+
+    def contains_many(self, keys: Iterable[any]) -> "np.ndarray":
+        """Check every probe in keys at once, returns a bool array.
+
+        O(mlogn) - One vectorized binary search for m probes.
+        """
+        sorted_keys, _ = self._sorted()
+        return self._find(sorted_keys, self._probes(keys))[1]
+
+    def floor_many(self, keys: Iterable[any]) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+        """The greatest item less than or equal to every probe.
+
+        Returns arrays (keys, values, found). Where found is False the
+        probe has no floor and its key and value are left empty.
+
+        O(mlogn) - One vectorized binary search for m probes.
+        """
+        return self._nearest(keys, "right", -1)
+
+    def ceiling_many(self, keys: Iterable[any]) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+        """The least item greater than or equal to every probe.
+
+        Same results as floor_many.
+
+        O(mlogn) - One vectorized binary search for m probes.
+        """
+        return self._nearest(keys, "left", 0)
+
+    def lower_many(self, keys: Iterable[any]) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+        """The greatest item strictly less than every probe.
+
+        Same results as floor_many.
+
+        O(mlogn) - One vectorized binary search for m probes.
+        """
+        return self._nearest(keys, "left", -1)
+
+    def higher_many(self, keys: Iterable[any]) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+        """The least item strictly greater than every probe.
+
+        Same results as floor_many.
+
+        O(mlogn) - One vectorized binary search for m probes.
+        """
+        return self._nearest(keys, "right", 0)
+
+    def count_range(self, lower: any, upper: any) -> Union[int, "np.ndarray"]:
+        """Return the number of keys k with lower <= k < upper.
+
+        lower and upper may be arrays of bounds, in which case an array
+        of counts is returned.
+
+        O(mlogn) - Two vectorized binary searches for m ranges.
+        """
+        sorted_keys, _ = self._sorted()
+        count = np.maximum(
+            0,
+            np.searchsorted(sorted_keys, upper) - np.searchsorted(sorted_keys, lower),
+        )
+        return int(count) if np.ndim(count) == 0 else count
+
+    def _delete(self, key: Hashable) -> Tuple[Hashable, any]:
+        self._snapshot = None
+        self._slot_order = False
+        return super()._delete(key)
+
+    def _load(self, iterable: Iterable[Tuple[Hashable, any]]) -> None:
+        self._snapshot = None
+        super()._load(iterable)
+
+    def _link_sorted(self) -> None:
+        super()._link_sorted()
+        self._slot_order = True
+
+    def _release(self, i: int) -> None:
+        """Return a slot to the free list, typed slots keep their bytes"""
+        if self._value_code is None:
+            self._values[i] = None
+        self._right[i] = self._free
+        self._free = i
+
+    def _sorted(self) -> Tuple["np.ndarray", "np.ndarray"]:
+        """Keys and values in key order, cached until the next write"""
+        if self._snapshot is not None:
+            return self._snapshot
+
+        n = self._n
+        if n == 0:
+            keys = np.empty(0, dtype=self.dtype)
+            values = np.empty(0, dtype=self.value_dtype)
+        elif self._slot_order:
+            # Nothing moved since the last bulk build, slot i holds the
+            # i-th key.
+            keys = np.frombuffer(self._keys, dtype=self.dtype).copy()
+            values = self._gather(None)
+        else:
+            order = np.fromiter(self._in_order(), dtype=np.intp, count=n)
+            keys = np.frombuffer(self._keys, dtype=self.dtype)[order]
+            values = self._gather(order)
+
+        keys.flags.writeable = False
+        values.flags.writeable = False
+        self._snapshot = keys, values
+        return self._snapshot
+
+    def _gather(self, order: "np.ndarray") -> "np.ndarray":
+        """Copy the values out of their pool in the given slot order"""
+        if self._value_code is not None:
+            values = np.frombuffer(self._values, dtype=self.value_dtype)
+            return values.copy() if order is None else values[order]
+
+        pool = self._values
+        values = np.empty(self._n, dtype=object)
+        for j, i in enumerate(range(self._n) if order is None else order.tolist()):
+            values[j] = pool[i]
+        return values
+
+    def _probes(self, keys: Iterable[any]) -> "np.ndarray":
+        return np.asarray(keys, dtype=self.dtype).reshape(-1)
+
+    @staticmethod
+    def _find(sorted_keys: "np.ndarray", probes: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray"]:
+        """Positions of the probes in sorted_keys and where they were found"""
+        position = np.searchsorted(sorted_keys, probes)
+        found = position < len(sorted_keys)
+        found[found] = sorted_keys[position[found]] == probes[found]
+        return position, found
+
+    def _nearest(self, keys: Iterable[any], side: str, shift: int) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+        sorted_keys, sorted_values = self._sorted()
+        probes = self._probes(keys)
+        position = np.searchsorted(sorted_keys, probes, side=side) + shift
+        found = (position >= 0) & (position < len(sorted_keys))
+
+        result_keys = np.zeros(probes.shape, dtype=self.dtype)
+        if self._value_code is None:
+            result_values = np.empty(probes.shape, dtype=object)
+        else:
+            result_values = np.zeros(probes.shape, dtype=self.value_dtype)
+        result_keys[found] = sorted_keys[position[found]]
+        result_values[found] = sorted_values[position[found]]
+        return result_keys, result_values, found
@@ -24,4 +24,7 @@ setup(
         "Operating System :: OS Independent",
     ],
     install_requires=requirements,
+    extras_require={
+        'numpy': ['numpy'],
+    },
 )
@@ -0,0 +1,13 @@
+def avl_height(test, root):
+    """Check the AVL invariants below root and return its height"""
+    if root is None:
+        return -1
+    lh = avl_height(test, root.left)
+    rh = avl_height(test, root.right)
+    if root.left is not None:
+        test.assertLess(root.left.key, root.key)
+    if root.right is not None:
+        test.assertGreater(root.right.key, root.key)
+    test.assertLessEqual(abs(lh - rh), 1)
+    test.assertEqual(root.height, max(lh, rh) + 1)
+    return root.height
@@ -4,35 +4,37 @@ from pyavl3 import AVLTree
 
 class AVLTreeTest(unittest.TestCase):
 
+    tree_type = AVLTree
+
     def test_insert(self):
-        a = AVLTree()
+        a = self.tree_type()
         a[1] = "hello"
         a[2] = "world"
 
     def test_getitem(self):
-        a = AVLTree()
+        a = self.tree_type()
         a[1] = "hello"
         a[2] = "world"
         self.assertEqual(a[1], "hello")
         self.assertEqual(a[2], "world")
 
     def test_getitem_raises_key_error(self):
-        a = AVLTree()
+        a = self.tree_type()
         with self.assertRaises(KeyError):
             _ = a[1]
 
     def test_get_does_not_raise_key_error(self):
-        a = AVLTree()
+        a = self.tree_type()
         _ = a.get(1)
 
     def test_get_returns_default(self):
-        a = AVLTree()
+        a = self.tree_type()
         s = object()
         v = a.get(1, s)
         self.assertIs(s, v)
 
     def test_contains(self):
-        a = AVLTree()
+        a = self.tree_type()
         a[1] = 'a'
         a[2] = 'a'
         a[3] = 'a'
@@ -41,7 +43,7 @@ class AVLTreeTest(unittest.TestCase):
         self.assertTrue(3 in a)
 
     def test_not_contains(self):
-        a = AVLTree()
+        a = self.tree_type()
         a[1] = 'a'
         a[2] = 'a'
         a[3] = 'a'
@@ -49,70 +51,70 @@ class AVLTreeTest(unittest.TestCase):
         self.assertFalse(4 in a)
 
     def test_traversal_on_left_heavy(self):
-        a = AVLTree()
+        a = self.tree_type()
         a[3] = "a"
         a[2] = "b"
         a[1] = "c"
         self.assertListEqual([1,2,3], list(a.keys()))
 
     def test_traversal_on_right_heavy(self):
-        a = AVLTree()
+        a = self.tree_type()
         a[1] = "a"
         a[2] = "b"
         a[3] = "c"
         self.assertListEqual([1,2,3], list(a.keys()))
 
     def test_traversal_on_balanced(self):
-        a = AVLTree()
+        a = self.tree_type()
         a[2] = "a"
         a[1] = "b"
         a[3] = "c"
         self.assertListEqual([1,2,3], list(a.keys()))
 
     def test_len_on_left_heavy(self):
-        a = AVLTree()
+        a = self.tree_type()
         a[3] = "a"
         a[2] = "a"
         a[1] = "a"
         self.assertEqual(len(a), 3)
 
     def test_len_on_right_heavy(self):
-        a = AVLTree()
+        a = self.tree_type()
         a[1] = "a"
         a[2] = "a"
         a[3] = "a"
         self.assertEqual(len(a), 3)
 
     def test_len_on_balanced(self):
-        a = AVLTree()
+        a = self.tree_type()
         a[2] = "a"
         a[1] = "a"
         a[3] = "a"
         self.assertEqual(len(a), 3)
 
     def test_len_on_left_right(self):
-        a = AVLTree()
+        a = self.tree_type()
         a[5] = "a"
         a[3] = "a"
         a[4] = "a"
         self.assertEqual(len(a), 3)
 
     def test_len_on_right_left(self):
-        a = AVLTree()
+        a = self.tree_type()
         a[5] = "a"
         a[7] = "a"
         a[6] = "a"
         self.assertEqual(len(a), 3)
 
     def test_depth_3_nodes(self):
-        a = AVLTree()
+        a = self.tree_type()
         a[2] = "a"
         a[1] = "a"
         a[3] = "a"
         self.assertEqual(a.root.height, 1)
 
     def test_depth_7_nodes(self):
-        a = AVLTree()
+        a = self.tree_type()
         a[1] = "a"
         a[2] = "a"
         a[3] = "a"
@@ -123,7 +125,7 @@ class AVLTreeTest(unittest.TestCase):
         self.assertEqual(a.root.height, 2)
 
     def test_depth_8_nodes(self):
-        a = AVLTree()
+        a = self.tree_type()
         a[1] = "a"
         a[2] = "a"
         a[3] = "a"
@@ -135,21 +137,21 @@ class AVLTreeTest(unittest.TestCase):
         self.assertEqual(a.root.height, 3)
 
     def test_left_right_balance(self):
-        a = AVLTree()
+        a = self.tree_type()
         a[5] = 'a'
         a[3] = 'a'
         a[4] = 'a'
         self.assertEqual(a.root.height, 1)
 
     def test_right_left_balance(self):
-        a = AVLTree()
+        a = self.tree_type()
         a[5] = 'a'
         a[7] = 'a'
         a[6] = 'a'
         self.assertEqual(a.root.height, 1)
 
     def test_update_in_place(self):
-        a = AVLTree()
+        a = self.tree_type()
         a[1] = 'a'
         a[2] = 'b'
         a[3] = 'a'
@@ -159,12 +161,12 @@ class AVLTreeTest(unittest.TestCase):
         self.assertEqual(len(a), 3)
 
     def test_delete_causes_key_error(self):
-        a = AVLTree()
+        a = self.tree_type()
         with self.assertRaises(KeyError):
             del a[1]
 
     def test_delete_node_with_left_case(self):
-        a = AVLTree()
+        a = self.tree_type()
 
         a[5] = 'a'
         a[1] = 'b'
@@ -174,7 +176,7 @@ class AVLTreeTest(unittest.TestCase):
         self.assertEqual(a.root, expected)
 
     def test_delete_node_with_right_case(self):
-        a = AVLTree()
+        a = self.tree_type()
 
         a[5] = 'a'
         a[6] = 'b'
@@ -184,27 +186,27 @@ class AVLTreeTest(unittest.TestCase):
         self.assertEqual(a.root, expected)
 
     def test_delete_node_with_none_case(self):
-        a = AVLTree()
+        a = self.tree_type()
         a[5] = 'a'
         del a[5]
         self.assertIsNone(a.root)
 
     def test_delete_node_recurses_left(self):
-        a = AVLTree()
+        a = self.tree_type()
         a[5] = 'a'
         a[4] = 'a'
         del a[4]
         self.assertIsNone(a.root.left)
 
     def test_delete_node_recurses_right(self):
-        a = AVLTree()
+        a = self.tree_type()
         a[5] = 'a'
         a[6] = 'a'
         del a[6]
         self.assertIsNone(a.root.right)
 
     def test_delete_node_with_both_case(self):
-        a = AVLTree()
+        a = self.tree_type()
         a[5] = 'a'
         a[4] = 'a'
         a[6] = 'a'
@@ -213,7 +215,7 @@ class AVLTreeTest(unittest.TestCase):
         self.assertEqual(a.root, expected)
 
     def test_delete_keeps_avl_property(self):
-        a = AVLTree()
+        a = self.tree_type()
         a[5] = 'a'
         a[3] = 'a'
         a[7] = 'a'
@@ -262,7 +264,7 @@ class AVLTreeTest(unittest.TestCase):
         self.assertEqual(r.right.right.key, 8)
 
     def test_delete_empty_node_updates_len(self):
-        a = AVLTree()
+        a = self.tree_type()
         a[5] = 'a'
         a[3] = 'a'
         a[7] = 'a'
@@ -270,7 +272,7 @@ class AVLTreeTest(unittest.TestCase):
         self.assertEqual(2, len(a))
 
     def test_delete_node_with_left_updates_len(self):
-        a = AVLTree()
+        a = self.tree_type()
         a[5] = 'a'
         a[3] = 'a'
         a[7] = 'a'
@@ -279,7 +281,7 @@ class AVLTreeTest(unittest.TestCase):
         self.assertEqual(3, len(a))
 
     def test_delete_node_with_right_updates_len(self):
-        a = AVLTree()
+        a = self.tree_type()
         a[5] = 'a'
         a[3] = 'a'
         a[7] = 'a'
@@ -288,7 +290,7 @@ class AVLTreeTest(unittest.TestCase):
         self.assertEqual(3, len(a))
 
     def test_delete_node_with_left_and_right_updates_len(self):
-        a = AVLTree()
+        a = self.tree_type()
         a[5] = 'a'
         a[3] = 'a'
         a[7] = 'a'
@@ -298,10 +300,10 @@ class AVLTreeTest(unittest.TestCase):
         self.assertEqual(4, len(a))
 
     def test_is_not_empty(self):
-        a = AVLTree()
+        a = self.tree_type()
         a[1] = 'a'
         self.assertTrue(bool(a))
 
     def test_is_empty(self):
-        a = AVLTree()
+        a = self.tree_type()
         self.assertFalse(bool(a))
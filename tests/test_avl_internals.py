@@ -1,5 +1,6 @@
 import unittest
 from pyavl3 import AVLTree
+from helpers import avl_height
 
 
 class AVLTreeInternalsTest(unittest.TestCase):
@@ -61,3 +62,28 @@ class AVLTreeInternalsTest(unittest.TestCase):
         self.assertEqual(a.root.right.key, 8)
         a._pop_right_min(a.root)
         self.assertEqual(a.root.right.key, 9)
+
+    def test_random_inserts_and_deletes_keep_avl_property(self):
+        import random
+        rng = random.Random(1234)
+        a = AVLTree()
+        d = {}
+        for _ in range(2000):
+            k = rng.randint(0, 300)
+            if k in d and rng.random() < 0.5:
+                del a[k]
+                del d[k]
+            else:
+                a[k] = k
+                d[k] = k
+            self.assertEqual(len(a), len(d))
+        self.assertListEqual(list(a.items()), sorted(d.items()))
+        avl_height(self, a.root)
+
+    def test_update_does_not_allocate_a_node(self):
+        a = AVLTree()
+        a[1] = 'a'
+        node = a.root
+        a[1] = 'b'
+        self.assertIs(a.root, node)
+        self.assertEqual(node.value, 'b')
@@ -4,12 +4,14 @@ from pyavl3 import AVLTree
 
 class AVLClearTest(unittest.TestCase):
 
+    tree_type = AVLTree
+
     def test_clear_empty(self):
-        a = AVLTree()
+        a = self.tree_type()
         a.clear()
 
     def test_len_on_clear(self):
-        a = AVLTree()
+        a = self.tree_type()
         a[1] = 'a'
         a[2] = 'a'
         a[3] = 'a'
@@ -17,7 +19,7 @@ class AVLClearTest(unittest.TestCase):
         self.assertEqual(len(a), 0)
 
     def test_clear_is_empty(self):
-        a = AVLTree()
+        a = self.tree_type()
         a[1] = 'a'
         a[2] = 'a'
         a[3] = 'a'
@@ -0,0 +1,158 @@
+import threading
+import unittest
+from pyavl3 import AVLTree, ConcurrentAVLTree
+from pyavl3.concurrent import RWLock
+from pyavl3.search import BetweenSearch, KEYS
+from helpers import avl_height
+
+
+class RWLockTest(unittest.TestCase):
+
+    def test_readers_share(self):
+        lock = RWLock()
+        inside = threading.Barrier(3, timeout=5)
+
+        def read():
+            with lock.reading():
+                inside.wait()
+
+        threads = [threading.Thread(target=read) for _ in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertFalse(inside.broken)
+
+    def test_writer_excludes_readers(self):
+        lock = RWLock()
+        events = []
+        lock.acquire_write()
+
+        def read():
+            with lock.reading():
+                events.append("read")
+
+        t = threading.Thread(target=read)
+        t.start()
+        t.join(0.05)
+        events.append("write")
+        lock.release_write()
+        t.join()
+        self.assertEqual(events, ["write", "read"])
+
+    def test_reentrant(self):
+        lock = RWLock()
+        with lock.writing():
+            with lock.writing():
+                with lock.reading():
+                    pass
+        with lock.reading():
+            with lock.reading():
+                with self.assertRaises(RuntimeError):
+                    lock.acquire_write()
+        with lock.writing():
+            pass
+
+
+class ConcurrentAVLTreeTest(unittest.TestCase):
+
+    def test_behaves_like_avl_tree(self):
+        tree = ConcurrentAVLTree({i: str(i) for i in range(20)})
+        tree.update({30: "30"})
+        tree.setdefault(31, "31")
+        tree[40] = "40"
+        self.assertEqual(tree.pop(40), "40")
+        self.assertEqual(list(tree.items()), list(AVLTree({i: str(i) for i in list(range(20)) + [30, 31]}).items()))
+        self.assertEqual(list(BetweenSearch(3, 6, mode=KEYS)(tree)), [4, 5])
+        self.assertEqual(tree.floor(25), (19, "19"))
+        copy = tree.copy()
+        self.assertIsInstance(copy, ConcurrentAVLTree)
+        del copy[0]
+        self.assertIn(0, tree)
+
+    def test_iterator_fails_after_write(self):
+        tree = ConcurrentAVLTree.fromkeys(range(10))
+        for make in (iter, ConcurrentAVLTree.keys, ConcurrentAVLTree.items, ConcurrentAVLTree.irange):
+            it = make(tree)
+            next(it)
+            tree[100] = None
+            with self.assertRaises(RuntimeError):
+                next(it)
+            del tree[100]
+
+    def test_failed_writes_keep_iterators(self):
+        tree = ConcurrentAVLTree.fromkeys(range(10))
+        it = tree.keys()
+        with self.assertRaises(KeyError):
+            del tree[100]
+        with self.assertRaises(KeyError):
+            tree.pop(100)
+        self.assertEqual(list(it), list(range(10)))
+
+        it = tree.keys()
+        with self.assertRaises(TypeError):
+            tree.update([(20, None), ("x", None)])
+        with self.assertRaises(RuntimeError):
+            next(it)
+
+    def test_views_reverse(self):
+        tree = ConcurrentAVLTree({i: str(i) for i in range(10)})
+        model = AVLTree({i: str(i) for i in range(10)})
+        for name in ("keys", "values", "items"):
+            self.assertEqual(list(reversed(getattr(tree, name)())), list(reversed(getattr(model, name)())))
+        self.assertEqual(list(reversed(tree)), list(range(9, -1, -1)))
+        self.assertEqual(list(reversed(reversed(tree.keys()))), list(range(10)))
+
+    def test_reversed_views_fail_after_write(self):
+        tree = ConcurrentAVLTree.fromkeys(range(10))
+        for make in (ConcurrentAVLTree.keys, ConcurrentAVLTree.values, ConcurrentAVLTree.items):
+            it = make(tree)
+            tree[100] = None
+            with self.assertRaises(RuntimeError):
+                next(reversed(it))
+            del tree[100]
+        it = reversed(tree)
+        next(it)
+        tree[100] = None
+        with self.assertRaises(RuntimeError):
+            next(it)
+
+    def test_snapshot_iteration(self):
+        tree = ConcurrentAVLTree.fromkeys(range(10))
+        tree.snapshot_iteration = True
+        it = tree.keys()
+        back = reversed(tree.keys())
+        tree.clear()
+        self.assertEqual(list(it), list(range(10)))
+        self.assertEqual(list(back), list(range(9, -1, -1)))
+
+    def test_threads(self):
+        tree = ConcurrentAVLTree()
+        errors = []
+
+        def write(base):
+            for i in range(base, base + 500):
+                tree[i] = i
+            for i in range(base, base + 500, 2):
+                del tree[i]
+
+        def read():
+            for _ in range(50):
+                try:
+                    keys = list(tree.irange(0, 2000, mode=KEYS))
+                except RuntimeError:
+                    continue
+                if keys != sorted(keys):
+                    errors.append(keys)
+
+        threads = [threading.Thread(target=write, args=(b,)) for b in range(0, 2000, 500)]
+        threads += [threading.Thread(target=read) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(list(tree), list(range(1, 2000, 2)))
+        self.assertEqual(len(tree), 1000)
+        avl_height(self, tree.root)
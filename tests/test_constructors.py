@@ -4,20 +4,22 @@ from pyavl3 import AVLTree
 
 class AVLCreatTest(unittest.TestCase):
 
+    tree_type = AVLTree
+
     def test_empty_create(self):
-        a = AVLTree()
+        a = self.tree_type()
         self.assertEqual(len(a), 0)
 
     def test_iterable_create(self):
-        a = AVLTree([(1, 'a'), (2, 'b'), (3, 'c')])
+        a = self.tree_type([(1, 'a'), (2, 'b'), (3, 'c')])
         self.assertEqual(len(a), 3)
 
     def test_iterable_create_by_dict(self):
-        a = AVLTree({1: 'a', 2: 'b', 3: 'c'})
+        a = self.tree_type({1: 'a', 2: 'b', 3: 'c'})
         self.assertEqual(len(a), 3)
 
     def test_iterable_create_by_kwargs(self):
-        a = AVLTree(
+        a = self.tree_type(
             a='a',
             b='b',
             c='c',
@@ -25,5 +27,5 @@ class AVLCreatTest(unittest.TestCase):
         self.assertEqual(len(a), 3)
 
     def test_iterable_create_by_both(self):
-        a = AVLTree([('a', 'a'), ('b', 'b')], c='c')
+        a = self.tree_type([('a', 'a'), ('b', 'b')], c='c')
         self.assertEqual(len(a), 3)
@@ -3,23 +3,26 @@ from pyavl3 import AVLTree
 from pyavl3.traversal import InOrderTraversal
 
 class AVLTreeCopyTest(unittest.TestCase):
+
+    tree_type = AVLTree
+
     def test_copy_empty(self):
-        a = AVLTree()
+        a = self.tree_type()
         b = a.copy()
         self.assertIsNot(a, b)
 
     def test_copy_contains_same_count(self):
-        a = AVLTree(a=1,b=2,c=3)
+        a = self.tree_type(a=1,b=2,c=3)
         b = a.copy()
         self.assertEqual(len(b), 3)
 
     def test_copy_contains_same_items(self):
-        a = AVLTree(a=1, b=2, c=3, d=4, e=5, f=6)
+        a = self.tree_type(a=1, b=2, c=3, d=4, e=5, f=6)
         b = a.copy()
         self.assertListEqual(list(a), list(b))
 
     def test_copy_doesn_not_reuse_nodes(self):
-        a = AVLTree(a=1, b=2, c=3, d=4, e=5, f=6)
+        a = self.tree_type(a=1, b=2, c=3, d=4, e=5, f=6)
         b = a.copy()
 
         travel_a = InOrderTraversal(a.root, lambda x: x)
@@ -32,3 +35,41 @@ class AVLTreeCopyTest(unittest.TestCase):
                 break;
             self.assertIsNot(_a, _b)
 
+    def test_copy_keeps_shape_and_heights(self):
+        a = self.tree_type((i, i) for i in [5, 3, 7, 1, 4, 8, 2])
+        b = a.copy()
+        self.assertEqual(str(a), str(b))
+        self.assertEqual(a.root.height, b.root.height)
+        self.assertEqual(a.root.left.height, b.root.left.height)
+
+    def test_copy_is_independent(self):
+        a = self.tree_type(a=1, b=2)
+        b = a.copy()
+        b['c'] = 3
+        del b['a']
+        self.assertListEqual(list(a.items()), [('a', 1), ('b', 2)])
+        self.assertListEqual(list(b.items()), [('b', 2), ('c', 3)])
+
+    def test_copy_module_hooks(self):
+        import copy
+        a = self.tree_type(a=[1], b=[2])
+        shallow = copy.copy(a)
+        deep = copy.deepcopy(a)
+        self.assertIs(shallow['a'], a['a'])
+        self.assertIsNot(deep['a'], a['a'])
+        self.assertEqual(deep['a'], a['a'])
+        self.assertEqual(len(deep), 2)
+
+    def test_deep_copy_shares_memo(self):
+        shared = [1]
+        a = self.tree_type(a=shared, b=shared)
+        b = a.copy(deep=True)
+        self.assertIs(b['a'], b['b'])
+        self.assertIsNot(b['a'], shared)
+
+    def test_construct_from_tree(self):
+        a = self.tree_type((i, i) for i in range(20))
+        b = self.tree_type(a)
+        self.assertListEqual(list(a.items()), list(b.items()))
+        self.assertEqual(len(b), 20)
+        self.assertIsNot(a.root, b.root)
@@ -0,0 +1,198 @@
+import random
+import unittest
+from pyavl3 import (
+    AVLTree,
+    ConcurrentAVLTree,
+    IndexedAVLTree,
+    KeyedAVLTree,
+    LazyAVLTree,
+    PersistentAVLTree,
+)
+from helpers import avl_height
+
+
+class CursorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tree = AVLTree((k, str(k)) for k in range(0, 100, 2))
+
+    def test_walk_forward(self):
+        cursor = self.tree.cursor()
+        keys = [cursor.key]
+        while cursor.next():
+            keys.append(cursor.key)
+        self.assertEqual(keys, list(self.tree))
+        self.assertFalse(cursor)
+        self.assertFalse(cursor.next())
+
+    def test_walk_backward(self):
+        cursor = self.tree.cursor()
+        self.assertTrue(cursor.last())
+        keys = [cursor.key]
+        while cursor.prev():
+            keys.append(cursor.key)
+        self.assertEqual(keys, list(self.tree)[::-1])
+        self.assertFalse(cursor.prev())
+
+    def test_step_back_from_either_end(self):
+        cursor = self.tree.cursor()
+        self.assertFalse(cursor.prev())
+        self.assertTrue(cursor.next())
+        self.assertEqual(cursor.key, 0)
+        cursor.last()
+        self.assertFalse(cursor.next())
+        self.assertTrue(cursor.prev())
+        self.assertEqual(cursor.key, 98)
+
+    def test_zigzag(self):
+        cursor = self.tree.cursor(40)
+        self.assertTrue(cursor.next())
+        self.assertTrue(cursor.next())
+        self.assertTrue(cursor.prev())
+        self.assertEqual(cursor.item, (42, "42"))
+
+    def test_seek(self):
+        cursor = self.tree.cursor()
+        self.assertTrue(cursor.seek(10))
+        self.assertEqual(cursor.key, 10)
+        self.assertFalse(cursor.seek(11))
+        self.assertEqual(cursor.key, 12)
+        self.assertFalse(cursor.seek(-5))
+        self.assertEqual(cursor.key, 0)
+        self.assertFalse(cursor.seek(99))
+        self.assertFalse(cursor)
+        self.assertTrue(cursor.prev())
+        self.assertEqual(cursor.key, 98)
+
+    def test_not_positioned(self):
+        cursor = AVLTree().cursor()
+        self.assertFalse(cursor)
+        self.assertFalse(cursor.next())
+        self.assertFalse(cursor.last())
+        with self.assertRaises(KeyError):
+            cursor.key
+        with self.assertRaises(KeyError):
+            cursor.set_value(1)
+        with self.assertRaises(KeyError):
+            cursor.delete()
+
+    def test_set_value(self):
+        cursor = self.tree.cursor(20)
+        cursor.set_value("twenty")
+        self.assertEqual(cursor.value, "twenty")
+        self.assertEqual(self.tree[20], "twenty")
+        self.assertTrue(cursor.next())
+        self.assertEqual(cursor.key, 22)
+
+    def test_delete_moves_to_next(self):
+        cursor = self.tree.cursor(20)
+        self.assertEqual(cursor.delete(), (20, "20"))
+        self.assertNotIn(20, self.tree)
+        self.assertEqual(cursor.key, 22)
+        self.assertEqual(len(self.tree), 49)
+        cursor.last()
+        cursor.delete()
+        self.assertFalse(cursor)
+        self.assertTrue(cursor.prev())
+        self.assertEqual(cursor.key, 96)
+
+    def test_delete_while_walking(self):
+        keys = list(range(500))
+        random.shuffle(keys)
+        tree = AVLTree((k, k) for k in keys)
+        cursor = tree.cursor()
+        while cursor:
+            if cursor.key % 3:
+                cursor.delete()
+            else:
+                cursor.next()
+        self.assertEqual(list(tree), list(range(0, 500, 3)))
+        self.assertEqual(len(tree), len(range(0, 500, 3)))
+        avl_height(self, tree.root)
+
+    def test_reseeks_after_new_root(self):
+        cursor = self.tree.cursor(50)
+        self.tree.clear()
+        self.tree.update((k, k) for k in range(0, 100, 5))
+        self.assertTrue(cursor.next())
+        self.assertEqual(cursor.key, 55)
+        self.tree.clear()
+        with self.assertRaises(KeyError):
+            cursor.key
+
+    def test_reseeks_after_key_removed(self):
+        cursor = self.tree.cursor(50)
+        self.tree.clear()
+        self.tree.update((k, k) for k in range(0, 100, 7))
+        self.assertTrue(cursor.next())
+        self.assertEqual(cursor.key, 56)
+        cursor.seek(56)
+        self.tree.clear()
+        self.tree.update((k, k) for k in range(0, 100, 5))
+        self.assertTrue(cursor.prev())
+        self.assertEqual(cursor.key, 55)
+
+
+class CursorSubclassTest(unittest.TestCase):
+
+    def test_indexed(self):
+        tree = IndexedAVLTree((k, k) for k in range(50))
+        cursor = tree.cursor(10)
+        cursor.delete()
+        self.assertEqual(tree.rank(11), 10)
+        self.assertEqual(tree.select(10), 11)
+
+    def test_keyed(self):
+        tree = KeyedAVLTree(str.lower, [("B", 2), ("a", 1), ("C", 3)])
+        cursor = tree.cursor()
+        self.assertEqual(cursor.item, ("a", 1))
+        self.assertTrue(cursor.seek("b"))
+        self.assertEqual(cursor.key, "B")
+        cursor.set_value(20)
+        self.assertEqual(tree["B"], 20)
+        self.assertEqual(cursor.delete(), ("B", 20))
+        self.assertEqual(cursor.key, "C")
+        self.assertEqual(list(tree.items()), [("a", 1), ("C", 3)])
+
+    def test_persistent_keeps_snapshots(self):
+        tree = PersistentAVLTree((k, k) for k in range(20))
+        snapshot = tree.snapshot()
+        cursor = tree.cursor(5)
+        cursor.set_value("five")
+        self.assertEqual(cursor.value, "five")
+        self.assertTrue(cursor.next())
+        self.assertEqual(cursor.key, 6)
+        cursor.delete()
+        self.assertEqual(tree[5], "five")
+        self.assertNotIn(6, tree)
+        self.assertEqual(snapshot[5], 5)
+        self.assertIn(6, snapshot)
+
+    def test_lazy_skips_tombstones(self):
+        tree = LazyAVLTree((k, k) for k in range(20))
+        del tree[3]
+        cursor = tree.cursor(2)
+        self.assertTrue(cursor.next())
+        self.assertEqual(cursor.key, 4)
+        cursor.delete()
+        self.assertEqual(tree._dead, 0)
+        self.assertEqual(len(tree), 18)
+        self.assertEqual(cursor.key, 5)
+
+    def test_concurrent_writes_fail_iterators(self):
+        tree = ConcurrentAVLTree((k, k) for k in range(20))
+        keys = tree.keys()
+        self.assertEqual(next(keys), 0)
+        with tree.lock.writing():
+            cursor = tree.cursor(5)
+            cursor.delete()
+        with self.assertRaises(RuntimeError):
+            next(keys)
+        values = tree.values()
+        next(values)
+        with tree.lock.writing():
+            tree.cursor(6).set_value("six")
+        with self.assertRaises(RuntimeError):
+            next(values)
+        self.assertNotIn(5, tree)
+        self.assertEqual(tree[6], "six")
@@ -0,0 +1,62 @@
+import unittest
+from pyavl3 import AVLTree
+from helpers import avl_height
+
+
+class AVLTreeFromSortedTest(unittest.TestCase):
+
+    def test_empty(self):
+        a = AVLTree.from_sorted([])
+        self.assertEqual(len(a), 0)
+        self.assertIsNone(a.root)
+
+    def test_builds_valid_tree_for_every_size(self):
+        for n in range(70):
+            with self.subTest(n=n):
+                a = AVLTree.from_sorted((i, str(i)) for i in range(n))
+                self.assertEqual(len(a), n)
+                self.assertListEqual(list(a.keys()), list(range(n)))
+                avl_height(self, a.root)
+
+    def test_perfect_tree_height(self):
+        a = AVLTree.from_sorted((i, i) for i in range(1023))
+        self.assertEqual(a.root.height, 9)
+        self.assertEqual(a.root.key, 511)
+
+    def test_consumes_generator_lazily(self):
+        seen = []
+
+        def gen():
+            for i in range(5):
+                seen.append(i)
+                yield i, i
+
+        a = AVLTree.from_sorted(gen())
+        self.assertListEqual(seen, [0, 1, 2, 3, 4])
+        self.assertEqual(len(a), 5)
+
+    def test_repeated_keys_keep_last_value(self):
+        a = AVLTree.from_sorted([(1, 'a'), (1, 'b'), (2, 'c')])
+        self.assertEqual(len(a), 2)
+        self.assertEqual(a[1], 'b')
+
+    def test_unsorted_input_falls_back_to_insert(self):
+        pairs = [(1, 'a'), (3, 'c'), (5, 'e'), (2, 'b'), (4, 'd'), (0, 'z')]
+        a = AVLTree.from_sorted(pairs)
+        self.assertListEqual(list(a.items()), sorted(pairs))
+        avl_height(self, a.root)
+
+    def test_constructor_detects_sorted_input(self):
+        a = AVLTree([(i, i) for i in range(100)])
+        self.assertEqual(a.root.height, 6)
+        avl_height(self, a.root)
+
+    def test_update_on_empty_tree(self):
+        a = AVLTree()
+        a.update((i, i) for i in range(10))
+        self.assertListEqual(list(a.keys()), list(range(10)))
+        avl_height(self, a.root)
+
+    def test_fromkeys_unsorted(self):
+        a = AVLTree.fromkeys([3, 1, 2], 0)
+        self.assertListEqual(list(a.items()), [(1, 0), (2, 0), (3, 0)])
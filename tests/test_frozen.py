@@ -0,0 +1,104 @@
+import os
+import random
+import tempfile
+import unittest
+from pyavl3 import AVLTree, FrozenAVLTree
+from pyavl3.frozen import freeze
+from pyavl3.search import (
+    GreatherThanSearch,
+    LessThanOrEqualSearch,
+    BetweenSearch,
+    RangeSearch,
+    KEYS,
+    VALUES,
+    NODES,
+)
+from pyavl3.traversal import InOrderTraversal
+
+
+class FrozenAVLTreeTest(unittest.TestCase):
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix=".avl")
+        os.close(fd)
+        rng = random.Random(4)
+        self.data = {k: f"v{k}" for k in rng.sample(range(5000), 1500)}
+        self.tree = AVLTree(self.data)
+        freeze(self.tree, self.path)
+        self.frozen = FrozenAVLTree(self.path)
+
+    def tearDown(self):
+        self.frozen.close()
+        os.remove(self.path)
+
+    def test_lookups(self):
+        for k in list(self.data)[:200]:
+            self.assertEqual(self.frozen[k], self.data[k])
+            self.assertIn(k, self.frozen)
+        self.assertNotIn(-1, self.frozen)
+        self.assertIsNone(self.frozen.get(99999))
+        with self.assertRaises(KeyError):
+            self.frozen[-1]
+
+    def test_iteration(self):
+        self.assertEqual(len(self.frozen), len(self.data))
+        self.assertListEqual(list(self.frozen), sorted(self.data))
+        self.assertListEqual(list(self.frozen.items()), list(self.tree.items()))
+        self.assertListEqual(list(self.frozen.values()), list(self.tree.values()))
+
+    def test_searches_match_tree(self):
+        keys = sorted(self.data)
+        searches = [
+            GreatherThanSearch(keys[100]),
+            LessThanOrEqualSearch(keys[50], reverse=True),
+            BetweenSearch(keys[10], keys[40], mode=KEYS),
+            RangeSearch(-5, 7000, upper_inclusive=True, mode=VALUES),
+            RangeSearch(keys[3], keys[3], upper_inclusive=True),
+        ]
+        for search in searches:
+            with self.subTest(search=search):
+                self.assertListEqual(list(search(self.frozen)), list(search(self.tree)))
+
+    def test_node_protocol(self):
+        nodes = list(self.frozen.irange(mode=NODES))
+        self.assertListEqual([n.key for n in nodes[:5]], sorted(self.data)[:5])
+        keys = list(InOrderTraversal(self.frozen, lambda n: n.key))
+        self.assertListEqual(keys, sorted(self.data))
+        lo, hi = sorted(self.data)[10], sorted(self.data)[40]
+        for reverse in (False, True):
+            nodes = self.frozen.irange(lo, hi, False, True, reverse, mode=NODES)
+            self.assertListEqual(
+                [(n.key, n.value) for n in nodes],
+                list(self.tree.irange(lo, hi, False, True, reverse)),
+            )
+
+    def test_read_only(self):
+        with self.assertRaises(TypeError):
+            self.frozen[1] = 2
+        with self.assertRaises(TypeError):
+            del self.frozen[1]
+
+    def test_copy(self):
+        copy = self.frozen.copy()
+        self.assertIsInstance(copy, AVLTree)
+        self.assertListEqual(list(copy.items()), list(self.tree.items()))
+
+    def test_empty_tree(self):
+        freeze(AVLTree(), self.path + ".empty")
+        try:
+            with FrozenAVLTree(self.path + ".empty") as frozen:
+                self.assertEqual(len(frozen), 0)
+                self.assertFalse(frozen)
+                self.assertListEqual(list(frozen.irange()), [])
+                self.assertNotIn(1, frozen)
+        finally:
+            os.remove(self.path + ".empty")
+
+    def test_rejects_other_files(self):
+        with open(self.path + ".bad", "wb") as fp:
+            fp.write(b"x" * 64)
+        try:
+            with self.assertRaises(ValueError):
+                FrozenAVLTree(self.path + ".bad")
+        finally:
+            os.remove(self.path + ".bad")
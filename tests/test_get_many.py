@@ -0,0 +1,33 @@
+import random
+import unittest
+from pyavl3 import AVLTree
+
+
+class AVLTreeGetManyTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tree = AVLTree((k, str(k)) for k in range(0, 1000, 3))
+
+    def test_get_many_keeps_caller_order(self):
+        rng = random.Random(11)
+        keys = [rng.randrange(-10, 1010) for _ in range(500)]
+        self.assertListEqual(
+            self.tree.get_many(keys),
+            [self.tree.get(k) for k in keys])
+
+    def test_get_many_default(self):
+        s = object()
+        self.assertListEqual(self.tree.get_many([1, 3, 2], s), [s, '3', s])
+
+    def test_get_many_repeated_keys(self):
+        self.assertListEqual(self.tree.get_many([6, 6, 5, 6]), ['6', '6', None, '6'])
+
+    def test_get_many_empty(self):
+        self.assertListEqual(self.tree.get_many([]), [])
+        self.assertListEqual(AVLTree().get_many([1]), [None])
+
+    def test_contains_many(self):
+        keys = list(range(20, -1, -1))
+        self.assertListEqual(
+            self.tree.contains_many(keys),
+            [k % 3 == 0 for k in keys])
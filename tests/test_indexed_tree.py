@@ -0,0 +1,66 @@
+import random
+import unittest
+from pyavl3 import IndexedAVLTree
+
+
+class IndexedAVLTreeTest(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(7)
+        self.keys = rng.sample(range(1000), 200)
+        self.tree = IndexedAVLTree()
+        for k in self.keys:
+            self.tree[k] = str(k)
+        self.sorted = sorted(self.keys)
+
+    def assert_sizes(self, root):
+        if root is None:
+            return 0
+        size = self.assert_sizes(root.left) + self.assert_sizes(root.right) + 1
+        self.assertEqual(root.size, size)
+        return size
+
+    def test_sizes_after_inserts(self):
+        self.assertEqual(self.assert_sizes(self.tree.root), 200)
+
+    def test_sizes_after_deletes(self):
+        for k in self.keys[:120]:
+            del self.tree[k]
+        self.assertEqual(self.assert_sizes(self.tree.root), 80)
+
+    def test_sizes_after_bulk_build_and_copy(self):
+        a = IndexedAVLTree((i, i) for i in range(50))
+        self.assertEqual(self.assert_sizes(a.root), 50)
+        self.assertEqual(self.assert_sizes(a.copy().root), 50)
+
+    def test_select(self):
+        for i, k in enumerate(self.sorted):
+            self.assertEqual(self.tree.select(i), k)
+        self.assertEqual(self.tree.select(-1), self.sorted[-1])
+
+    def test_select_out_of_range(self):
+        with self.assertRaises(IndexError):
+            self.tree.select(200)
+        with self.assertRaises(IndexError):
+            IndexedAVLTree().select(0)
+
+    def test_rank(self):
+        for i, k in enumerate(self.sorted):
+            self.assertEqual(self.tree.rank(k), i)
+        self.assertEqual(self.tree.rank(-1), 0)
+        self.assertEqual(self.tree.rank(5000), 200)
+
+    def test_count_range(self):
+        expected = len([k for k in self.keys if 100 <= k < 600])
+        self.assertEqual(self.tree.count_range(100, 600), expected)
+        self.assertEqual(self.tree.count_range(600, 100), 0)
+
+    def test_byindex(self):
+        items = [(k, str(k)) for k in self.sorted]
+        self.assertEqual(self.tree.byindex[3], items[3])
+        self.assertEqual(self.tree.byindex[-2], items[-2])
+        self.assertListEqual(self.tree.byindex[10:20], items[10:20])
+        self.assertListEqual(self.tree.byindex[190:], items[190:])
+        self.assertListEqual(self.tree.byindex[::7], items[::7])
+        self.assertListEqual(self.tree.byindex[50:10], [])
+        self.assertEqual(len(self.tree.byindex), 200)
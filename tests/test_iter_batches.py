@@ -0,0 +1,67 @@
+import unittest
+from pyavl3 import AVLTree, ConcurrentAVLTree, KeyedAVLTree, LazyAVLTree
+
+
+class IterBatchesTest(unittest.TestCase):
+
+    def setUp(self):
+        self.items = [(k, str(k)) for k in range(0, 100, 2)]
+        self.tree = AVLTree(self.items)
+
+    def test_batches(self):
+        batches = list(self.tree.iter_batches(7))
+        self.assertEqual([len(b) for b in batches], [7] * 7 + [1])
+        self.assertEqual([i for b in batches for i in b], self.items)
+
+    def test_exact_fit(self):
+        batches = list(self.tree.iter_batches(10))
+        self.assertEqual([len(b) for b in batches], [10] * 5)
+
+    def test_columns(self):
+        batches = list(self.tree.iter_batches(20, columns=True))
+        self.assertEqual(len(batches), 3)
+        keys, values = batches[0]
+        self.assertEqual(keys, list(range(0, 40, 2)))
+        self.assertEqual(values, [str(k) for k in range(0, 40, 2)])
+
+    def test_bounds(self):
+        batches = list(self.tree.iter_batches(4, start=11, stop=20))
+        self.assertEqual(batches, [[(12, "12"), (14, "14"), (16, "16"), (18, "18")]])
+        self.assertEqual(list(self.tree.iter_batches(4, start=200)), [])
+
+    def test_resume(self):
+        seen = []
+        last = None
+        while True:
+            if last is None:
+                batches = self.tree.iter_batches(6)
+            else:
+                batches = self.tree.iter_batches(6, start=last, start_inclusive=False)
+            batch = next(batches, None)
+            if batch is None:
+                break
+            seen.extend(batch)
+            last = batch[-1][0]
+        self.assertEqual(seen, self.items)
+
+    def test_empty(self):
+        self.assertEqual(list(AVLTree().iter_batches(3)), [])
+
+    def test_bad_size(self):
+        with self.assertRaises(ValueError):
+            self.tree.iter_batches(0)
+
+    def test_subclasses(self):
+        lazy = LazyAVLTree(self.items)
+        del lazy[0]
+        self.assertEqual(next(lazy.iter_batches(2)), [(2, "2"), (4, "4")])
+
+        keyed = KeyedAVLTree(str.lower, [("B", 2), ("a", 1), ("C", 3)])
+        self.assertEqual(list(keyed.iter_batches(2, columns=True)), [(["a", "B"], [1, 2]), (["C"], [3])])
+
+        shared = ConcurrentAVLTree(self.items)
+        batches = shared.iter_batches(10)
+        next(batches)
+        shared[1] = "1"
+        with self.assertRaises(RuntimeError):
+            next(batches)
@@ -1,5 +1,8 @@
+import random
 import unittest
-from pyavl3 import AVLTree
+from pyavl3 import AVLTree, ConcurrentAVLTree, KeyedAVLTree, LazyAVLTree
+from pyavl3.search import KEYS, NODES
+from pyavl3.traversal import InOrderTraversal, iter_in_order
 
 
 class AVLIteratorTests(unittest.TestCase):
@@ -57,3 +60,77 @@ class AVLIteratorTests(unittest.TestCase):
             self.assertIn(val, expected)
 
         self.assertEqual(len(expected), len(n))
+
+
+class InOrderWalkTests(unittest.TestCase):
+
+    def setUp(self):
+        keys = list(range(200))
+        random.shuffle(keys)
+        self.tree = AVLTree((k, str(k)) for k in keys)
+        self.items = [(k, str(k)) for k in range(200)]
+
+    def test_forward(self):
+        self.assertEqual(list(self.tree), [k for k, _ in self.items])
+        self.assertEqual(list(self.tree.keys()), [k for k, _ in self.items])
+        self.assertEqual(list(self.tree.values()), [v for _, v in self.items])
+        self.assertEqual(list(self.tree.items()), self.items)
+
+    def test_reversed(self):
+        self.assertEqual(list(reversed(self.tree)), [k for k, _ in self.items][::-1])
+        self.assertEqual(list(reversed(self.tree.items())), self.items[::-1])
+        self.assertEqual(list(reversed(self.tree.values())), [v for _, v in self.items][::-1])
+        self.assertEqual(list(reversed(reversed(self.tree.keys()))), list(range(200)))
+
+    def test_next(self):
+        items = self.tree.items()
+        self.assertEqual(next(items), (0, "0"))
+        self.assertEqual(next(items), (1, "1"))
+        self.assertEqual(next(iter(items)), (2, "2"))
+        # reversed starts over from the other end
+        self.assertEqual(next(reversed(items)), (199, "199"))
+
+    def test_empty(self):
+        tree = AVLTree()
+        self.assertEqual(list(tree.items()), [])
+        self.assertEqual(list(reversed(tree)), [])
+
+    def test_iter_in_order(self):
+        root = self.tree.root
+        self.assertEqual([n.key for n in iter_in_order(root, mode=NODES)], list(range(200)))
+        self.assertEqual(list(iter_in_order(root, True, KEYS)), list(range(199, -1, -1)))
+        self.assertEqual(list(iter_in_order(None, mode=KEYS)), [])
+        with self.assertRaises(ValueError):
+            iter_in_order(root, mode="bogus")
+
+    def test_in_order_traversal(self):
+        keys = list(InOrderTraversal(self.tree, lambda n: n.key))
+        self.assertEqual(keys, list(range(200)))
+        self.assertEqual([n.key for n in InOrderTraversal(self.tree.root)], keys)
+
+    def test_replaced_traversal(self):
+        class Doubled(InOrderTraversal):
+            def __next__(self):
+                value = super().__next__()
+                return value, value
+
+        AVLTree.traversal = Doubled
+        try:
+            self.assertEqual(list(self.tree.keys())[:2], [(0, 0), (1, 1)])
+        finally:
+            AVLTree.traversal = InOrderTraversal
+
+    def test_subclasses(self):
+        keyed = KeyedAVLTree(str.lower, [("b", 2), ("A", 1), ("c", 3)])
+        self.assertEqual(list(reversed(keyed)), ["c", "b", "A"])
+        self.assertEqual(list(reversed(keyed.items())), [("c", 3), ("b", 2), ("A", 1)])
+        self.assertEqual(list(keyed.values()), [1, 2, 3])
+
+        lazy = LazyAVLTree(self.items)
+        del lazy[199]
+        del lazy[5]
+        self.assertEqual(next(reversed(lazy.items())), (198, "198"))
+        self.assertNotIn(5, list(reversed(lazy)))
+
+        shared = ConcurrentAVLTree(self.items)
+        self.assertEqual(list(reversed(shared)), list(range(199, -1, -1)))
@@ -0,0 +1,143 @@
+import io
+import pickle
+import random
+import unittest
+from operator import itemgetter
+from pyavl3 import AVLTree, IndexedAVLTree, KeyedAVLTree, PersistentAVLTree
+from pyavl3.search import BetweenSearch, GreatherThanSearch, KEYS, VALUES
+from helpers import avl_height
+
+
+class Record:
+    def __init__(self, tenant, ts):
+        self.tenant = tenant
+        self.ts = ts
+
+    def __repr__(self):
+        return f"Record({self.tenant!r}, {self.ts})"
+
+
+def by_tenant_ts(record):
+    return record.tenant, record.ts
+
+
+class CountingKey:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, k):
+        self.calls += 1
+        return -k
+
+
+class KeyedAVLTreeTest(unittest.TestCase):
+
+    def setUp(self):
+        self.key = CountingKey()
+        self.tree = KeyedAVLTree(self.key, ((k, str(k)) for k in range(20)))
+
+    def test_order_and_mapping(self):
+        self.assertEqual(list(self.tree), list(range(19, -1, -1)))
+        self.assertEqual(list(self.tree.items())[0], (19, "19"))
+        self.assertEqual(list(self.tree.values())[-1], "0")
+        self.assertEqual(self.tree[5], "5")
+        self.assertIn(7, self.tree)
+        self.assertNotIn(70, self.tree)
+        self.assertEqual(self.tree.pop(3), "3")
+        self.assertEqual(self.tree.popitem(4), (4, "4"))
+        with self.assertRaises(KeyError) as ctx:
+            del self.tree[4]
+        self.assertEqual(ctx.exception.args, (4,))
+        self.assertEqual(len(self.tree), 18)
+        avl_height(self, self.tree.root)
+
+    def test_key_called_once_per_operation(self):
+        self.key.calls = 0
+        self.tree[100] = "x"
+        self.tree.get(7)
+        self.tree[8]
+        del self.tree[9]
+        self.assertEqual(self.key.calls, 4)
+        self.tree.get_many([1, 2, 3])
+        self.assertEqual(self.key.calls, 7)
+        list(self.tree.irange(-10, -5))
+        self.assertEqual(self.key.calls, 7)
+
+    def test_searches_take_sort_keys(self):
+        self.assertEqual(list(self.tree.irange(-10, -5, mode=KEYS)), [10, 9, 8, 7, 6])
+        self.assertEqual(list(BetweenSearch(-4, -1, mode=VALUES)(self.tree)), ["3", "2"])
+        self.assertEqual(list(GreatherThanSearch(-2)(self.tree)), [(1, "1"), (0, "0")])
+        self.assertEqual(self.tree.floor(-7), (7, "7"))
+        self.assertEqual(self.tree.higher(-7), (6, "6"))
+        self.assertEqual(self.tree.ceiling_many([-100, 5]), [(19, "19"), None])
+        self.assertEqual(self.tree.min(), (19, "19"))
+        self.assertEqual(self.tree.popmax(), (0, "0"))
+
+    def test_records(self):
+        rng = random.Random(19)
+        records = [Record(rng.choice("abc"), rng.randrange(10000)) for _ in range(300)]
+        tree = KeyedAVLTree(by_tenant_ts)
+        for r in records:
+            tree[r] = r.ts
+        expected = {by_tenant_ts(r): r for r in records}
+        self.assertEqual([by_tenant_ts(r) for r in tree], sorted(expected))
+        b_keys = [k for k in sorted(expected) if k[0] == "b"]
+        self.assertEqual(
+            [by_tenant_ts(r) for r in tree.irange(("b",), ("c",), mode=KEYS)],
+            b_keys,
+        )
+
+    def test_bulk_paths(self):
+        tree = KeyedAVLTree(self.key)
+        tree.update({k: k for k in range(10)})
+        self.assertEqual(tree.update_many((k, -k) for k in range(5, 15)), "merge")
+        self.assertEqual(list(tree.items()), [(k, -k if k >= 5 else k) for k in range(14, -1, -1)])
+        tree.delete_many(range(0, 15, 2))
+        self.assertEqual(list(tree), list(range(13, 0, -2)))
+        avl_height(self, tree.root)
+
+    def test_copies_join_split_and_set_operations(self):
+        copy = self.tree.copy()
+        del copy[0]
+        self.assertIn(0, self.tree)
+        self.assertEqual(repr(copy.copy(deep=True)), repr(copy))
+
+        lt, eq, gt = self.tree.copy().split(-10)
+        self.assertEqual(eq, (10, "10"))
+        self.assertEqual(list(lt), list(range(19, 10, -1)))
+        self.assertEqual(list(gt), list(range(9, -1, -1)))
+        self.assertEqual(list(KeyedAVLTree.join(lt, 10, gt, "ten").items())[9], (10, "ten"))
+
+        evens = KeyedAVLTree(self.key, ((k, k) for k in range(0, 30, 2)))
+        self.assertEqual(list(self.tree.intersection(evens)), list(range(18, -1, -2)))
+        self.assertEqual(list(self.tree.union(evens))[:3], [28, 26, 24])
+        with self.assertRaises(ValueError):
+            self.tree.union(KeyedAVLTree(lambda k: k))
+        with self.assertRaises(ValueError):
+            self.tree.union(AVLTree())
+
+    def test_serialization(self):
+        tree = KeyedAVLTree(itemgetter(1), [((1, "b"), 1), ((2, "a"), 2)])
+        self.assertEqual(list(tree), [(2, "a"), (1, "b")])
+        restored = pickle.loads(pickle.dumps(tree))
+        self.assertEqual(list(restored.items()), list(tree.items()))
+        fp = io.BytesIO()
+        tree.dump(fp)
+        fp.seek(0)
+        self.assertEqual(list(KeyedAVLTree.load(itemgetter(1), fp).items()), list(tree.items()))
+        self.assertEqual(repr(KeyedAVLTree.fromkeys(abs, [-1, 2])), "<AVL {2: None, -1: None}>")
+
+    def test_other_trees_read_items(self):
+        keyed = KeyedAVLTree(str.lower, [("a", 1), ("B", 2)])
+        items = [("a", 1), ("B", 2)]
+        for cls in (AVLTree, IndexedAVLTree, PersistentAVLTree):
+            self.assertEqual(sorted(cls(keyed).items()), sorted(items))
+            tree = cls()
+            tree.update(keyed)
+            self.assertEqual(sorted(tree.items()), sorted(items))
+            tree = cls({"c": 3})
+            tree.update(keyed)
+            self.assertEqual(sorted(tree.items()), sorted(items + [("c", 3)]))
+            union = cls({"c": 3}).union(keyed)
+            self.assertEqual(sorted(union.items()), sorted(items + [("c", 3)]))
+            avl_height(self, union.root)
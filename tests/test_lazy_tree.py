@@ -0,0 +1,105 @@
+import random
+import unittest
+from pyavl3 import AVLTree, LazyAVLTree
+from pyavl3.search import BetweenSearch, KEYS
+from pyavl3.traversal import InOrderTraversal
+from helpers import avl_height
+
+
+class LazyAVLTreeTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tree = LazyAVLTree((k, str(k)) for k in range(20))
+
+    def test_delete_leaves_structure(self):
+        root = self.tree._root
+        del self.tree[7]
+        self.assertIs(self.tree._root, root)
+        self.assertEqual(self.tree._dead, 1)
+        self.assertEqual(len(self.tree), 19)
+        self.assertNotIn(7, self.tree)
+        self.assertIsNone(self.tree.get(7))
+        with self.assertRaises(KeyError):
+            self.tree[7]
+        with self.assertRaises(KeyError):
+            del self.tree[7]
+        self.assertNotRegex(repr(self.tree), r"\b7:")
+
+    def test_reinsert_revives_in_place(self):
+        node = self.tree._get(self.tree._root, 7)
+        del self.tree[7]
+        self.tree[7] = "seven"
+        self.assertIs(self.tree._get(self.tree._root, 7), node)
+        self.assertEqual(self.tree._dead, 0)
+        self.assertEqual(len(self.tree), 20)
+
+    def test_reads_skip_tombstones(self):
+        for k in (0, 5, 6, 7, 19):
+            del self.tree[k]
+        live = [k for k in range(20) if k not in (0, 5, 6, 7, 19)]
+        self.assertEqual(list(self.tree), live)
+        self.assertEqual(list(self.tree.values()), [str(k) for k in live])
+        self.assertEqual(list(self.tree.irange(4, 9, mode=KEYS)), [4, 8])
+        self.assertEqual(list(self.tree.irange(4, 9, reverse=True, mode=KEYS)), [8, 4])
+        self.assertEqual(list(BetweenSearch(3, 9, mode=KEYS)(self.tree)), [4, 8])
+        self.assertEqual(self.tree.floor(7), (4, "4"))
+        self.assertEqual(self.tree.ceiling(5), (8, "8"))
+        self.assertEqual(self.tree.lower(8), (4, "4"))
+        self.assertEqual(self.tree.higher(4), (8, "8"))
+        self.assertEqual(self.tree.floor_many([6, -1]), [(4, "4"), None])
+        self.assertEqual(self.tree.get_many([5, 8]), [None, "8"])
+        self.assertEqual(self.tree.contains_many([5, 8]), [False, True])
+        self.assertEqual(self.tree.min(), (1, "1"))
+        self.assertEqual(self.tree.max(), (18, "18"))
+        self.assertEqual(self.tree.popmin(), (1, "1"))
+        self.assertEqual(self.tree.popmax(), (18, "18"))
+
+    def test_compaction_threshold(self):
+        tree = LazyAVLTree((k, k) for k in range(100))
+        for k in range(25):
+            del tree[k]
+        self.assertEqual(tree._dead, 25)
+        del tree[25]
+        self.assertEqual(tree._dead, 0)
+        self.assertEqual(list(tree), list(range(26, 100)))
+        avl_height(self, tree._root)
+
+        tree.compact_ratio = 1.0
+        for k in range(26, 99):
+            del tree[k]
+        self.assertEqual(len(tree), 1)
+        tree.compact()
+        self.assertEqual(tree._dead, 0)
+        self.assertEqual(list(tree.items()), [(99, 99)])
+
+    def test_structure_exports_compact(self):
+        for k in range(0, 20, 3):
+            del self.tree[k]
+        live = [k for k in range(20) if k % 3]
+        self.assertEqual([n.key for n in InOrderTraversal(self.tree)], live)
+        self.assertEqual(self.tree._dead, 0)
+
+        del self.tree[1]
+        self.assertEqual(list(AVLTree(self.tree)), live[1:])
+        del self.tree[2]
+        self.assertEqual(list(self.tree.copy()), live[2:])
+        del self.tree[4]
+        lt, eq, gt = self.tree.copy().split(10)
+        self.assertEqual((list(lt), eq, list(gt)), ([5, 7, 8], (10, "10"), [11, 13, 14, 16, 17, 19]))
+        del self.tree[5]
+        self.assertEqual(list(self.tree.union(AVLTree({5: "x"}))), [5] + live[4:])
+
+    def test_matches_avl_tree(self):
+        rng = random.Random(21)
+        lazy = LazyAVLTree()
+        model = AVLTree()
+        for _ in range(4000):
+            k = rng.randrange(300)
+            if k in model and rng.random() < 0.5:
+                self.assertEqual(lazy.pop(k), model.pop(k))
+            else:
+                lazy[k] = model[k] = rng.random()
+        self.assertEqual(list(lazy.items()), list(model.items()))
+        self.assertEqual(len(lazy), len(model))
+        self.assertLessEqual(lazy._dead, lazy.compact_ratio * (len(lazy) + lazy._dead))
+        avl_height(self, lazy._root)
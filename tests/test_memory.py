@@ -0,0 +1,39 @@
+import sys
+import unittest
+from pyavl3 import AVLTree
+from pyavl3.avl_node import AVLNode
+
+
+class AVLTreeMemoryTest(unittest.TestCase):
+
+    def test_node_has_no_dict(self):
+        n = AVLNode(1, 'a')
+        self.assertFalse(hasattr(n, '__dict__'))
+        with self.assertRaises(AttributeError):
+            n.other = 1
+
+    def test_empty_report(self):
+        a = AVLTree()
+        report = a.memory_usage()
+        self.assertEqual(report['entries'], 0)
+        self.assertEqual(report['nodes'], 0)
+        self.assertEqual(report['per_entry'], 0.0)
+
+    def test_node_bytes(self):
+        a = AVLTree((i, i) for i in range(10))
+        report = a.memory_usage()
+        self.assertEqual(report['nodes'], 10 * sys.getsizeof(a.root))
+        self.assertEqual(report['keys'], 0)
+        self.assertEqual(report['total'], report['tree'] + report['nodes'])
+
+    def test_deep_counts_shared_objects_once(self):
+        value = 'x' * 1000
+        a = AVLTree((i, value) for i in range(1000, 1010))
+        report = a.memory_usage(deep=True)
+        self.assertEqual(report['values'], sys.getsizeof(value))
+        self.assertEqual(report['keys'], 10 * sys.getsizeof(1000))
+
+    def test_getsizeof_includes_nodes(self):
+        a = AVLTree()
+        b = AVLTree((i, i) for i in range(100))
+        self.assertGreater(sys.getsizeof(b), sys.getsizeof(a))
@@ -0,0 +1,153 @@
+import copy
+import io
+import pickle
+import unittest
+from pyavl3 import AVLTree, AVLMultiTree
+from pyavl3.avl_tree import MERGE
+from helpers import avl_height
+
+
+class AVLMultiTreeTest(unittest.TestCase):
+
+    def setUp(self):
+        self.pairs = [(1, "a"), (2, "b"), (1, "c"), (3, "d"), (2, "e"), (1, "f")]
+        self.tree = AVLMultiTree(self.pairs)
+
+    def test_add_and_count(self):
+        self.assertEqual(self.tree.count(1), 3)
+        self.assertEqual(self.tree.count(4), 0)
+        self.tree.add(4, "g")
+        self.tree[4] = "h"
+        self.assertEqual(self.tree[4], ["g", "h"])
+        self.assertEqual(self.tree.count(4), 2)
+        self.assertEqual(len(self.tree), 4)
+
+    def test_add_is_one_descent(self):
+        node = self.tree._get(self.tree._root, 1)
+        values = node.value
+        calls = []
+        descend = self.tree._descend
+        self.tree._descend = lambda root, key: calls.append(key) or descend(root, key)
+        self.tree.add(1, "z")
+        self.tree.add(9, "y")
+        self.assertEqual(calls, [1, 9])
+        self.assertIs(self.tree._get(self.tree._root, 1).value, values)
+
+    def test_lookups_copy(self):
+        values = self.tree[1]
+        self.assertEqual(values, ["a", "c", "f"])
+        values.append("x")
+        self.assertEqual(self.tree.get(1), ["a", "c", "f"])
+        self.assertIsNone(self.tree.get(9))
+        self.assertEqual(self.tree.min(), (1, ["a", "c", "f"]))
+        self.assertEqual(self.tree.max(), (3, ["d"]))
+        self.assertEqual(self.tree.floor(2), (2, ["b", "e"]))
+        self.assertEqual(self.tree.get_many([3, 9, 2]), [["d"], None, ["b", "e"]])
+
+    def test_remove(self):
+        self.tree.remove(1, "c")
+        self.assertEqual(self.tree[1], ["a", "f"])
+        self.tree.remove(3, "d")
+        self.assertNotIn(3, self.tree)
+        self.assertEqual(len(self.tree), 2)
+        with self.assertRaises(KeyError):
+            self.tree.remove(3, "d")
+        with self.assertRaises(ValueError):
+            self.tree.remove(1, "nope")
+
+    def test_remove_all(self):
+        tree = AVLMultiTree((k % 50, k) for k in range(500))
+        for k in range(500):
+            tree.remove(k % 50, k)
+            avl_height(self, tree.root)
+        self.assertFalse(tree)
+        self.assertEqual(len(tree), 0)
+
+    def test_iteration(self):
+        flat = sorted(self.pairs, key=lambda p: p[0])
+        self.assertEqual(list(self.tree), [1, 2, 3])
+        self.assertEqual(list(self.tree.items()), flat)
+        self.assertEqual(list(self.tree.values()), [v for _, v in flat])
+        self.assertEqual(list(reversed(self.tree.items())), flat[::-1])
+
+    def test_irange(self):
+        self.assertEqual(list(self.tree.irange(2, 4)), [(2, "b"), (2, "e"), (3, "d")])
+        self.assertEqual(list(self.tree.irange(1, 2, mode="values")), ["a", "c", "f"])
+        self.assertEqual(list(self.tree.irange(1, 3, reverse=True, mode="values")), ["e", "b", "f", "c", "a"])
+        self.assertEqual(list(self.tree.irange(mode="keys")), [1, 2, 3])
+        self.assertEqual(list(self.tree.iter_batches(4)), [
+            [(1, "a"), (1, "c"), (1, "f"), (2, "b")],
+            [(2, "e"), (3, "d")],
+        ])
+
+    def test_unsorted_load(self):
+        tree = AVLMultiTree((k % 7, k) for k in range(100, 0, -1))
+        self.assertEqual(len(tree), 7)
+        self.assertEqual(tree[0], list(range(98, 0, -7)))
+        avl_height(self, tree.root)
+
+    def test_update(self):
+        self.tree.update([(1, "g"), (5, "h")])
+        self.tree.update(AVLMultiTree([(5, "i")]))
+        self.assertEqual(self.tree[1], ["a", "c", "f", "g"])
+        self.assertEqual(self.tree[5], ["h", "i"])
+
+    def test_update_many_merge(self):
+        tree = AVLMultiTree((k, k) for k in range(10))
+        strategy = tree.update_many([(k % 20, "x") for k in range(40)])
+        self.assertEqual(strategy, MERGE)
+        self.assertEqual(tree[3], [3, "x", "x"])
+        self.assertEqual(tree[15], ["x", "x"])
+        self.assertEqual(len(tree), 20)
+        avl_height(self, tree.root)
+
+    def test_copies_do_not_share_values(self):
+        for other in (self.tree.copy(), copy.deepcopy(self.tree), AVLMultiTree(self.tree)):
+            other.add(1, "new")
+            self.assertEqual(self.tree[1], ["a", "c", "f"])
+            self.assertEqual(other[1], ["a", "c", "f", "new"])
+
+    def test_from_plain_tree(self):
+        tree = AVLMultiTree(AVLTree({1: "a", 2: "b"}))
+        self.assertEqual(tree[1], ["a"])
+
+    def test_plain_trees_are_read_through_items(self):
+        plain = AVLTree({2: "xy", 7: 5})
+        self.tree.update(plain)
+        self.assertEqual(self.tree[2], ["b", "e", "xy"])
+        self.assertEqual(self.tree[7], [5])
+        union = AVLMultiTree([(1, "a")]).union(plain)
+        self.assertEqual(list(union.items()), [(1, "a"), (2, "xy"), (7, 5)])
+        avl_height(self, union.root)
+
+    def test_plain_tree_from_multi_tree(self):
+        plain = AVLTree(self.tree)
+        self.assertEqual(list(plain.items()), [(1, "f"), (2, "e"), (3, "d")])
+        plain[1] = "new"
+        self.assertEqual(self.tree[1], ["a", "c", "f"])
+        self.assertEqual(dict(AVLTree().union(self.tree).items()), dict(plain.items()) | {1: "f"})
+
+    def test_pickle_and_dump(self):
+        clone = pickle.loads(pickle.dumps(self.tree))
+        self.assertIsInstance(clone, AVLMultiTree)
+        self.assertEqual(list(clone.items()), list(self.tree.items()))
+        fp = io.BytesIO()
+        self.tree.dump(fp)
+        fp.seek(0)
+        self.assertEqual(list(AVLMultiTree.load(fp).items()), list(self.tree.items()))
+
+    def test_split_join(self):
+        lt, eq, gt = self.tree.split(2)
+        self.assertEqual(eq, (2, ["b", "e"]))
+        tree = AVLMultiTree.join(lt, eq[0], gt, eq[1])
+        self.assertEqual(list(tree.items()), sorted(self.pairs, key=lambda p: p[0]))
+        with self.assertRaises(ValueError):
+            AVLMultiTree.join(AVLMultiTree(), 1, AVLMultiTree())
+
+    def test_cursor(self):
+        cursor = self.tree.cursor(2)
+        self.assertEqual(cursor.value, ["b", "e"])
+        cursor.set_value(["q"])
+        self.assertEqual(self.tree[2], ["q"])
+        with self.assertRaises(ValueError):
+            cursor.set_value([])
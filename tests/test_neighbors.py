@@ -0,0 +1,61 @@
+import unittest
+from pyavl3 import AVLTree
+
+
+class AVLTreeNeighborTest(unittest.TestCase):
+
+    def setUp(self):
+        self.keys = list(range(0, 100, 10))
+        self.tree = AVLTree((k, str(k)) for k in self.keys)
+        self.probes = [-5, 0, 5, 10, 45, 50, 90, 95]
+
+    def brute(self, key, op):
+        if op == 'floor':
+            found = [k for k in self.keys if k <= key]
+            return (found[-1], str(found[-1])) if found else None
+        if op == 'lower':
+            found = [k for k in self.keys if k < key]
+            return (found[-1], str(found[-1])) if found else None
+        if op == 'ceiling':
+            found = [k for k in self.keys if k >= key]
+            return (found[0], str(found[0])) if found else None
+        found = [k for k in self.keys if k > key]
+        return (found[0], str(found[0])) if found else None
+
+    def test_single_queries(self):
+        for op in ('floor', 'ceiling', 'lower', 'higher'):
+            for key in self.probes:
+                with self.subTest(op=op, key=key):
+                    expected = self.brute(key, op)
+                    if expected is None:
+                        with self.assertRaises(KeyError):
+                            getattr(self.tree, op)(key)
+                    else:
+                        self.assertEqual(getattr(self.tree, op)(key), expected)
+
+    def test_batch_queries(self):
+        for op in ('floor', 'ceiling', 'lower', 'higher'):
+            for probes in (self.probes, self.probes[::-1], [50, 5, 95, 0, 45]):
+                with self.subTest(op=op, probes=probes):
+                    self.assertListEqual(
+                        getattr(self.tree, op + '_many')(probes),
+                        [self.brute(k, op) for k in probes])
+
+    def test_batch_on_empty_tree(self):
+        self.assertListEqual(AVLTree().floor_many([1, 2]), [None, None])
+
+    def test_min_max(self):
+        self.assertEqual(self.tree.min(), (0, '0'))
+        self.assertEqual(self.tree.max(), (90, '90'))
+
+    def test_popmin_popmax(self):
+        self.assertEqual(self.tree.popmin(), (0, '0'))
+        self.assertEqual(self.tree.popmax(), (90, '90'))
+        self.assertEqual(len(self.tree), 8)
+        self.assertListEqual(list(self.tree.keys()), self.keys[1:-1])
+
+    def test_empty_raises(self):
+        a = AVLTree()
+        for op in (a.min, a.max, a.popmin, a.popmax):
+            with self.assertRaises(KeyError):
+                op()
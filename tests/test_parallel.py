@@ -0,0 +1,67 @@
+import random
+import unittest
+from pyavl3 import AVLTree, ConcurrentAVLTree, IndexedAVLTree, KeyedAVLTree, parallel
+from helpers import avl_height
+
+
+class ParallelTest(unittest.TestCase):
+
+    def setUp(self):
+        # Small inputs, still spread over several processes
+        self.min_partition = parallel.MIN_PARTITION
+        parallel.MIN_PARTITION = 100
+
+    def tearDown(self):
+        parallel.MIN_PARTITION = self.min_partition
+
+    def test_build(self):
+        rng = random.Random(20)
+        items = [(rng.randrange(4000), i) for i in range(3000)]
+        for workers in (1, 3):
+            tree = parallel.build(items, workers=workers)
+            self.assertEqual(list(tree.items()), sorted(dict(items).items()))
+            self.assertEqual(len(tree), len(dict(items)))
+            avl_height(self, tree.root)
+
+    def test_build_tree_type_and_dict(self):
+        data = {k: -k for k in random.Random(2).sample(range(10000), 1000)}
+        tree = parallel.build(data, workers=2, tree_type=IndexedAVLTree)
+        self.assertIsInstance(tree, IndexedAVLTree)
+        self.assertEqual(tree.rank(max(data)), len(data) - 1)
+        self.assertEqual(parallel.build([]).root, None)
+
+    def test_union_and_update(self):
+        a = AVLTree((k, "a") for k in range(0, 3000, 2))
+        b = AVLTree((k, "b") for k in range(0, 4500, 3))
+        expected = list(a.union(b).items())
+        result = parallel.union(a, b, workers=3)
+        self.assertEqual(list(result.items()), expected)
+        avl_height(self, result.root)
+        self.assertEqual(len(a), 1500)
+
+        parallel.update(a, b, workers=3)
+        self.assertEqual(list(a.items()), expected)
+        self.assertEqual(len(a), len(expected))
+        avl_height(self, a.root)
+
+    def test_update_concurrent_tree(self):
+        tree = ConcurrentAVLTree((k, "a") for k in range(0, 3000, 2))
+        other = AVLTree((k, "b") for k in range(0, 4500, 3))
+        expected = list(tree.union(other).items())
+        keys = tree.keys()
+        parallel.update(tree, other, workers=3)
+        self.assertEqual(list(tree.items()), expected)
+        with self.assertRaises(RuntimeError):
+            next(keys)
+        # A failed update leaves the tree and its iterators alone
+        keys = tree.keys()
+        with self.assertRaises(TypeError):
+            parallel.update(tree, KeyedAVLTree(str.lower, a=1))
+        self.assertEqual(next(keys), 0)
+
+    def test_keyed_trees_rejected(self):
+        keyed = KeyedAVLTree(str.lower, [("a", 1), ("B", 2)])
+        with self.assertRaises(TypeError):
+            parallel.union(keyed, keyed)
+        with self.assertRaises(TypeError):
+            parallel.build([("a", 1)], tree_type=KeyedAVLTree)
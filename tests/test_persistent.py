@@ -0,0 +1,96 @@
+import random
+import unittest
+from pyavl3 import PersistentAVLTree
+from helpers import avl_height
+
+
+def nodes(root):
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if node is not None:
+            yield node
+            stack.append(node.left)
+            stack.append(node.right)
+
+
+def freeze(tree):
+    """Capture every node field so later mutation can be detected"""
+    return {
+        id(n): (n, n.key, n.value, n.left, n.right, n.height)
+        for n in nodes(tree.root)
+    }
+
+
+class PersistentAVLTreeTest(unittest.TestCase):
+
+    def assert_unchanged(self, frozen):
+        for n, key, value, left, right, height in frozen.values():
+            self.assertEqual((n.key, n.value, n.left, n.right, n.height),
+                             (key, value, left, right, height))
+
+    def test_random_history(self):
+        rng = random.Random(9)
+        tree = PersistentAVLTree()
+        expected = {}
+        versions = []
+        for _ in range(600):
+            key = rng.randrange(150)
+            if key in expected and rng.random() < 0.4:
+                del tree[key]
+                del expected[key]
+            else:
+                tree[key] = rng.random()
+                expected[key] = tree[key]
+            if rng.random() < 0.1:
+                versions.append((tree.snapshot(), dict(expected), freeze(tree)))
+
+        for snapshot, items, frozen in versions:
+            self.assert_unchanged(frozen)
+            self.assertListEqual(list(snapshot.items()), sorted(items.items()))
+            self.assertEqual(len(snapshot), len(items))
+            avl_height(self, snapshot.root)
+        avl_height(self, tree.root)
+
+    def test_snapshot_shares_nodes(self):
+        tree = PersistentAVLTree((i, i) for i in range(1000))
+        snap = tree.snapshot()
+        self.assertIs(snap.root, tree.root)
+        tree[2000] = 'x'
+        shared = set(map(id, nodes(snap.root))) & set(map(id, nodes(tree.root)))
+        self.assertGreater(len(shared), 1000 - 2 * (tree.root.height + 2))
+
+    def test_update_copies(self):
+        tree = PersistentAVLTree(a=1)
+        snap = tree.copy()
+        tree['a'] = 2
+        self.assertEqual(snap['a'], 1)
+        self.assertEqual(tree['a'], 2)
+
+    def test_bulk_and_set_operations_leave_snapshots_alone(self):
+        tree = PersistentAVLTree((i, i) for i in range(0, 200, 2))
+        other = PersistentAVLTree((i, 'o') for i in range(0, 200, 3))
+        frozen = freeze(tree)
+        frozen_other = freeze(other)
+
+        union = tree.union(other)
+        self.assertEqual(len(union), len(set(range(0, 200, 2)) | set(range(0, 200, 3))))
+        tree.difference(other)
+        tree.symmetric_difference(other)
+        tree.intersection(other)
+        lt, eq, gt = tree.split(100)
+        self.assertEqual(eq, (100, 100))
+        self.assertEqual(len(lt) + len(gt), 99)
+        self.assertEqual(len(tree), 100)
+        joined = PersistentAVLTree.join(lt, 100, gt)
+        self.assertEqual(len(lt), 50)
+        avl_height(self, joined.root)
+
+        snap = tree.snapshot()
+        tree.update_many((i, 'u') for i in range(300))
+        tree.delete_many(range(0, 300, 5))
+        self.assertEqual(len(snap), 100)
+
+        self.assert_unchanged(frozen)
+        self.assert_unchanged(frozen_other)
+        avl_height(self, tree.root)
@@ -0,0 +1,210 @@
+import random
+import unittest
+from pyavl3 import AVLTree, PoolAVLTree
+from pyavl3.pool_tree import NIL
+from pyavl3.search import (
+    GreatherThanSearch,
+    LessThanSearch,
+    BetweenSearch,
+    RangeSearch,
+    KEYS,
+    NODES,
+)
+from pyavl3.traversal import InOrderTraversal, BreadthFirstTraversal
+import test_avl
+import test_clear
+import test_constructors
+import test_copy
+import test_fromkeys
+import test_pop
+import test_repr
+import test_search
+import test_setdefault
+import test_update
+
+
+def pool_height(test, tree, i):
+    if i == NIL:
+        return -1
+    lh = pool_height(test, tree, tree._left[i])
+    rh = pool_height(test, tree, tree._right[i])
+    test.assertEqual(tree._height[i], max(lh, rh) + 1)
+    test.assertLessEqual(abs(lh - rh), 1)
+    return tree._height[i]
+
+
+class PoolAVLTreeTest(unittest.TestCase):
+
+    def test_matches_avl_tree(self):
+        rng = random.Random(14)
+        pool = PoolAVLTree()
+        model = AVLTree()
+        for _ in range(3000):
+            k = rng.randrange(500)
+            if rng.random() < 0.4 and k in model:
+                self.assertEqual(pool.pop(k), model.pop(k))
+            else:
+                pool[k] = model[k] = rng.random()
+        pool_height(self, pool, pool._root)
+        self.assertEqual(len(pool), len(model))
+        self.assertEqual(list(pool.items()), list(model.items()))
+
+    def test_slots_are_reused(self):
+        tree = PoolAVLTree((i, i) for i in range(100))
+        for i in range(50):
+            del tree[i]
+        for i in range(100, 150):
+            tree[i] = i
+        self.assertEqual(len(tree._keys), 100)
+        self.assertEqual(list(tree), list(range(50, 150)))
+        pool_height(self, tree, tree._root)
+
+    def test_repr_matches_avl_tree(self):
+        items = [(k, 0) for k in "abcdefg"]
+        self.assertEqual(repr(PoolAVLTree(items)), repr(AVLTree(items)))
+        self.assertEqual(repr(PoolAVLTree()), "<AVL {}>")
+
+    def test_unsorted_load(self):
+        data = {k: str(k) for k in random.Random(1).sample(range(1000), 300)}
+        tree = PoolAVLTree(data)
+        self.assertEqual(list(tree.items()), sorted(data.items()))
+        pool_height(self, tree, tree._root)
+
+    def test_sorted_load_keeps_last_duplicate(self):
+        tree = PoolAVLTree([(1, "a"), (2, "b"), (2, "c"), (3, "d")])
+        self.assertEqual(list(tree.items()), [(1, "a"), (2, "c"), (3, "d")])
+        pool_height(self, tree, tree._root)
+
+    def test_mapping_api(self):
+        tree = PoolAVLTree(a=1)
+        tree.setdefault("a", 5)
+        tree.setdefault("b", 2)
+        tree.update({"c": 3}, d=4)
+        self.assertEqual(dict(tree.items()), {"a": 1, "b": 2, "c": 3, "d": 4})
+        self.assertEqual(tree.popitem("b"), ("b", 2))
+        self.assertIsNone(tree.get("b"))
+        with self.assertRaises(KeyError):
+            tree["b"]
+        with self.assertRaises(KeyError):
+            del tree["b"]
+        self.assertEqual(list(tree.values()), [1, 3, 4])
+        tree.clear()
+        self.assertFalse(tree)
+        self.assertEqual(len(tree), 0)
+
+    def test_update_after_deleting_everything(self):
+        tree = PoolAVLTree((i, i) for i in range(5))
+        for i in range(5):
+            del tree[i]
+        tree.update([(1, "a"), (2, "b")])
+        self.assertEqual(list(tree.items()), [(1, "a"), (2, "b")])
+        self.assertEqual(len(tree), 2)
+        pool_height(self, tree, tree._root)
+
+    def test_delete_keeps_other_slots(self):
+        tree = PoolAVLTree()
+        tree[5] = "a"
+        tree[4] = "b"
+        tree[6] = "c"
+        successor = tree.root.right
+        del tree[5]
+        self.assertEqual(tree.root, successor)
+        self.assertEqual((successor.key, successor.value), (6, "c"))
+        pool_height(self, tree, tree._root)
+
+    def test_copy_is_independent(self):
+        tree = PoolAVLTree.fromkeys(range(10), 0)
+        other = tree.copy()
+        other[3] = 1
+        del other[4]
+        self.assertEqual(tree[3], 0)
+        self.assertIn(4, tree)
+        self.assertEqual(list(PoolAVLTree(other).items()), list(other.items()))
+
+    def test_searches(self):
+        tree = PoolAVLTree((i, i * i) for i in range(20))
+        self.assertEqual(list(GreatherThanSearch(15)(tree)), [(k, k * k) for k in range(16, 20)])
+        self.assertEqual(list(LessThanSearch(3, reverse=True, mode=KEYS)(tree)), [2, 1, 0])
+        self.assertEqual(
+            list(BetweenSearch(5, 9, lower_inclusive=True, mode=KEYS)(tree)),
+            [5, 6, 7, 8],
+        )
+        self.assertEqual(list(RangeSearch(mode=KEYS)(tree)), list(range(20)))
+        nodes = list(tree.irange(18, mode=NODES))
+        self.assertEqual([(n.key, n.value) for n in nodes], [(18, 324), (19, 361)])
+        with self.assertRaises(ValueError):
+            tree.irange(mode="bogus")
+
+    def test_irange_matches_avl_tree(self):
+        keys = random.Random(3).sample(range(200), 80)
+        pool = PoolAVLTree.fromkeys(keys)
+        model = AVLTree.fromkeys(keys)
+        for lo, hi in [(None, None), (10, 90), (50, 50), (-5, 500)]:
+            for flags in [(True, False), (False, True), (True, True), (False, False)]:
+                for reverse in (False, True):
+                    args = (lo, hi) + flags + (reverse, KEYS)
+                    self.assertEqual(list(pool.irange(*args)), list(model.irange(*args)))
+
+    def test_root_proxies_traverse(self):
+        items = [(k, 0) for k in "abcdefg"]
+        pool = PoolAVLTree(items)
+        model = AVLTree(items)
+        self.assertEqual(
+            [n.key for n in BreadthFirstTraversal(pool.root)],
+            [n.key for n in BreadthFirstTraversal(model.root)],
+        )
+        self.assertEqual([n.key for n in InOrderTraversal(pool.root)], list("abcdefg"))
+        self.assertIsNone(PoolAVLTree().root)
+
+    def test_memory_usage(self):
+        tree = PoolAVLTree((i, i) for i in range(10000))
+        usage = tree.memory_usage()
+        self.assertEqual(usage["entries"], 10000)
+        self.assertEqual(usage["total"], usage["tree"] + usage["pools"])
+        self.assertLess(usage["per_entry"], AVLTree(tree.items()).memory_usage()["per_entry"])
+
+
+# The AVLTree behaviour tests, run on PoolAVLTree
+
+class PoolTreeTest(test_avl.AVLTreeTest):
+    tree_type = PoolAVLTree
+
+
+class PoolClearTest(test_clear.AVLClearTest):
+    tree_type = PoolAVLTree
+
+
+class PoolCreateTest(test_constructors.AVLCreatTest):
+    tree_type = PoolAVLTree
+
+
+class PoolCopyTest(test_copy.AVLTreeCopyTest):
+    tree_type = PoolAVLTree
+
+
+class PoolFromKeysTest(test_fromkeys.AVLTreeFromKeysTest):
+    tree_type = PoolAVLTree
+
+
+class PoolPopItemTest(test_pop.AVLTreePopItemTest):
+    tree_type = PoolAVLTree
+
+
+class PoolReprTest(test_repr.AVLTreeReprTest):
+    tree_type = PoolAVLTree
+
+
+class PoolSearchAlgorithmTest(test_search.SearchAlgorithmTest):
+    tree_type = PoolAVLTree
+
+
+class PoolRangeSearchTest(test_search.RangeSearchTest):
+    tree_type = PoolAVLTree
+
+
+class PoolSetDefaultTest(test_setdefault.AVLTreeSetDefaultTest):
+    tree_type = PoolAVLTree
+
+
+class PoolUpdateTest(test_update.AVLTreeUpdateTest):
+    tree_type = PoolAVLTree
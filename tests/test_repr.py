@@ -4,20 +4,22 @@ from pyavl3 import AVLTree
 
 class AVLTreeReprTest(unittest.TestCase):
 
+    tree_type = AVLTree
+
     def test_empty_create(self):
-        a = AVLTree()
+        a = self.tree_type()
         self.assertEqual(str(a), "<AVL {}>")
 
     def test_1_item(self):
-        a = AVLTree(a=1)
+        a = self.tree_type(a=1)
         self.assertEqual(str(a), "<AVL {a: 1}>")
 
     def test_flipped_1_item(self):
-        a = AVLTree({1: 'a'})
+        a = self.tree_type({1: 'a'})
         self.assertEqual(str(a), "<AVL {1: a}>")
 
     def test_longer_item(self):
-        a = AVLTree([
+        a = self.tree_type([
             # Order of insert is important because
             # repr should do a breadth first traversal.
             ("a", 1), ("b", 2),
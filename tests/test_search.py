@@ -6,11 +6,18 @@ from pyavl3.search import (
     LessThanSearch,
     LessThanOrEqualSearch,
     BetweenSearch,
+    RangeSearch,
+    KEYS,
+    VALUES,
+    NODES,
 )
 
 
 
 class SearchAlgorithmTest(unittest.TestCase):
+
+    tree_type = AVLTree
+
     def setUp(self):
         self.values = [
             (1, 'a'), (2, 'b'),
@@ -29,11 +36,79 @@ class SearchAlgorithmTest(unittest.TestCase):
     def test_algos(self):
         for algo, expected in self.cases:
             with self.subTest(algo):
-                a = AVLTree(self.values)
+                a = self.tree_type(self.values)
                 self.assertListEqual(list(algo(a)), list(expected))
 
     def test_algos_empty(self):
         for algo, _ in self.cases:
             with self.subTest(algo):
-                a = AVLTree()
+                a = self.tree_type()
                 self.assertListEqual(list(algo(a)), [])
+
+
+class RangeSearchTest(unittest.TestCase):
+
+    tree_type = AVLTree
+
+    def setUp(self):
+        import random
+        rng = random.Random(3)
+        self.keys = sorted(rng.sample(range(200), 60))
+        self.tree = self.tree_type((k, str(k)) for k in self.keys)
+
+    def expected(self, lo, hi, lo_inc, hi_inc):
+        return [
+            k for k in self.keys
+            if (lo is None or (k >= lo if lo_inc else k > lo))
+            and (hi is None or (k <= hi if hi_inc else k < hi))
+        ]
+
+    def test_bounds_and_flags(self):
+        bounds = [None, -1, 0, self.keys[5], self.keys[30] + 1, self.keys[-1], 500]
+        for lo in bounds:
+            for hi in bounds:
+                for lo_inc in (True, False):
+                    for hi_inc in (True, False):
+                        keys = self.expected(lo, hi, lo_inc, hi_inc)
+                        search = RangeSearch(lo, hi, lo_inc, hi_inc, mode=KEYS)
+                        self.assertListEqual(list(search(self.tree)), keys)
+                        search = RangeSearch(lo, hi, lo_inc, hi_inc, reverse=True, mode=KEYS)
+                        self.assertListEqual(list(search(self.tree)), keys[::-1])
+
+    def test_modes(self):
+        keys = self.expected(self.keys[3], self.keys[9], True, True)
+        lo, hi = self.keys[3], self.keys[9]
+        self.assertListEqual(
+            list(RangeSearch(lo, hi, upper_inclusive=True, mode=VALUES)(self.tree)),
+            [str(k) for k in keys])
+        self.assertListEqual(
+            list(RangeSearch(lo, hi, upper_inclusive=True)(self.tree)),
+            [(k, str(k)) for k in keys])
+        self.assertListEqual(
+            [n.key for n in RangeSearch(lo, hi, upper_inclusive=True, mode=NODES)(self.tree)],
+            keys)
+
+    def test_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            RangeSearch(mode="bogus")
+
+    def test_tree_irange(self):
+        self.assertListEqual(
+            list(self.tree.irange(self.keys[10], reverse=True, mode=KEYS)),
+            self.keys[10:][::-1])
+
+    def test_reverse_shorthand_searches(self):
+        self.assertListEqual(
+            list(LessThanSearch(self.keys[4], reverse=True, mode=KEYS)(self.tree)),
+            self.keys[:4][::-1])
+        self.assertListEqual(
+            list(GreatherThanOrEqualSearch(self.keys[-3], mode=KEYS)(self.tree)),
+            self.keys[-3:])
+
+    def test_walks_root_of_plain_adt(self):
+        class Rooted:
+            root = self.tree.root
+
+        self.assertListEqual(
+            list(BetweenSearch(self.keys[0], self.keys[4], mode=KEYS)(Rooted())),
+            self.keys[1:4])
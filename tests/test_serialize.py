@@ -0,0 +1,54 @@
+import io
+import pickle
+import unittest
+from pyavl3 import AVLTree, IndexedAVLTree, PersistentAVLTree
+from pyavl3.serialize import read_items, write_items
+
+
+class AVLTreeSerializeTest(unittest.TestCase):
+
+    def test_dump_load_round_trip(self):
+        a = AVLTree((i, str(i)) for i in range(1000))
+        fp = io.BytesIO()
+        a.dump(fp, chunk_size=64)
+        fp.seek(0)
+        b = AVLTree.load(fp)
+        self.assertListEqual(list(a.items()), list(b.items()))
+        self.assertEqual(b.root.height, a.root.height)
+
+    def test_dump_load_empty(self):
+        fp = io.BytesIO()
+        AVLTree().dump(fp)
+        fp.seek(0)
+        self.assertEqual(len(AVLTree.load(fp)), 0)
+
+    def test_load_keeps_class(self):
+        fp = io.BytesIO()
+        AVLTree(a=1, b=2).dump(fp)
+        fp.seek(0)
+        b = IndexedAVLTree.load(fp)
+        self.assertIsInstance(b, IndexedAVLTree)
+        self.assertEqual(b.select(1), 'b')
+
+    def test_stream_is_chunked(self):
+        fp = io.BytesIO()
+        self.assertEqual(write_items(fp, ((i, i) for i in range(10)), chunk_size=3), 10)
+        fp.seek(0)
+        self.assertListEqual(list(read_items(fp)), [(i, i) for i in range(10)])
+
+    def test_rejects_bad_streams(self):
+        with self.assertRaises(ValueError):
+            list(read_items(io.BytesIO(b"nope")))
+        fp = io.BytesIO()
+        AVLTree(a=1).dump(fp)
+        with self.assertRaises(EOFError):
+            list(read_items(io.BytesIO(fp.getvalue()[:-6])))
+
+    def test_pickle(self):
+        for cls in (AVLTree, IndexedAVLTree, PersistentAVLTree):
+            with self.subTest(cls=cls):
+                a = cls((i, [i]) for i in range(100))
+                b = pickle.loads(pickle.dumps(a))
+                self.assertIsInstance(b, cls)
+                self.assertListEqual(list(a.items()), list(b.items()))
+                self.assertEqual(len(b), 100)
@@ -0,0 +1,73 @@
+import random
+import unittest
+from pyavl3 import AVLTree, IndexedAVLTree
+from helpers import avl_height
+
+
+class AVLTreeSplitJoinTest(unittest.TestCase):
+
+    def check(self, tree, expected):
+        self.assertListEqual(list(tree.items()), sorted(expected.items()))
+        self.assertEqual(len(tree), len(expected))
+        avl_height(self, tree.root)
+
+    def test_join_uneven_heights(self):
+        for n_left, n_right in [(0, 0), (0, 5), (5, 0), (100, 3), (3, 100), (40, 40)]:
+            with self.subTest(left=n_left, right=n_right):
+                left = AVLTree((i, i) for i in range(n_left))
+                right = AVLTree((i, i) for i in range(1000, 1000 + n_right))
+                tree = AVLTree.join(left, 500, right, 'mid')
+                expected = {i: i for i in range(n_left)}
+                expected.update({i: i for i in range(1000, 1000 + n_right)})
+                expected[500] = 'mid'
+                self.check(tree, expected)
+                self.assertEqual(len(left), 0)
+                self.assertEqual(len(right), 0)
+
+    def test_join_rejects_overlap(self):
+        with self.assertRaises(ValueError):
+            AVLTree.join(AVLTree({5: 5}), 3, AVLTree())
+        with self.assertRaises(ValueError):
+            AVLTree.join(AVLTree(), 3, AVLTree({2: 2}))
+
+    def test_split(self):
+        data = {k: str(k) for k in random.Random(2).sample(range(500), 200)}
+        for key in [-1, 0, 250, min(data), max(data), 600] + list(data)[:20]:
+            with self.subTest(key=key):
+                tree = AVLTree(data)
+                lt, eq, gt = tree.split(key)
+                self.check(lt, {k: v for k, v in data.items() if k < key})
+                self.check(gt, {k: v for k, v in data.items() if k > key})
+                self.assertEqual(eq, (key, data[key]) if key in data else None)
+                self.assertEqual(len(tree), 0)
+
+    def test_split_results_stay_usable(self):
+        lt, _, gt = AVLTree((i, i) for i in range(100)).split(50)
+        lt[1000] = 'x'
+        del gt[99]
+        self.assertEqual(len(lt), 51)
+        self.assertEqual(len(gt), 48)
+
+    def test_indexed_split_keeps_sizes(self):
+        lt, _, gt = IndexedAVLTree((i, i) for i in range(100)).split(30)
+        self.assertEqual(len(lt), 30)
+        self.assertEqual(gt.select(0), 31)
+
+    def test_set_operations(self):
+        rng = random.Random(8)
+        for n, m in [(0, 10), (10, 0), (50, 50), (200, 20), (20, 200)]:
+            a = {k: 'a' for k in rng.sample(range(300), n)}
+            b = {k: 'b' for k in rng.sample(range(300), m)}
+            ta, tb = AVLTree(a), AVLTree(b)
+            with self.subTest(n=n, m=m):
+                union = dict(a)
+                union.update(b)
+                self.check(ta.union(tb), union)
+                self.check(ta.intersection(tb), {k: v for k, v in a.items() if k in b})
+                self.check(ta.difference(tb), {k: v for k, v in a.items() if k not in b})
+                sym = {k: v for k, v in a.items() if k not in b}
+                sym.update({k: v for k, v in b.items() if k not in a})
+                self.check(ta.symmetric_difference(tb), sym)
+                # Inputs are left untouched
+                self.check(ta, a)
+                self.check(tb, b)
@@ -0,0 +1,154 @@
+import pickle
+import random
+import unittest
+from pyavl3 import (
+    AVLMultiTree,
+    AVLTree,
+    IndexedAVLTree,
+    KeyedAVLTree,
+    LazyAVLTree,
+    PersistentAVLTree,
+)
+from pyavl3.avl_tree import MERGE
+
+
+class StatsTest(unittest.TestCase):
+
+    def test_disabled_by_default(self):
+        tree = AVLTree(a=1)
+        self.assertIs(type(tree), AVLTree)
+        self.assertIsNone(tree.stats())
+        tree.reset_stats()
+        tree.disable_stats()
+        self.assertIs(type(tree), AVLTree)
+
+    def test_counts(self):
+        tree = AVLTree()
+        tree.enable_stats()
+        for k in range(7):
+            tree[k] = k
+        stats = tree.stats()
+        self.assertEqual(stats["allocations"], 7)
+        # Ascending inserts into 0..6 rotate at 2, 3, 4 and 5.
+        self.assertEqual(stats["rotations"], {"single": 4, "double": 0})
+        self.assertEqual(sum(stats["depth"].values()), 7)
+        self.assertEqual(stats["latency"]["__setitem__"]["count"], 7)
+
+        tree.reset_stats()
+        self.assertEqual(tree[3], 3)
+        stats = tree.stats()
+        # The root holds 3, found on the first node with two comparisons.
+        self.assertEqual(stats["comparisons"], 2)
+        self.assertEqual(stats["depth"], {1: 1})
+        self.assertEqual(stats["rotations"], {"single": 0, "double": 0})
+
+    def test_rotations_of_every_tree(self):
+        for cls in (AVLTree, IndexedAVLTree, PersistentAVLTree, LazyAVLTree):
+            tree = cls()
+            tree.enable_stats()
+            for k in range(100):
+                tree[k] = k
+            self.assertEqual(tree.stats()["rotations"], {"single": 93, "double": 0}, cls)
+
+    def test_double_rotation(self):
+        tree = AVLTree()
+        tree.enable_stats()
+        for k in (3, 1, 2):
+            tree[k] = k
+        self.assertEqual(tree.stats()["rotations"], {"single": 0, "double": 1})
+
+    def test_bulk_load_allocations(self):
+        tree = AVLTree()
+        tree.enable_stats()
+        tree.update([(1, 1), (2, 2), (2, 3), (5, 5), (4, 4)])
+        self.assertEqual(tree.stats()["allocations"], 4)
+
+    def test_merge_allocations(self):
+        tree = AVLTree.fromkeys(range(10))
+        tree.enable_stats()
+        self.assertEqual(tree.update_many((k, k) for k in range(5, 20)), MERGE)
+        self.assertEqual(tree.stats()["allocations"], 10)
+        multi = AVLMultiTree((k, k) for k in range(10))
+        multi.enable_stats()
+        multi.update_many((k % 15, k) for k in range(30))
+        self.assertEqual(multi.stats()["allocations"], 5)
+
+    def test_neighbor_and_batch_lookups(self):
+        tree = AVLTree((k, k) for k in range(0, 100, 2))
+        tree.enable_stats()
+        for lookup in (tree.floor, tree.ceiling, tree.lower, tree.higher):
+            lookup(51)
+        stats = tree.stats()
+        self.assertEqual(sum(stats["depth"].values()), 4)
+        self.assertGreaterEqual(stats["comparisons"], 4 * 5)
+
+        tree.reset_stats()
+        self.assertEqual(tree.get_many([4, 5, 98]), [4, None, 98])
+        tree.floor_many([1, 51, 99])
+        self.assertEqual(sum(tree.stats()["depth"].values()), 6)
+        self.assertGreater(tree.stats()["comparisons"], 6)
+
+    def test_cursor_writes(self):
+        tree = AVLTree.fromkeys(range(10))
+        tree.enable_stats()
+        cursor = tree.cursor(4)
+        cursor.set_value("four")
+        cursor.delete()
+        stats = tree.stats()
+        self.assertNotIn(4, tree)
+        self.assertEqual(stats["latency"]["cursor.set_value"]["count"], 1)
+        self.assertEqual(stats["latency"]["cursor.delete"]["count"], 1)
+        self.assertGreater(stats["comparisons"], 0)
+
+    def test_results_unchanged(self):
+        rng = random.Random(18)
+        for cls in (AVLTree, IndexedAVLTree, PersistentAVLTree):
+            plain = cls()
+            counted = cls()
+            counted.enable_stats()
+            for _ in range(500):
+                k = rng.randrange(200)
+                if k in plain and rng.random() < 0.3:
+                    self.assertEqual(counted.pop(k), plain.pop(k))
+                else:
+                    plain[k] = counted[k] = k
+            self.assertEqual(list(counted.items()), list(plain.items()))
+            self.assertEqual(repr(counted), repr(plain))
+            self.assertIsInstance(counted, cls)
+
+    def test_copies_and_pickles(self):
+        tree = AVLTree.fromkeys(range(10))
+        tree.enable_stats()
+        copy = tree.copy()
+        self.assertEqual(copy.stats()["allocations"], 0)
+        restored = pickle.loads(pickle.dumps(tree))
+        self.assertIs(type(restored), AVLTree)
+        tree.disable_stats()
+        self.assertIs(type(tree), AVLTree)
+        self.assertIsNone(tree.stats())
+
+    def test_lazy_tree_tombstones(self):
+        tree = LazyAVLTree((k, k) for k in range(100))
+        tree.enable_stats()
+        del tree[5]
+        self.assertNotIn(5, tree)
+        self.assertIsNone(tree.get(5))
+        with self.assertRaises(KeyError):
+            tree[5]
+        with self.assertRaises(KeyError):
+            del tree[5]
+        self.assertEqual(len(tree), 99)
+        self.assertEqual(tree.floor(5), (4, 4))
+        tree[5] = "five"
+        self.assertEqual(tree[5], "five")
+        self.assertEqual(len(tree), 100)
+        self.assertGreater(tree.stats()["comparisons"], 0)
+
+    def test_subclass_overrides_kept(self):
+        tree = KeyedAVLTree(str.lower, [("B", 2), ("a", 1)])
+        tree.enable_stats()
+        self.assertEqual(tree["b"], 2)
+        self.assertEqual(list(tree.items()), [("a", 1), ("B", 2)])
+        self.assertEqual(tree.stats()["latency"]["__getitem__"]["count"], 1)
+        restored = pickle.loads(pickle.dumps(tree))
+        self.assertIs(type(restored), KeyedAVLTree)
@@ -0,0 +1,119 @@
+import random
+import unittest
+from pyavl3 import AVLTree, TypedAVLTree
+from pyavl3.typed_tree import np
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TypedAVLTreeTest(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(15)
+        self.data = {k: k * 10 for k in rng.sample(range(0, 20000, 2), 2000)}
+        self.tree = TypedAVLTree(self.data, value_dtype="int64")
+
+    def test_scalar_api(self):
+        self.assertEqual(len(self.tree), len(self.data))
+        k = next(iter(self.data))
+        self.assertEqual(self.tree[k], self.data[k])
+        self.tree[1] = 7
+        self.assertEqual(self.tree.pop(1), 7)
+        self.assertEqual(list(self.tree.items()), sorted(self.data.items()))
+        with self.assertRaises(TypeError):
+            self.tree[1.5] = 0
+
+    def test_arrays_are_sorted_and_cached(self):
+        keys = self.tree.keys_array()
+        self.assertEqual(keys.dtype, np.int64)
+        self.assertEqual(keys.tolist(), sorted(self.data))
+        self.assertEqual(self.tree.values_array().tolist(), [self.data[k] for k in sorted(self.data)])
+        self.assertIs(self.tree.keys_array(), keys)
+        self.assertFalse(keys.flags.writeable)
+        self.tree[-2] = 0
+        self.assertIsNot(self.tree.keys_array(), keys)
+        self.assertEqual(self.tree.keys_array()[0], -2)
+
+    def test_get_and_contains_many(self):
+        probes = np.arange(-5, 20005)
+        found = self.tree.contains_many(probes)
+        self.assertEqual(found.tolist(), [int(p) in self.data for p in probes])
+        values = self.tree.get_many(probes, default=-1)
+        self.assertEqual(values.tolist(), [self.data.get(int(p), -1) for p in probes])
+
+    def test_neighbors_match_avl_tree(self):
+        model = AVLTree(self.data)
+        probes = np.arange(-5, 20005, 7)
+        for name in ("floor", "ceiling", "lower", "higher"):
+            keys, values, found = getattr(self.tree, f"{name}_many")(probes)
+            expected = getattr(model, f"{name}_many")(probes.tolist())
+            for k, v, f, e in zip(keys.tolist(), values.tolist(), found.tolist(), expected):
+                if e is None:
+                    self.assertFalse(f)
+                else:
+                    self.assertTrue(f)
+                    self.assertEqual((k, v), e)
+
+    def test_count_range(self):
+        keys = sorted(self.data)
+        self.assertEqual(self.tree.count_range(100, 5000), sum(100 <= k < 5000 for k in keys))
+        self.assertEqual(self.tree.count_range(5000, 100), 0)
+        counts = self.tree.count_range(np.array([0, 10, 100]), np.array([10, 10, 20000]))
+        self.assertEqual(counts.tolist(), [sum(lo <= k < hi for k in keys) for lo, hi in [(0, 10), (10, 10), (100, 20000)]])
+
+    def test_from_arrays(self):
+        keys = np.array([5, 3, 5, 1], dtype=np.int32)
+        tree = TypedAVLTree.from_arrays(keys, np.array([1.0, 2.0, 3.0, 4.0]))
+        self.assertEqual(tree.dtype, np.int32)
+        self.assertEqual(list(tree.items()), [(1, 4.0), (3, 2.0), (5, 3.0)])
+        self.assertEqual(tree.values_array().dtype, np.float64)
+        with self.assertRaises(ValueError):
+            TypedAVLTree.from_arrays([1, 2], [1])
+
+    def test_non_native_byte_order(self):
+        keys = np.array([3, 1, 2], dtype=">i8")
+        values = np.array([30, 10, 20], dtype=">i4")
+        tree = TypedAVLTree.from_arrays(keys, values)
+        self.assertTrue(tree.dtype.isnative)
+        self.assertEqual(list(tree.items()), [(1, 10), (2, 20), (3, 30)])
+        self.assertEqual(tree.get_many(np.array([2, 5], dtype=">i8"), 0).tolist(), [20, 0])
+
+    def test_arrays_outlive_writes(self):
+        keys = self.tree.keys_array()
+        expected = keys.tolist()
+        for k in range(-20, 0):
+            self.tree[k] = k
+        self.assertEqual(keys.tolist(), expected)
+        self.assertEqual(len(self.tree.keys_array()), len(expected) + 20)
+
+    def test_object_values_and_copy(self):
+        tree = TypedAVLTree.from_arrays([3.5, 1.5], [["a"], ["b"]])
+        self.assertEqual(tree.values_array().tolist(), [["b"], ["a"]])
+        other = tree.copy()
+        del other[1.5]
+        self.assertEqual(len(tree), 2)
+        self.assertEqual(other.get_many([1.5, 3.5]).tolist(), [None, ["a"]])
+
+    def test_update_after_deleting_everything(self):
+        tree = TypedAVLTree({k: k for k in range(5)})
+        for k in range(5):
+            del tree[k]
+        tree.update({5: "a", 6: "b"})
+        self.assertEqual(list(tree.items()), [(5, "a"), (6, "b")])
+        self.assertEqual(len(tree), 2)
+        self.assertEqual(tree.keys_array().tolist(), [5, 6])
+
+    def test_empty(self):
+        tree = TypedAVLTree(dtype="float64")
+        self.assertEqual(len(tree.keys_array()), 0)
+        self.assertEqual(tree.contains_many([1.0]).tolist(), [False])
+        self.assertEqual(tree.count_range(0, 1), 0)
+        with self.assertRaises(TypeError):
+            TypedAVLTree(dtype=object)
+
+
+@unittest.skipUnless(np is None, "numpy is installed")
+class TypedAVLTreeWithoutNumpyTest(unittest.TestCase):
+
+    def test_requires_numpy(self):
+        with self.assertRaises(ImportError):
+            TypedAVLTree()
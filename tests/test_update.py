@@ -3,7 +3,10 @@ from pyavl3 import AVLTree
 
 
 class AVLTreeUpdateTest(unittest.TestCase):
+
+    tree_type = AVLTree
+
     def test_add_one(self):
-        a = AVLTree()
+        a = self.tree_type()
         a.update({1:'a'})
         self.assertEqual(len(a), 1)
@@ -0,0 +1,73 @@
+import random
+import unittest
+from pyavl3 import AVLTree, IndexedAVLTree
+from pyavl3.avl_tree import INSERT, MERGE
+from helpers import avl_height
+
+
+class AVLTreeUpdateManyTest(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = random.Random(5)
+        self.data = {k: k for k in self.rng.sample(range(1000), 300)}
+        self.tree = AVLTree(self.data)
+
+    def check(self, tree, expected):
+        self.assertEqual(len(tree), len(expected))
+        self.assertListEqual(list(tree.items()), sorted(expected.items()))
+        avl_height(self, tree.root)
+
+    def test_small_batch_inserts(self):
+        self.assertEqual(self.tree.update_many([(5000, 'x')]), INSERT)
+        self.data[5000] = 'x'
+        self.check(self.tree, self.data)
+
+    def test_large_batch_merges(self):
+        batch = [(self.rng.randrange(1200), 'n') for _ in range(200)]
+        batch.append((batch[0][0], 'last'))
+        self.assertEqual(self.tree.update_many(batch), MERGE)
+        self.data.update(batch)
+        self.check(self.tree, self.data)
+
+    def test_merge_reuses_nodes(self):
+        key = next(iter(self.data))
+        node = self.tree._get(self.tree.root, key)
+        self.tree.update_many({k: 'y' for k in range(1000)})
+        self.assertIs(self.tree._get(self.tree.root, key), node)
+        self.assertEqual(node.value, 'y')
+
+    def test_update_many_accepts_dict_tree_and_kwargs(self):
+        a = AVLTree()
+        self.assertEqual(a.update_many({'a': 1}, b=2), MERGE)
+        a.update_many(AVLTree(c=3))
+        self.assertListEqual(list(a.items()), [('a', 1), ('b', 2), ('c', 3)])
+
+    def test_empty_batch(self):
+        self.assertEqual(self.tree.update_many([]), INSERT)
+        self.check(self.tree, self.data)
+
+    def test_delete_many_small(self):
+        keys = list(self.data)[:3] + [-1]
+        self.assertEqual(self.tree.delete_many(keys), INSERT)
+        for k in keys[:3]:
+            del self.data[k]
+        self.check(self.tree, self.data)
+
+    def test_delete_many_large(self):
+        keys = [self.rng.randrange(1000) for _ in range(400)]
+        self.assertEqual(self.tree.delete_many(keys), MERGE)
+        for k in keys:
+            self.data.pop(k, None)
+        self.check(self.tree, self.data)
+
+    def test_delete_many_everything(self):
+        self.assertEqual(self.tree.delete_many(list(self.data)), MERGE)
+        self.check(self.tree, {})
+
+    def test_indexed_tree_sizes_after_merge(self):
+        a = IndexedAVLTree((i, i) for i in range(0, 100, 2))
+        a.update_many((i, i) for i in range(1, 100, 2))
+        self.assertEqual(a.root.size, 100)
+        self.assertEqual(a.select(51), 51)
+        a.delete_many(range(0, 100, 3))
+        self.assertEqual(a.root.size, len(a))